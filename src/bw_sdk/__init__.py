@@ -1,18 +1,63 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import dataclasses
-from typing import Annotated, TypeVar, Union
+import importlib
+import threading
+import types
+from typing import TYPE_CHECKING, Annotated, Any, AsyncIterator, Iterable, Iterator, TypeVar, Union
 from urllib.parse import urlunsplit
 
 import httpx
 import pydantic
 from pydantic import SecretStr as SecretStr
-from pydantic import TypeAdapter
 
 import bw_sdk.model as _m
+from bw_sdk._rwlock import RWLock
+from bw_sdk._stream import ListScanner
+from bw_sdk._util import LazyAdapter
+from bw_sdk._util import single as _single
+from bw_sdk._util import transient_errors
+from bw_sdk.bulk import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RETRIES,
+    BatchReport,
+    ItemResult,
+    Op,
+    OpResult,
+    aapply_batch,
+    afetch_items,
+    apply_batch,
+    fetch_items,
+)
+from bw_sdk.cache import CacheStats, ObjectCache
+from bw_sdk.compact import CompactAdapter, CompactItem
+from bw_sdk.flight import AsyncSingleFlight, FlightStats, SingleFlight
+from bw_sdk.instrument import CallEvent, Hook, MetricsAggregator, observe
+from bw_sdk.watch import (
+    ALL_KINDS,
+    DEFAULT_INTERVAL,
+    DEFAULT_MAX_INTERVAL,
+    AsyncWatcher,
+    ChangeEvent,
+    ObjectKind,
+    Watcher,
+)
 from bw_sdk.model import DBStatus, LinkTarget, Match
 
+if TYPE_CHECKING:
+    from bw_sdk.index import MetadataIndex
+    from bw_sdk.matcher import UriMatcher
+    from bw_sdk.parallel import ParallelParser
+    from bw_sdk.persist import SnapshotMeta, load_snapshot, save_snapshot, warm_start
+    from bw_sdk.pool import Backend, BackendPool
+    from bw_sdk.render import AsyncRenderer, Renderer, RenderReport, Source
+    from bw_sdk.resolve import AsyncResolver, Resolved, Resolver, SecretRef
+    from bw_sdk.serve import ServeManager, ServeProcess
+    from bw_sdk.session import AsyncSessionManager, SessionManager
+    from bw_sdk.snapshot import RefreshReport, VaultSnapshot
+
 T = TypeVar("T")
 
 
@@ -31,25 +76,75 @@ type ListRespT[T] = Annotated[
     pydantic.Field(discriminator="success"),
 ]
 
-StrResp = pydantic.TypeAdapter(RespT[_m.StrObj])
-
-UnlockResp = pydantic.TypeAdapter(RespT[_m.UnlockData])
-LockResp = pydantic.TypeAdapter(RespT[_m.MessageObj])
-SyncResp = pydantic.TypeAdapter(RespT[_m.MessageObj])
-StatusResp = pydantic.TypeAdapter(TmplRespT[_m.ServerStatus])
-
-OrgResp = pydantic.TypeAdapter(RespT[_m.Organization])
-OrgsResp = pydantic.TypeAdapter(ListRespT[_m.Organization])
-CollResp = pydantic.TypeAdapter(RespT[_m.Collection])
-CollsResp = pydantic.TypeAdapter(ListRespT[_m.Collection])
-FolderResp = pydantic.TypeAdapter(RespT[_m.Folder])
-FoldersResp = pydantic.TypeAdapter(ListRespT[_m.Folder])
-ItemResp = pydantic.TypeAdapter(RespT[_m.Item])
-ItemsResp = pydantic.TypeAdapter(ListRespT[_m.Item])
+StrResp: LazyAdapter[RespT[_m.StrObj]] = LazyAdapter(RespT[_m.StrObj])
+
+UnlockResp: LazyAdapter[RespT[_m.UnlockData]] = LazyAdapter(RespT[_m.UnlockData])
+LockResp: LazyAdapter[RespT[_m.MessageObj]] = LazyAdapter(RespT[_m.MessageObj])
+SyncResp: LazyAdapter[RespT[_m.MessageObj]] = LazyAdapter(RespT[_m.MessageObj])
+StatusResp: LazyAdapter[TmplRespT[_m.ServerStatus]] = LazyAdapter(TmplRespT[_m.ServerStatus])
+
+OrgResp: LazyAdapter[RespT[_m.Organization]] = LazyAdapter(RespT[_m.Organization])
+OrgsResp: LazyAdapter[ListRespT[_m.Organization]] = LazyAdapter(ListRespT[_m.Organization])
+CollResp: LazyAdapter[RespT[_m.Collection]] = LazyAdapter(RespT[_m.Collection])
+CollsResp: LazyAdapter[ListRespT[_m.Collection]] = LazyAdapter(ListRespT[_m.Collection])
+FolderResp: LazyAdapter[RespT[_m.Folder]] = LazyAdapter(RespT[_m.Folder])
+FoldersResp: LazyAdapter[ListRespT[_m.Folder]] = LazyAdapter(ListRespT[_m.Folder])
+ItemResp: LazyAdapter[RespT[_m.Item]] = LazyAdapter(RespT[_m.Item])
+ItemsResp: LazyAdapter[ListRespT[_m.Item]] = LazyAdapter(ListRespT[_m.Item])
+ItemSummariesResp: LazyAdapter[ListRespT[_m.ItemSummary]] = LazyAdapter(ListRespT[_m.ItemSummary])
+RawListResp: LazyAdapter[ListRespT[dict[str, Any]]] = LazyAdapter(ListRespT[dict[str, Any]])
+
+ItemAdapter: LazyAdapter[_m.Item] = LazyAdapter(_m.Item)
+FolderAdapter: LazyAdapter[_m.Folder] = LazyAdapter(_m.Folder)
+CollAdapter: LazyAdapter[_m.Collection] = LazyAdapter(_m.Collection)
+ItemSummaryAdapter: LazyAdapter[_m.ItemSummary] = LazyAdapter(_m.ItemSummary)
+SpecificItemsAdapter: dict[type[_m.ItemTemplate], LazyAdapter[list[Any]]] = {
+    typ: LazyAdapter(types.GenericAlias(list, (typ,))) for typ in _m.ITEM_TYPES
+}
 
 NewItem = _m.NewItemLogin | _m.NewItemSecureNote
 
 BaseObjT = TypeVar("BaseObjT", bound=_m.BaseObj)
+ElemT = TypeVar("ElemT", bound=_m.BaseObj | CompactItem)
+
+
+def _dump_params(params: _m.Query | None):
+    return None if params is None else params.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+def _dump_payload(payload: _m.Payload | _m.BaseObj | None):
+    return None if payload is None else payload.model_dump(mode="json", by_alias=True)
+
+
+def _flight_key(validator: LazyAdapter[Any], path: str, params: _m.Query | None):
+    dumped = _dump_params(params)
+    return (validator, path, None if dumped is None else tuple(sorted(dumped.items())))
+
+
+def _raise_transient(res: httpx.Response):
+    if transient_errors.get() and (res.status_code == 429 or res.status_code >= 500):
+        res.raise_for_status()
+
+
+def _unwrap(resp: _m.ValidResponse[T] | _m.ErrorResponse) -> T:
+    if isinstance(resp, _m.ErrorResponse):
+        raise Exception(f"Could not get obj [{resp.message}]")
+    return resp.data
+
+
+def _filter_specific(
+    records: list[dict[str, Any]], params: _m.ItemQuery, exact: bool, typ: type[_m.ItemT]
+) -> list[_m.ItemT]:
+    tag = _m.ITEM_TYPES[typ]
+    wanted = [x for x in records if x.get("type") == tag and (not exact or x.get("name") == params.search)]
+    return SpecificItemsAdapter[typ].validate_python(wanted)
+
+
+def _filter_exact(result: list[BaseObjT], params: _m.SearchQuery | None, exact: bool) -> list[BaseObjT]:
+    search = None if params is None else params.search
+    if exact:
+        return [x for x in result if x.name == search]
+    return result
 
 
 @dataclasses.dataclass
@@ -57,6 +152,11 @@ class Client:
     http_client: httpx.Client = dataclasses.field(
         default_factory=lambda: httpx.Client(base_url="http://localhost:8087")
     )
+    cache: ObjectCache | None = None
+    hooks: list[Hook] = dataclasses.field(default_factory=list)
+    single_flight: SingleFlight | None = None
+    parallel: ParallelParser | None = None
+    state_lock: RWLock = dataclasses.field(default_factory=RWLock, compare=False, repr=False)
 
     @contextlib.contextmanager
     def session(self, password: SecretStr | None, sync: bool = True):
@@ -75,76 +175,88 @@ class Client:
 
     def _put(
         self,
-        validator: TypeAdapter[RespT[T]],
+        validator: LazyAdapter[RespT[T]],
         path: str,
         params: _m.Query | None,
         payload: _m.Payload | _m.BaseObj | None,
     ):
-        _params = None if params is None else params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        _payload = None if payload is None else payload.model_dump(mode="json", by_alias=True)
-
-        res = self.http_client.put(path, params=_params, json=_payload)
-
-        resp = validator.validate_json(res.content)
-
-        if isinstance(resp, _m.ErrorResponse):
-            raise Exception(f"Could not get obj [{resp.message}]")
-
-        return resp.data
+        with self.state_lock.read(), observe(self.hooks, "PUT", path) as call:
+            res = self.http_client.put(path, params=_dump_params(params), json=_dump_payload(payload))
+            call.response(res)
+            _raise_transient(res)
+            return _unwrap(call.validate(validator, res.content))
 
     def _post(self, path: str, params: _m.Query | None, payload: _m.Payload | _m.BaseObj | None):
-        _params = None if params is None else params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        _payload = None if payload is None else payload.model_dump(mode="json", by_alias=True)
-
-        res = self.http_client.post(path, params=_params, json=_payload)
-        return res
+        with self.state_lock.read(), observe(self.hooks, "POST", path) as call:
+            res = self.http_client.post(path, params=_dump_params(params), json=_dump_payload(payload))
+            call.response(res)
+            return res
 
     def _post_object(
         self,
-        validator: TypeAdapter[RespT[T]],
+        validator: LazyAdapter[RespT[T]],
         path: str,
         params: _m.Query | None,
         payload: _m.Payload | _m.BaseObj | None,
     ):
-        res = self._post(path, params, payload)
-
-        resp = validator.validate_json(res.content)
-
-        if isinstance(resp, _m.ErrorResponse):
-            raise Exception(f"Could not get obj [{resp.message}]")
-
-        return resp.data
+        with self.state_lock.read(), observe(self.hooks, "POST", path) as call:
+            res = self.http_client.post(path, params=_dump_params(params), json=_dump_payload(payload))
+            call.response(res)
+            _raise_transient(res)
+            return _unwrap(call.validate(validator, res.content))
 
     def _delete(self, path: str, params: _m.Query | None):
-        _params = None if params is None else params.model_dump(mode="json", by_alias=True, exclude_none=True)
-        res = self.http_client.delete(path, params=_params)
-        res.raise_for_status()
-
-    def _get(self, validator: TypeAdapter[RespT[T]], path: str, params: _m.Query | None):
-        _params = None if params is None else params.model_dump(mode="json", by_alias=True, exclude_none=True)
-
-        res = self.http_client.get(path, params=_params)
-        resp = validator.validate_json(res.content)
-
-        if isinstance(resp, _m.ErrorResponse):
-            raise Exception(f"Could not get obj [{resp.message}]")
-
-        return resp.data
+        with self.state_lock.read(), observe(self.hooks, "DELETE", path) as call:
+            res = self.http_client.delete(path, params=_dump_params(params))
+            call.response(res)
+            res.raise_for_status()
+
+    def _get(self, validator: LazyAdapter[RespT[T]], path: str, params: _m.Query | None) -> T:
+        if self.single_flight is None:
+            return self._fetch(validator, path, params)
+        key = _flight_key(validator, path, params)
+        with self.state_lock.read():
+            return self.single_flight.do(key, lambda: self._fetch(validator, path, params))
+
+    def _fetch(self, validator: LazyAdapter[RespT[T]], path: str, params: _m.Query | None) -> T:
+        with self.state_lock.read(), observe(self.hooks, "GET", path) as call:
+            res = self.http_client.get(path, params=_dump_params(params))
+            call.response(res)
+            _raise_transient(res)
+            return _unwrap(call.validate(validator, res.content))
 
     def _get_str(self, path: str, params: _m.Query | None) -> str:
         return self._get(StrResp, path, params).data
 
     def _get_object(
-        self, validator: TypeAdapter[RespT[BaseObjT]], obj_type: str, obj_id: str, params: _m.Query | None
+        self, validator: LazyAdapter[RespT[BaseObjT]], obj_type: str, obj_id: str, params: _m.Query | None
     ) -> BaseObjT:
-        return self._get(validator, f"/object/{obj_type}/{obj_id}", params)
+        if self.cache is None or params is not None:
+            return self._get(validator, f"/object/{obj_type}/{obj_id}", params)
+        cached = self.cache.get(obj_type, obj_id)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation(obj_type, obj_id)
+        obj = self._get(validator, f"/object/{obj_type}/{obj_id}", params)
+        self.cache.put(obj_type, obj_id, obj, generation)
+        return obj
 
-    def _get_tmpl(self, validator: TypeAdapter[TmplRespT[T]], path: str, params: _m.Query | None) -> T:
+    def _invalidate(self, obj_type: str | None = None, obj_id: str | None = None):
+        if self.cache is None:
+            return
+        if obj_type is None:
+            self.cache.clear()
+        elif obj_id is None:
+            self.cache.invalidate_type(obj_type)
+        else:
+            self.cache.invalidate(obj_type, obj_id)
+
+    def _get_tmpl(self, validator: LazyAdapter[TmplRespT[T]], path: str, params: _m.Query | None) -> T:
         return self._get(validator, path, params).template
 
     def _get_list(
         self,
-        validator: TypeAdapter[ListRespT[T]],
+        validator: LazyAdapter[ListRespT[T]],
         path: str,
         params: _m.Query | None,
     ) -> list[T]:
@@ -152,34 +264,71 @@ class Client:
 
     def _get_object_list(
         self,
-        validator: TypeAdapter[ListRespT[BaseObjT]],
+        validator: LazyAdapter[ListRespT[BaseObjT]],
         obj_type: str,
         params: _m.SearchQuery | None,
         exact: bool,
     ) -> list[BaseObjT]:
-        search = None if params is None else params.search
+        if self.parallel is not None:
+            validator = self.parallel.adapter(validator)
+        result = self._get_list(validator, f"/list/object/{obj_type}", params)
+        return _filter_exact(result, params, exact)
 
-        path = f"/list/object/{obj_type}"
+    def _get_raw_items(self, params: _m.ItemQuery | None) -> list[dict[str, Any]]:
+        return self._get_raw_list("items", params)
 
-        result = self._get_list(validator, path, params)
+    def _get_raw_list(self, obj_type: str, params: _m.Query | None) -> list[dict[str, Any]]:
+        return self._get_list(RawListResp, f"/list/object/{obj_type}", params)
 
-        if exact:
-            return [x for x in result if x.name == search]
-        return result
+    def _iter_object_list(
+        self,
+        validator: LazyAdapter[ListRespT[Any]],
+        elem_validator: LazyAdapter[ElemT],
+        obj_type: str,
+        params: _m.SearchQuery | None,
+        exact: bool,
+    ) -> Iterator[ElemT]:
+        search = None if params is None else params.search
+        scanner = ListScanner()
+        path = f"/list/object/{obj_type}"
+        with observe(self.hooks, "GET", path) as call, contextlib.ExitStack() as stack:
+            with self.state_lock.read():
+                res = stack.enter_context(self.http_client.stream("GET", path, params=_dump_params(params)))
+            call.opened(res)
+            for chunk in res.iter_bytes():
+                for raw in scanner.feed(call.received(chunk)):
+                    obj = call.element(elem_validator, raw)
+                    if not exact or obj.name == search:
+                        yield obj
+            call.streamed()
+            if not scanner.found:
+                _unwrap(call.validate(validator, scanner.body))
 
     # endregion
 
     # region Misc
 
+    @contextlib.contextmanager
+    def exclusive(self):
+        with self.state_lock.write():
+            yield self
+
     def unlock(self, password: SecretStr):
         payload = _m.UnlockPayload(password=password)
-        return self._post_object(UnlockResp, "/unlock", params=None, payload=payload)
+        with self.state_lock.write():
+            return self._post_object(UnlockResp, "/unlock", params=None, payload=payload)
 
     def lock(self):
-        return self._post_object(LockResp, "/lock", params=None, payload=None)
+        with self.state_lock.write():
+            res = self._post_object(LockResp, "/lock", params=None, payload=None)
+            self._invalidate()
+            return res
 
     def sync(self):
-        return self._post_object(SyncResp, "/sync", params=None, payload=None)
+        with self.state_lock.write():
+            res = self._post_object(SyncResp, "/sync", params=None, payload=None)
+            self._invalidate()
+            return res
 
     def get_status(self):
         return self._get_tmpl(StatusResp, "/status", None)
@@ -191,26 +340,29 @@ class Client:
 
     # region Items
 
-    def get_item(self, item: _m.Item | _m.ItemID):
+    def get_item(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
         obj_id = item if isinstance(item, str) else item.id
         return self._get_object(ItemResp, "item", obj_id, None)
 
-    def _get_specific_item(self, item: _m.Item | _m.ItemID, typ: type[_m.ItemT]) -> _m.ItemT:
+    def _get_specific_item(self, item: _m.Item | _m.ItemSummary | _m.ItemID, typ: type[_m.ItemT]) -> _m.ItemT:
         obj = self.get_item(item)
         if not isinstance(obj, typ):
             raise Exception("invalid item type")
         return obj
 
-    def get_item_login(self, item: _m.Item | _m.ItemID):
+    def get_items_by_id(self, ids: Iterable[_m.ItemID], max_concurrency: int = DEFAULT_CONCURRENCY):
+        return fetch_items(self, ids, max_concurrency)
+
+    def get_item_login(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
         return self._get_specific_item(item, _m.ItemLogin)
 
-    def get_item_card(self, item: _m.Item | _m.ItemID):
+    def get_item_card(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
         return self._get_specific_item(item, _m.ItemCard)
 
-    def get_item_securenote(self, item: _m.Item | _m.ItemID):
+    def get_item_securenote(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
         return self._get_specific_item(item, _m.ItemSecureNote)
 
-    def get_item_identity(self, item: _m.Item | _m.ItemID):
+    def get_item_identity(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
         return self._get_specific_item(item, _m.ItemIdentity)
 
     def get_items(
@@ -234,6 +386,102 @@ class Client:
 
         return self._get_object_list(ItemsResp, "items", params, exact)
 
+    def iter_items(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        return self._iter_object_list(ItemsResp, ItemAdapter, "items", params, exact)
+
+    def get_item_summaries(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        return self._get_object_list(ItemSummariesResp, "items", params, exact)
+
+    def iter_item_summaries(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        return self._iter_object_list(ItemSummariesResp, ItemSummaryAdapter, "items", params, exact)
+
+    def get_items_compact(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ) -> list[CompactItem]:
+        return list(self.iter_items_compact(search, org_id, coll_id, folder_id, url, trash, exact))
+
+    def iter_items_compact(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        return self._iter_object_list(ItemSummariesResp, CompactAdapter(), "items", params, exact)
+
     def _get_specific_items(
         self,
         search: str | None,
@@ -245,8 +493,17 @@ class Client:
         exact: bool,
         typ: type[_m.ItemT],
     ) -> list[_m.ItemT]:
-        objs = self.get_items(search, org_id, coll_id, folder_id, url, trash, exact)
-        return [obj for obj in objs if isinstance(obj, typ)]
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        records = self._get_raw_items(params)
+        return _filter_specific(records, params, exact, typ)
 
     def get_item_logins(
         self,
@@ -307,13 +564,7 @@ class Client:
         exact: bool = False,
     ):
         res = self.get_items(search, org_id, coll_id, folder_id, url, trash, exact)
-        match len(res):
-            case 0:
-                raise Exception("no item found")
-            case 1:
-                return res[0]
-            case _:
-                raise Exception("multiple items matches")
+        return _single(res, "item")
 
     def _find_specific_item(
         self,
@@ -327,13 +578,7 @@ class Client:
         typ: type[_m.ItemT],
     ) -> _m.ItemT:
         res = self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, typ)
-        match len(res):
-            case 0:
-                raise Exception("no item found")
-            case 1:
-                return res[0]
-            case _:
-                raise Exception("multiple items matches")
+        return _single(res, "item")
 
     def find_item_login(
         self,
@@ -384,7 +629,9 @@ class Client:
         return self._find_specific_item(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemSecureNote)
 
     def put_item(self, item: _m.ItemT):
-        return self._put(ItemResp, f"/object/item/{item.id}", params=None, payload=item)
+        res = self._put(ItemResp, f"/object/item/{item.id}", params=None, payload=item)
+        self._invalidate("item", item.id)
+        return res
 
     def post_item(self, item: NewItem):
         return self._post_object(ItemResp, "/object/item", params=None, payload=item)
@@ -392,11 +639,50 @@ class Client:
     def del_item(self, item: _m.Item | _m.ItemID):
         obj_id = item if isinstance(item, str) else item.id
         self._delete(f"/object/item/{obj_id}", params=None)
+        self._invalidate("item", obj_id)
 
     def restore_item(self, item: _m.Item | _m.ItemID):
         obj_id = item if isinstance(item, str) else item.id
         res = self._post(f"/restore/item/{obj_id}", params=None, payload=None)
         res.raise_for_status()
+        self._invalidate("item", obj_id)
+
+    # endregion
+
+    # region Batch
+
+    def apply_batch(
+        self, ops: Iterable[Op], max_concurrency: int = DEFAULT_CONCURRENCY, retries: int = DEFAULT_RETRIES
+    ):
+        return apply_batch(self, ops, max_concurrency, retries)
+
+    # endregion
+
+    # region Watch
+
+    def watch(
+        self,
+        stop: threading.Event | None = None,
+        interval: float = DEFAULT_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        kinds: Iterable[ObjectKind] = ALL_KINDS,
+        sync: bool = True,
+    ) -> Iterator[ChangeEvent]:
+        return Watcher(self, interval, max_interval, kinds=kinds, sync=sync).watch(stop)
+
+    # endregion
+
+    # region Secrets
+
+    def resolve_secrets(self, refs: Iterable[str | SecretRef]) -> dict[str, SecretStr]:
+        from bw_sdk.resolve import Resolver
+
+        return Resolver(self).resolve(refs).unwrap()
+
+    def render_template(self, src: Source, dst: Source, strict: bool = True) -> RenderReport:
+        from bw_sdk.render import Renderer
+
+        return Renderer(self, strict=strict).render(src, dst)
 
     # endregion
 
@@ -411,18 +697,18 @@ class Client:
 
         return self._get_object_list(FoldersResp, "folders", params, exact)
 
+    def iter_folders(self, search: str | None = None, exact: bool = False):
+        params = _m.FoldersQuery(search=search)
+        return self._iter_object_list(FoldersResp, FolderAdapter, "folders", params, exact)
+
     def find_folder(self, search: str | None = None, exact: bool = False):
         res = self.get_folders(search, exact)
-        match len(res):
-            case 0:
-                raise Exception("no folder found")
-            case 1:
-                return res[0]
-            case _:
-                raise Exception("multiple folders matches")
+        return _single(res, "folder")
 
     def put_folder(self, obj: _m.Folder):
-        return self._put(FolderResp, f"/object/folder/{obj.id}", params=None, payload=obj)
+        res = self._put(FolderResp, f"/object/folder/{obj.id}", params=None, payload=obj)
+        self._invalidate("folder", obj.id)
+        return res
 
     def post_folder(self, obj: _m.NewFolder):
         return self._post_object(FolderResp, "/object/folder", params=None, payload=obj)
@@ -430,6 +716,8 @@ class Client:
     def del_folder(self, obj: _m.Folder | _m.FolderID):
         obj_id = obj if isinstance(obj, str) else obj.id
         self._delete(f"/object/folder/{obj_id}", params=None)
+        self._invalidate("folder", obj_id)
+        self._invalidate("item")
 
     # endregion
 
@@ -449,13 +737,7 @@ class Client:
         exact: bool = False,
     ):
         res = self.get_organizations(search, exact)
-        match len(res):
-            case 0:
-                raise Exception("no organization found")
-            case 1:
-                return res[0]
-            case _:
-                raise Exception("multiple organizations matches")
+        return _single(res, "organization")
 
     # endregion
 
@@ -470,6 +752,11 @@ class Client:
         endpoint = "collections" if params.org_id is None else "org-collections"
         return self._get_object_list(CollsResp, endpoint, params, exact)
 
+    def iter_collections(self, search: str | None = None, org_id: _m.OrgID | None = None, exact: bool = False):
+        params = _m.CollectionsQuery(search=search, org_id=org_id)
+        endpoint = "collections" if params.org_id is None else "org-collections"
+        return self._iter_object_list(CollsResp, CollAdapter, endpoint, params, exact)
+
     def find_collection(
         self,
         search: str | None = None,
@@ -477,13 +764,7 @@ class Client:
         exact: bool = False,
     ):
         res = self.get_collections(search, org_id, exact)
-        match len(res):
-            case 0:
-                raise Exception("no collection found")
-            case 1:
-                return res[0]
-            case _:
-                raise Exception("multiple collections matches")
+        return _single(res, "collection")
 
     def post_collection(self, obj: _m.NewCollection):
         params = _m.OrgCollectionQuery(org_id=obj.org_id)
@@ -491,18 +772,743 @@ class Client:
 
     def put_collection(self, obj: _m.Collection):
         params = _m.OrgCollectionQuery(org_id=obj.org_id)
-        return self._put(CollResp, f"/object/org-collection/{obj.id}", params=params, payload=obj)
+        res = self._put(CollResp, f"/object/org-collection/{obj.id}", params=params, payload=obj)
+        self._invalidate("collection", obj.id)
+        return res
 
     def del_collection(self, obj: _m.Collection):
         params = _m.OrgCollectionQuery(org_id=obj.org_id)
         self._delete(f"/object/org-collection/{obj.id}", params=params)
+        self._invalidate("collection", obj.id)
+        self._invalidate("item")
 
     # endregion
 
 
-def NewClient(scheme: str = "http", host: str = "localhost", port: int = 8087, path: str = ""):
-    base_url = urlunsplit((scheme, f"{host}:{port}", path, "", ""))
-    return Client(http_client=httpx.Client(base_url=base_url))
+@dataclasses.dataclass
+class AsyncClient:
+    http_client: httpx.AsyncClient = dataclasses.field(
+        default_factory=lambda: httpx.AsyncClient(base_url="http://localhost:8087")
+    )
+    cache: ObjectCache | None = None
+    hooks: list[Hook] = dataclasses.field(default_factory=list)
+    single_flight: AsyncSingleFlight | None = None
+    parallel: ParallelParser | None = None
+
+    @contextlib.asynccontextmanager
+    async def session(self, password: SecretStr | None, sync: bool = True):
+        org_status = await self.get_status()
+        if org_status.status == DBStatus.Locked:
+            if password is None:
+                raise Exception("locked bw and no password")
+            await self.unlock(password)
+        if sync:
+            await self.sync()
+        yield self
+        if org_status.status == DBStatus.Locked:
+            await self.lock()
+
+    # region Internal
+
+    async def _put(
+        self,
+        validator: LazyAdapter[RespT[T]],
+        path: str,
+        params: _m.Query | None,
+        payload: _m.Payload | _m.BaseObj | None,
+    ):
+        with observe(self.hooks, "PUT", path) as call:
+            res = await self.http_client.put(path, params=_dump_params(params), json=_dump_payload(payload))
+            call.response(res)
+            _raise_transient(res)
+            return _unwrap(call.validate(validator, res.content))
+
+    async def _post(self, path: str, params: _m.Query | None, payload: _m.Payload | _m.BaseObj | None):
+        with observe(self.hooks, "POST", path) as call:
+            res = await self.http_client.post(path, params=_dump_params(params), json=_dump_payload(payload))
+            call.response(res)
+            return res
+
+    async def _post_object(
+        self,
+        validator: LazyAdapter[RespT[T]],
+        path: str,
+        params: _m.Query | None,
+        payload: _m.Payload | _m.BaseObj | None,
+    ):
+        with observe(self.hooks, "POST", path) as call:
+            res = await self.http_client.post(path, params=_dump_params(params), json=_dump_payload(payload))
+            call.response(res)
+            _raise_transient(res)
+            return _unwrap(call.validate(validator, res.content))
+
+    async def _delete(self, path: str, params: _m.Query | None):
+        with observe(self.hooks, "DELETE", path) as call:
+            res = await self.http_client.delete(path, params=_dump_params(params))
+            call.response(res)
+            res.raise_for_status()
+
+    async def _get(self, validator: LazyAdapter[RespT[T]], path: str, params: _m.Query | None) -> T:
+        if self.single_flight is None:
+            return await self._fetch(validator, path, params)
+        key = _flight_key(validator, path, params)
+        return await self.single_flight.do(key, lambda: self._fetch(validator, path, params))
+
+    async def _fetch(self, validator: LazyAdapter[RespT[T]], path: str, params: _m.Query | None) -> T:
+        with observe(self.hooks, "GET", path) as call:
+            res = await self.http_client.get(path, params=_dump_params(params))
+            call.response(res)
+            _raise_transient(res)
+            return _unwrap(call.validate(validator, res.content))
+
+    async def _get_str(self, path: str, params: _m.Query | None) -> str:
+        return (await self._get(StrResp, path, params)).data
+
+    async def _get_object(
+        self, validator: LazyAdapter[RespT[BaseObjT]], obj_type: str, obj_id: str, params: _m.Query | None
+    ) -> BaseObjT:
+        if self.cache is None or params is not None:
+            return await self._get(validator, f"/object/{obj_type}/{obj_id}", params)
+        cached = self.cache.get(obj_type, obj_id)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation(obj_type, obj_id)
+        obj = await self._get(validator, f"/object/{obj_type}/{obj_id}", params)
+        self.cache.put(obj_type, obj_id, obj, generation)
+        return obj
+
+    def _invalidate(self, obj_type: str | None = None, obj_id: str | None = None):
+        if self.cache is None:
+            return
+        if obj_type is None:
+            self.cache.clear()
+        elif obj_id is None:
+            self.cache.invalidate_type(obj_type)
+        else:
+            self.cache.invalidate(obj_type, obj_id)
+
+    async def _get_tmpl(self, validator: LazyAdapter[TmplRespT[T]], path: str, params: _m.Query | None) -> T:
+        return (await self._get(validator, path, params)).template
+
+    async def _get_list(
+        self,
+        validator: LazyAdapter[ListRespT[T]],
+        path: str,
+        params: _m.Query | None,
+    ) -> list[T]:
+        return (await self._get(validator, path, params)).data
+
+    async def _get_object_list(
+        self,
+        validator: LazyAdapter[ListRespT[BaseObjT]],
+        obj_type: str,
+        params: _m.SearchQuery | None,
+        exact: bool,
+    ) -> list[BaseObjT]:
+        if self.parallel is not None:
+            validator = self.parallel.adapter(validator)
+        result = await self._get_list(validator, f"/list/object/{obj_type}", params)
+        return _filter_exact(result, params, exact)
+
+    async def _get_raw_items(self, params: _m.ItemQuery | None) -> list[dict[str, Any]]:
+        return await self._get_raw_list("items", params)
+
+    async def _get_raw_list(self, obj_type: str, params: _m.Query | None) -> list[dict[str, Any]]:
+        return await self._get_list(RawListResp, f"/list/object/{obj_type}", params)
+
+    async def _iter_object_list(
+        self,
+        validator: LazyAdapter[ListRespT[Any]],
+        elem_validator: LazyAdapter[ElemT],
+        obj_type: str,
+        params: _m.SearchQuery | None,
+        exact: bool,
+    ) -> AsyncIterator[ElemT]:
+        search = None if params is None else params.search
+        scanner = ListScanner()
+        path = f"/list/object/{obj_type}"
+        with observe(self.hooks, "GET", path) as call:
+            async with self.http_client.stream("GET", path, params=_dump_params(params)) as res:
+                call.opened(res)
+                async for chunk in res.aiter_bytes():
+                    for raw in scanner.feed(call.received(chunk)):
+                        obj = call.element(elem_validator, raw)
+                        if not exact or obj.name == search:
+                            yield obj
+                call.streamed()
+            if not scanner.found:
+                _unwrap(call.validate(validator, scanner.body))
+
+    # endregion
+
+    # region Misc
+
+    async def unlock(self, password: SecretStr):
+        payload = _m.UnlockPayload(password=password)
+        return await self._post_object(UnlockResp, "/unlock", params=None, payload=payload)
+
+    async def lock(self):
+        res = await self._post_object(LockResp, "/lock", params=None, payload=None)
+        self._invalidate()
+        return res
+
+    async def sync(self):
+        res = await self._post_object(SyncResp, "/sync", params=None, payload=None)
+        self._invalidate()
+        return res
+
+    async def get_status(self):
+        return await self._get_tmpl(StatusResp, "/status", None)
+
+    async def get_fingerprint(self):
+        return await self._get_str("/object/fingerprint/me", None)
+
+    # endregion
+
+    # region Items
+
+    async def get_item(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
+        obj_id = item if isinstance(item, str) else item.id
+        return await self._get_object(ItemResp, "item", obj_id, None)
+
+    async def _get_specific_item(self, item: _m.Item | _m.ItemSummary | _m.ItemID, typ: type[_m.ItemT]) -> _m.ItemT:
+        obj = await self.get_item(item)
+        if not isinstance(obj, typ):
+            raise Exception("invalid item type")
+        return obj
+
+    async def get_items_by_id(self, ids: Iterable[_m.ItemID], max_concurrency: int = DEFAULT_CONCURRENCY):
+        return await afetch_items(self, ids, max_concurrency)
+
+    async def get_item_login(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
+        return await self._get_specific_item(item, _m.ItemLogin)
+
+    async def get_item_card(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
+        return await self._get_specific_item(item, _m.ItemCard)
+
+    async def get_item_securenote(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
+        return await self._get_specific_item(item, _m.ItemSecureNote)
+
+    async def get_item_identity(self, item: _m.Item | _m.ItemSummary | _m.ItemID):
+        return await self._get_specific_item(item, _m.ItemIdentity)
+
+    async def get_items(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
 
+        return await self._get_object_list(ItemsResp, "items", params, exact)
 
-__all__ = ["DBStatus", "Client", "LinkTarget", "Match"]
+    def iter_items(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        return self._iter_object_list(ItemsResp, ItemAdapter, "items", params, exact)
+
+    async def get_item_summaries(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        return await self._get_object_list(ItemSummariesResp, "items", params, exact)
+
+    def iter_item_summaries(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        return self._iter_object_list(ItemSummariesResp, ItemSummaryAdapter, "items", params, exact)
+
+    async def get_items_compact(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ) -> list[CompactItem]:
+        return [x async for x in self.iter_items_compact(search, org_id, coll_id, folder_id, url, trash, exact)]
+
+    def iter_items_compact(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        return self._iter_object_list(ItemSummariesResp, CompactAdapter(), "items", params, exact)
+
+    async def _get_specific_items(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+        typ: type[_m.ItemT],
+    ) -> list[_m.ItemT]:
+        params = _m.ItemQuery(
+            search=search,
+            coll_id=coll_id,
+            org_id=org_id,
+            folder_id=folder_id,
+            url=url,
+            trash=trash,
+        )
+
+        records = await self._get_raw_items(params)
+        return _filter_specific(records, params, exact, typ)
+
+    async def get_item_logins(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return await self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemLogin)
+
+    async def get_item_cards(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return await self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemCard)
+
+    async def get_item_identities(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return await self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemIdentity)
+
+    async def get_item_securenotes(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return await self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemSecureNote)
+
+    async def find_item(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        res = await self.get_items(search, org_id, coll_id, folder_id, url, trash, exact)
+        return _single(res, "item")
+
+    async def _find_specific_item(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+        typ: type[_m.ItemT],
+    ) -> _m.ItemT:
+        res = await self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, typ)
+        return _single(res, "item")
+
+    async def find_item_login(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+    ):
+        return await self._find_specific_item(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemLogin)
+
+    async def find_item_card(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+    ):
+        return await self._find_specific_item(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemCard)
+
+    async def find_item_identity(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+    ):
+        return await self._find_specific_item(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemIdentity)
+
+    async def find_item_securenote(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+    ):
+        return await self._find_specific_item(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemSecureNote)
+
+    async def put_item(self, item: _m.ItemT):
+        res = await self._put(ItemResp, f"/object/item/{item.id}", params=None, payload=item)
+        self._invalidate("item", item.id)
+        return res
+
+    async def post_item(self, item: NewItem):
+        return await self._post_object(ItemResp, "/object/item", params=None, payload=item)
+
+    async def del_item(self, item: _m.Item | _m.ItemID):
+        obj_id = item if isinstance(item, str) else item.id
+        await self._delete(f"/object/item/{obj_id}", params=None)
+        self._invalidate("item", obj_id)
+
+    async def restore_item(self, item: _m.Item | _m.ItemID):
+        obj_id = item if isinstance(item, str) else item.id
+        res = await self._post(f"/restore/item/{obj_id}", params=None, payload=None)
+        res.raise_for_status()
+        self._invalidate("item", obj_id)
+
+    # endregion
+
+    # region Batch
+
+    async def apply_batch(
+        self, ops: Iterable[Op], max_concurrency: int = DEFAULT_CONCURRENCY, retries: int = DEFAULT_RETRIES
+    ):
+        return await aapply_batch(self, ops, max_concurrency, retries)
+
+    # endregion
+
+    # region Watch
+
+    def watch(
+        self,
+        stop: asyncio.Event | None = None,
+        interval: float = DEFAULT_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        kinds: Iterable[ObjectKind] = ALL_KINDS,
+        sync: bool = True,
+    ) -> AsyncIterator[ChangeEvent]:
+        return AsyncWatcher(self, interval, max_interval, kinds=kinds, sync=sync).watch(stop)
+
+    # endregion
+
+    # region Secrets
+
+    async def resolve_secrets(self, refs: Iterable[str | SecretRef]) -> dict[str, SecretStr]:
+        from bw_sdk.resolve import AsyncResolver
+
+        return (await AsyncResolver(self).resolve(refs)).unwrap()
+
+    async def render_template(self, src: Source, dst: Source, strict: bool = True) -> RenderReport:
+        from bw_sdk.render import AsyncRenderer
+
+        return await AsyncRenderer(self, strict=strict).render(src, dst)
+
+    # endregion
+
+    # region Folders
+
+    async def get_folder(self, folder: _m.Folder | _m.FolderID):
+        obj_id = folder if isinstance(folder, str) else folder.id
+        return await self._get_object(FolderResp, "folder", obj_id, None)
+
+    async def get_folders(self, search: str | None = None, exact: bool = False):
+        params = _m.FoldersQuery(search=search)
+
+        return await self._get_object_list(FoldersResp, "folders", params, exact)
+
+    def iter_folders(self, search: str | None = None, exact: bool = False):
+        params = _m.FoldersQuery(search=search)
+        return self._iter_object_list(FoldersResp, FolderAdapter, "folders", params, exact)
+
+    async def find_folder(self, search: str | None = None, exact: bool = False):
+        res = await self.get_folders(search, exact)
+        return _single(res, "folder")
+
+    async def put_folder(self, obj: _m.Folder):
+        res = await self._put(FolderResp, f"/object/folder/{obj.id}", params=None, payload=obj)
+        self._invalidate("folder", obj.id)
+        return res
+
+    async def post_folder(self, obj: _m.NewFolder):
+        return await self._post_object(FolderResp, "/object/folder", params=None, payload=obj)
+
+    async def del_folder(self, obj: _m.Folder | _m.FolderID):
+        obj_id = obj if isinstance(obj, str) else obj.id
+        await self._delete(f"/object/folder/{obj_id}", params=None)
+        self._invalidate("folder", obj_id)
+        self._invalidate("item")
+
+    # endregion
+
+    # region Organization
+
+    async def get_organization(self, obj: _m.Organization | _m.OrgID):
+        obj_id = obj if isinstance(obj, str) else obj.id
+        return await self._get_object(OrgResp, "organization", obj_id, None)
+
+    async def get_organizations(self, search: str | None = None, exact: bool = False):
+        params = _m.OrganizationsQuery(search=search)
+        return await self._get_object_list(OrgsResp, "organizations", params, exact)
+
+    async def find_organization(
+        self,
+        search: str | None = None,
+        exact: bool = False,
+    ):
+        res = await self.get_organizations(search, exact)
+        return _single(res, "organization")
+
+    # endregion
+
+    # region Collections
+
+    async def get_collection(self, obj: _m.Collection | _m.CollID):
+        obj_id = obj if isinstance(obj, str) else obj.id
+        return await self._get_object(CollResp, "collection", obj_id, None)
+
+    async def get_collections(self, search: str | None = None, org_id: _m.OrgID | None = None, exact: bool = False):
+        params = _m.CollectionsQuery(search=search, org_id=org_id)
+        endpoint = "collections" if params.org_id is None else "org-collections"
+        return await self._get_object_list(CollsResp, endpoint, params, exact)
+
+    def iter_collections(self, search: str | None = None, org_id: _m.OrgID | None = None, exact: bool = False):
+        params = _m.CollectionsQuery(search=search, org_id=org_id)
+        endpoint = "collections" if params.org_id is None else "org-collections"
+        return self._iter_object_list(CollsResp, CollAdapter, endpoint, params, exact)
+
+    async def find_collection(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        exact: bool = False,
+    ):
+        res = await self.get_collections(search, org_id, exact)
+        return _single(res, "collection")
+
+    async def post_collection(self, obj: _m.NewCollection):
+        params = _m.OrgCollectionQuery(org_id=obj.org_id)
+        return await self._post_object(CollResp, "/object/org-collection", params=params, payload=obj)
+
+    async def put_collection(self, obj: _m.Collection):
+        params = _m.OrgCollectionQuery(org_id=obj.org_id)
+        res = await self._put(CollResp, f"/object/org-collection/{obj.id}", params=params, payload=obj)
+        self._invalidate("collection", obj.id)
+        return res
+
+    async def del_collection(self, obj: _m.Collection):
+        params = _m.OrgCollectionQuery(org_id=obj.org_id)
+        await self._delete(f"/object/org-collection/{obj.id}", params=params)
+        self._invalidate("collection", obj.id)
+        self._invalidate("item")
+
+    # endregion
+
+
+def NewClient(scheme: str = "http", host: str = "localhost", port: int = 8087, path: str = ""):
+    base_url = urlunsplit((scheme, f"{host}:{port}", path, "", ""))
+    return Client(http_client=httpx.Client(base_url=base_url))
+
+
+def NewPooledClient(backends: Iterable[Client], health_interval: float = 5.0, sync_after_write: bool = True):
+    from bw_sdk.pool import BackendPool
+
+    pool = BackendPool(backends, health_interval, sync_after_write)
+    return Client(http_client=httpx.Client(base_url="http://bw-pool", transport=pool))
+
+
+def NewAsyncClient(scheme: str = "http", host: str = "localhost", port: int = 8087, path: str = ""):
+    base_url = urlunsplit((scheme, f"{host}:{port}", path, "", ""))
+    return AsyncClient(http_client=httpx.AsyncClient(base_url=base_url))
+
+
+_LAZY_EXPORTS = {
+    "MetadataIndex": "bw_sdk.index",
+    "UriMatcher": "bw_sdk.matcher",
+    "ParallelParser": "bw_sdk.parallel",
+    "SnapshotMeta": "bw_sdk.persist",
+    "load_snapshot": "bw_sdk.persist",
+    "save_snapshot": "bw_sdk.persist",
+    "warm_start": "bw_sdk.persist",
+    "Backend": "bw_sdk.pool",
+    "BackendPool": "bw_sdk.pool",
+    "AsyncRenderer": "bw_sdk.render",
+    "Renderer": "bw_sdk.render",
+    "RenderReport": "bw_sdk.render",
+    "Source": "bw_sdk.render",
+    "AsyncResolver": "bw_sdk.resolve",
+    "Resolved": "bw_sdk.resolve",
+    "Resolver": "bw_sdk.resolve",
+    "SecretRef": "bw_sdk.resolve",
+    "ServeManager": "bw_sdk.serve",
+    "ServeProcess": "bw_sdk.serve",
+    "AsyncSessionManager": "bw_sdk.session",
+    "SessionManager": "bw_sdk.session",
+    "RefreshReport": "bw_sdk.snapshot",
+    "VaultSnapshot": "bw_sdk.snapshot",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(module), name)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
+
+
+__all__ = [
+    "DBStatus",
+    "Client",
+    "AsyncClient",
+    "ObjectCache",
+    "CacheStats",
+    "VaultSnapshot",
+    "RefreshReport",
+    "CallEvent",
+    "MetricsAggregator",
+    "ItemResult",
+    "Op",
+    "OpResult",
+    "BatchReport",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "FlightStats",
+    "Backend",
+    "BackendPool",
+    "ServeManager",
+    "ServeProcess",
+    "SessionManager",
+    "AsyncSessionManager",
+    "UriMatcher",
+    "SnapshotMeta",
+    "save_snapshot",
+    "load_snapshot",
+    "warm_start",
+    "Watcher",
+    "AsyncWatcher",
+    "ChangeEvent",
+    "SecretRef",
+    "Resolver",
+    "AsyncResolver",
+    "Resolved",
+    "Renderer",
+    "AsyncRenderer",
+    "RenderReport",
+    "CompactItem",
+    "ParallelParser",
+    "MetadataIndex",
+    "LinkTarget",
+    "Match",
+]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import re
+
+_STRUCT = re.compile(rb'["\[\]{}]')
+_STRING = re.compile(rb'["\\]')
+
+_OBJ_OPEN = ord("{")
+_ARR_OPEN = ord("[")
+_OPEN = (_OBJ_OPEN, _ARR_OPEN)
+_CLOSE = (ord("}"), ord("]"))
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+
+LIST_PATH = (None, b"data", b"data")
+
+
+class ListScanner:
+    def __init__(self, path: tuple[bytes | None, ...] = LIST_PATH):
+        self.path = path
+        self.buf = bytearray()
+        self.pos = 0
+        self.depth = 0
+        self.keys: list[bytes | None] = []
+        self.last_string: bytes | None = None
+        self.in_string = False
+        self.str_start = 0
+        self.target: int | None = None
+        self.elem_start: int | None = None
+        self.done = False
+
+    @property
+    def found(self):
+        return self.target is not None
+
+    @property
+    def body(self) -> bytes:
+        return bytes(self.buf)
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        if self.done:
+            return []
+        self.buf += chunk
+        out: list[bytes] = []
+        self._scan(out)
+        self._trim()
+        return out
+
+    def _scan(self, out: list[bytes]):
+        buf = self.buf
+        while True:
+            if self.in_string:
+                m = _STRING.search(buf, self.pos)
+                if m is None:
+                    self.pos = len(buf)
+                    return
+                i = m.start()
+                if buf[i] == _BACKSLASH:
+                    if i + 1 >= len(buf):
+                        self.pos = i
+                        return
+                    self.pos = i + 2
+                    continue
+                self.in_string = False
+                if self.target is None:
+                    self.last_string = bytes(buf[self.str_start : i])
+                self.pos = i + 1
+                continue
+
+            m = _STRUCT.search(buf, self.pos)
+            if m is None:
+                self.pos = len(buf)
+                return
+            i = m.start()
+            c = buf[i]
+            self.pos = i + 1
+
+            if c == _QUOTE:
+                self.in_string = True
+                self.str_start = self.pos
+            elif c in _OPEN:
+                if self.target is None:
+                    self.keys.append(self.last_string if self.depth > 0 else None)
+                    self.last_string = None
+                    if c == _ARR_OPEN and tuple(self.keys) == self.path:
+                        self.target = self.depth + 1
+                elif self.depth == self.target and self.elem_start is None:
+                    self.elem_start = i
+                self.depth += 1
+            elif c in _CLOSE:
+                self.depth -= 1
+                if self.target is None:
+                    self.keys.pop()
+                elif self.depth == self.target and self.elem_start is not None:
+                    out.append(bytes(buf[self.elem_start : i + 1]))
+                    self.elem_start = None
+                elif self.depth < self.target:
+                    self.done = True
+                    return
+
+    def _trim(self):
+        if self.target is None:
+            return
+        keep = self.pos if self.elem_start is None else self.elem_start
+        if keep == 0:
+            return
+        del self.buf[:keep]
+        self.pos -= keep
+        self.str_start -= keep
+        if self.elem_start is not None:
+            self.elem_start -= keep
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+from typing import Any, Generic, TypeVar
+from urllib.parse import urlsplit
+
+from pydantic import BaseModel, TypeAdapter
+
+T = TypeVar("T")
+
+transient_errors: contextvars.ContextVar[bool] = contextvars.ContextVar("transient_errors", default=False)
+
+
+@contextlib.contextmanager
+def raising_transient():
+    token = transient_errors.set(True)
+    try:
+        yield
+    finally:
+        transient_errors.reset(token)
+
+
+def single(res: list[T], kind: str) -> T:
+    match len(res):
+        case 0:
+            raise Exception(f"no {kind} found")
+        case 1:
+            return res[0]
+        case _:
+            raise Exception(f"multiple {kind}s matches")
+
+
+def uri_host(uri: str | None) -> str | None:
+    if not uri:
+        return None
+    if "://" not in uri:
+        uri = f"http://{uri}"
+    try:
+        return urlsplit(uri).hostname
+    except ValueError:
+        return None
+
+
+class LazyAdapter(Generic[T]):
+    __slots__ = ("_tp", "_adapter")
+
+    def __init__(self, tp: Any):
+        self._tp = tp
+        self._adapter: TypeAdapter[T] | None = None
+
+    @property
+    def adapter(self) -> TypeAdapter[T]:
+        adapter = self._adapter
+        if adapter is None:
+            if isinstance(self._tp, type) and issubclass(self._tp, BaseModel):
+                self._tp.model_rebuild()
+            adapter = self._adapter = TypeAdapter(self._tp)
+        return adapter
+
+    @property
+    def is_built(self) -> bool:
+        return self._adapter is not None
+
+    def validate_json(self, data: str | bytes, /) -> T:
+        return self.adapter.validate_json(data)
+
+    def validate_python(self, obj: Any, /) -> T:
+        return self.adapter.validate_python(obj)
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal
+
+import httpx
+
+import bw_sdk.model as _m
+from bw_sdk._util import raising_transient
+
+if TYPE_CHECKING:
+    from bw_sdk import AsyncClient, Client
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.05
+
+type OpKind = Literal["create", "update", "delete", "restore"]
+
+
+@dataclasses.dataclass
+class ItemResult:
+    id: _m.ItemID
+    item: _m.Item | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def _check_concurrency(max_concurrency: int):
+    if max_concurrency < 1:
+        raise Exception("max_concurrency must be at least 1")
+
+
+def fetch_items(
+    client: Client, ids: Iterable[_m.ItemID], max_concurrency: int = DEFAULT_CONCURRENCY
+) -> list[ItemResult]:
+    _check_concurrency(max_concurrency)
+    order = list(ids)
+    unique = list(dict.fromkeys(order))
+
+    def fetch(obj_id: _m.ItemID):
+        try:
+            return ItemResult(obj_id, item=client.get_item(obj_id))
+        except Exception as exc:
+            return ItemResult(obj_id, error=exc)
+
+    if max_concurrency == 1 or len(unique) <= 1:
+        fetched = [fetch(x) for x in unique]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(unique))) as pool:
+            fetched = list(pool.map(fetch, unique))
+
+    results = dict(zip(unique, fetched))
+    return [results[x] for x in order]
+
+
+async def afetch_items(
+    client: AsyncClient, ids: Iterable[_m.ItemID], max_concurrency: int = DEFAULT_CONCURRENCY
+) -> list[ItemResult]:
+    _check_concurrency(max_concurrency)
+    order = list(ids)
+    unique = list(dict.fromkeys(order))
+    limit = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(obj_id: _m.ItemID):
+        async with limit:
+            try:
+                return ItemResult(obj_id, item=await client.get_item(obj_id))
+            except Exception as exc:
+                return ItemResult(obj_id, error=exc)
+
+    fetched = await asyncio.gather(*(fetch(x) for x in unique))
+    results = dict(zip(unique, fetched))
+    return [results[x] for x in order]
+
+
+@dataclasses.dataclass(frozen=True)
+class Op:
+    kind: OpKind
+    target: Any
+
+    @classmethod
+    def create(cls, obj: _m.NewItemBase | _m.NewFolder | _m.NewCollection):
+        return cls("create", obj)
+
+    @classmethod
+    def update(cls, obj: _m.ItemTemplate | _m.Folder | _m.Collection):
+        return cls("update", obj)
+
+    @classmethod
+    def delete(cls, obj: _m.ItemTemplate | _m.ItemID | _m.Folder | _m.Collection):
+        return cls("delete", obj)
+
+    @classmethod
+    def restore(cls, obj: _m.ItemTemplate | _m.ItemID):
+        return cls("restore", obj)
+
+    @property
+    def key(self) -> tuple[str, str] | None:
+        match self.target:
+            case str():
+                return ("item", self.target)
+            case _m.ItemTemplate():
+                return ("item", self.target.id)
+            case _m.Folder():
+                return ("folder", self.target.id)
+            case _m.Collection():
+                return ("collection", self.target.id)
+        return None
+
+
+@dataclasses.dataclass
+class OpResult:
+    op: Op
+    value: Any = None
+    error: Exception | None = None
+    attempts: int = 0
+    coalesced: bool = False
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+@dataclasses.dataclass
+class BatchReport:
+    results: list[OpResult]
+    elapsed: float
+
+    @property
+    def succeeded(self):
+        return [x for x in self.results if x.ok]
+
+    @property
+    def failed(self):
+        return [x for x in self.results if not x.ok]
+
+    @property
+    def requests(self):
+        return sum(x.attempts for x in self.results)
+
+    @property
+    def ops_per_sec(self):
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+
+def is_transient(exc: Exception):
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return False
+
+
+def _not_applied(exc: Exception):
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429
+
+
+def _should_retry(op: Op, exc: Exception, retry_on: Callable[[Exception], bool]):
+    return retry_on(exc) and (op.kind != "create" or _not_applied(exc))
+
+
+def _dispatch(client: Client | AsyncClient, op: Op) -> Callable[[Any], Any]:
+    match op.kind, op.target:
+        case "create", _m.NewItemBase():
+            return client.post_item
+        case "create", _m.NewFolder():
+            return client.post_folder
+        case "create", _m.NewCollection():
+            return client.post_collection
+        case "update", _m.ItemTemplate():
+            return client.put_item
+        case "update", _m.Folder():
+            return client.put_folder
+        case "update", _m.Collection():
+            return client.put_collection
+        case "delete", _m.ItemTemplate() | str():
+            return client.del_item
+        case "delete", _m.Folder():
+            return client.del_folder
+        case "delete", _m.Collection():
+            return client.del_collection
+        case "restore", _m.ItemTemplate() | str():
+            return client.restore_item
+    raise Exception(f"unsupported operation [{op.kind} {type(op.target).__name__}]")
+
+
+def _plan(ops: Iterable[Op]):
+    results = [OpResult(op) for op in ops]
+    lanes: dict[Any, list[int]] = {}
+    for idx, res in enumerate(results):
+        key = res.op.key
+        lanes.setdefault(idx if key is None else key, []).append(idx)
+
+    superseded: dict[int, int] = {}
+    for lane in lanes.values():
+        for prev, idx in zip(lane, lane[1:]):
+            if results[prev].op.kind == results[idx].op.kind == "update":
+                superseded[prev] = idx
+    for prev in reversed(sorted(superseded)):
+        superseded[prev] = superseded.get(superseded[prev], superseded[prev])
+
+    runnable = [[x for x in lane if x not in superseded] for lane in lanes.values()]
+    return results, runnable, superseded
+
+
+def _settle(results: list[OpResult], superseded: dict[int, int]):
+    for prev, idx in superseded.items():
+        final = results[idx]
+        results[prev].value = final.value
+        results[prev].error = final.error
+        results[prev].coalesced = True
+
+
+def apply_batch(
+    client: Client,
+    ops: Iterable[Op],
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    retry_on: Callable[[Exception], bool] = is_transient,
+) -> BatchReport:
+    _check_concurrency(max_concurrency)
+    start = time.perf_counter()
+    results, lanes, superseded = _plan(ops)
+
+    def run(res: OpResult):
+        while True:
+            res.attempts += 1
+            try:
+                with raising_transient():
+                    res.value = _dispatch(client, res.op)(res.op.target)
+                res.error = None
+                return
+            except Exception as exc:
+                res.error = exc
+                if res.attempts > retries or not _should_retry(res.op, exc, retry_on):
+                    return
+            time.sleep(backoff * 2 ** (res.attempts - 1))
+
+    def run_lane(lane: list[int]):
+        for idx in lane:
+            run(results[idx])
+
+    if max_concurrency == 1 or len(lanes) <= 1:
+        for lane in lanes:
+            run_lane(lane)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(lanes))) as pool:
+            list(pool.map(run_lane, lanes))
+
+    _settle(results, superseded)
+    return BatchReport(results, time.perf_counter() - start)
+
+
+async def aapply_batch(
+    client: AsyncClient,
+    ops: Iterable[Op],
+    max_concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF,
+    retry_on: Callable[[Exception], bool] = is_transient,
+) -> BatchReport:
+    _check_concurrency(max_concurrency)
+    start = time.perf_counter()
+    results, lanes, superseded = _plan(ops)
+    limit = asyncio.Semaphore(max_concurrency)
+
+    async def run(res: OpResult):
+        while True:
+            res.attempts += 1
+            try:
+                with raising_transient():
+                    res.value = await _dispatch(client, res.op)(res.op.target)
+                res.error = None
+                return
+            except Exception as exc:
+                res.error = exc
+                if res.attempts > retries or not _should_retry(res.op, exc, retry_on):
+                    return
+            await asyncio.sleep(backoff * 2 ** (res.attempts - 1))
+
+    async def run_lane(lane: list[int]):
+        async with limit:
+            for idx in lane:
+                await run(results[idx])
+
+    await asyncio.gather(*(run_lane(x) for x in lanes))
+
+    _settle(results, superseded)
+    return BatchReport(results, time.perf_counter() - start)
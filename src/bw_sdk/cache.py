@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import copy
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+DEFAULT_TTL = {
+    "item": 60.0,
+    "folder": 300.0,
+    "collection": 300.0,
+    "organization": 600.0,
+}
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    stale: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclasses.dataclass
+class ObjectCache:
+    max_size: int = 1024
+    ttl: dict[str, float] = dataclasses.field(default_factory=lambda: dict(DEFAULT_TTL))
+    clock: Callable[[], float] = time.monotonic
+    stats: CacheStats = dataclasses.field(default_factory=CacheStats)
+
+    _entries: OrderedDict[tuple[str, str], tuple[float, Any]] = dataclasses.field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _generations: dict[tuple[str, str], int] = dataclasses.field(default_factory=dict, init=False, repr=False)
+    _type_generations: dict[str, int] = dataclasses.field(default_factory=dict, init=False, repr=False)
+    _cleared: int = dataclasses.field(default=0, init=False, repr=False)
+    _lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _generation(self, key: tuple[str, str]) -> tuple[int, int, int]:
+        return (self._cleared, self._type_generations.get(key[0], 0), self._generations.get(key, 0))
+
+    def generation(self, obj_type: str, obj_id: str) -> tuple[int, int, int]:
+        with self._lock:
+            return self._generation((obj_type, obj_id))
+
+    def get(self, obj_type: str, obj_id: str) -> Any | None:
+        key = (obj_type, obj_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires, obj = entry
+            if expires <= self.clock():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return copy.deepcopy(obj)
+
+    def put(self, obj_type: str, obj_id: str, obj: Any, generation: tuple[int, int, int] | None = None):
+        ttl = self.ttl.get(obj_type, 0.0)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        key = (obj_type, obj_id)
+        obj = copy.deepcopy(obj)
+        with self._lock:
+            if generation is not None and generation != self._generation(key):
+                self.stats.stale += 1
+                return
+            self._entries[key] = (self.clock() + ttl, obj)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, obj_type: str, obj_id: str):
+        key = (obj_type, obj_id)
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def invalidate_type(self, obj_type: str):
+        with self._lock:
+            self._type_generations[obj_type] = self._type_generations.get(obj_type, 0) + 1
+            for key in [key for key in self._generations if key[0] == obj_type]:
+                del self._generations[key]
+            keys = [key for key in self._entries if key[0] == obj_type]
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._cleared += 1
+            self._generations.clear()
+            self._type_generations.clear()
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
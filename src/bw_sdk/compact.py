@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import sys
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable
+
+import bw_sdk.model as _m
+from bw_sdk._util import LazyAdapter
+from bw_sdk.bulk import DEFAULT_CONCURRENCY, ItemResult
+
+if TYPE_CHECKING:
+    from bw_sdk import AsyncClient, Client
+
+LIST_THRESHOLD = 64
+
+
+def _intern(value: str | None) -> str | None:
+    return None if value is None else sys.intern(value)
+
+
+def _parse_date(value: str | None) -> datetime | None:
+    return None if value is None else datetime.fromisoformat(value)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CompactItem:
+    id: _m.ItemID
+    name: str
+    type: _m.ItemType
+    org_id: _m.OrgID | None
+    folder_id: _m.FolderID | None
+    coll_ids: tuple[_m.CollID, ...]
+    username: str | None
+    favorite: bool
+    revision: str
+    deleted: str | None
+
+    @property
+    def revised_at(self) -> datetime:
+        return datetime.fromisoformat(self.revision)
+
+    @property
+    def deleted_at(self) -> datetime | None:
+        return _parse_date(self.deleted)
+
+    def to_model(self, client: Client) -> _m.Item:
+        return client.get_item(self.id)
+
+    def to_summary(self) -> _m.ItemSummary:
+        return _m.ItemSummary.model_construct(
+            object="item",
+            id=self.id,
+            name=self.name,
+            type=self.type,
+            org_id=self.org_id,
+            coll_ids=list(self.coll_ids),
+            folder_id=self.folder_id,
+        )
+
+
+class Interner:
+    def __init__(self):
+        self._tuples: dict[tuple[str, ...], tuple[str, ...]] = {(): ()}
+        self._types = {int(x): x for x in _m.ItemType}
+
+    def strings(self, values: Iterable[str] | None) -> tuple[Any, ...]:
+        key = tuple(sys.intern(x) for x in values or ())
+        return self._tuples.setdefault(key, key)
+
+    def item(self, data: dict[str, Any]) -> CompactItem:
+        login = data.get("login") or {}
+        org_id = _intern(data.get("organizationId"))
+        folder_id = _intern(data.get("folderId"))
+        return CompactItem(
+            id=_m.ItemID(data["id"]),
+            name=data["name"],
+            type=self._types[data["type"]],
+            org_id=None if org_id is None else _m.OrgID(org_id),
+            folder_id=None if folder_id is None else _m.FolderID(folder_id),
+            coll_ids=self.strings(data.get("collectionIds")),
+            username=_intern(login.get("username")),
+            favorite=bool(data.get("favorite")),
+            revision=sys.intern(data["revisionDate"]),
+            deleted=data.get("deletedDate"),
+        )
+
+
+class CompactAdapter(LazyAdapter[CompactItem]):
+    __slots__ = ("interner",)
+
+    def __init__(self, interner: Interner | None = None):
+        super().__init__(CompactItem)
+        self.interner = interner or Interner()
+
+    def validate_json(self, data: str | bytes, /) -> CompactItem:
+        return self.interner.item(json.loads(data))
+
+    def validate_python(self, obj: Any, /) -> CompactItem:
+        return self.interner.item(obj)
+
+
+def _collect(ids: list[_m.ItemID], found: dict[_m.ItemID, _m.Item], fetched: list[ItemResult]) -> list[_m.Item]:
+    for res in fetched:
+        if res.item is None:
+            raise res.error or Exception(f"could not fetch item [{res.id}]")
+        found[res.id] = res.item
+    return [found[x] for x in ids]
+
+
+def to_models(
+    client: Client, items: Iterable[CompactItem], max_concurrency: int = DEFAULT_CONCURRENCY
+) -> list[_m.Item]:
+    ids = [x.id for x in items]
+    wanted = set(ids)
+    found: dict[_m.ItemID, _m.Item] = {}
+    if len(wanted) >= LIST_THRESHOLD:
+        found = {x.id: x for x in client.iter_items() if x.id in wanted}
+    missing = [x for x in dict.fromkeys(ids) if x not in found]
+    return _collect(ids, found, client.get_items_by_id(missing, max_concurrency))
+
+
+async def ato_models(
+    client: AsyncClient, items: Iterable[CompactItem], max_concurrency: int = DEFAULT_CONCURRENCY
+) -> list[_m.Item]:
+    ids = [x.id for x in items]
+    wanted = set(ids)
+    found: dict[_m.ItemID, _m.Item] = {}
+    if len(wanted) >= LIST_THRESHOLD:
+        found = {x.id: x async for x in client.iter_items() if x.id in wanted}
+    missing = [x for x in dict.fromkeys(ids) if x not in found]
+    return _collect(ids, found, await client.get_items_by_id(missing, max_concurrency))
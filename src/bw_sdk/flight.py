@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import dataclasses
+import functools
+import threading
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class FlightStats:
+    leaders: int = 0
+    collapsed: int = 0
+
+    @property
+    def calls(self):
+        return self.leaders + self.collapsed
+
+
+class _Flight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self.stats = FlightStats()
+        self._calls: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            flight = self._calls.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._calls[key] = _Flight()
+                self.stats.leaders += 1
+            else:
+                self.stats.collapsed += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.value)
+
+        try:
+            flight.value = fn()
+            return flight.value
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            flight.done.set()
+
+
+class _AsyncFlight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[Any]):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    def __init__(self):
+        self.stats = FlightStats()
+        self._calls: dict[Hashable, _AsyncFlight] = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    def _finish(self, key: Hashable, flight: _AsyncFlight, _: asyncio.Future[Any]):
+        if self._calls.get(key) is flight:
+            del self._calls[key]
+        if not flight.task.cancelled():
+            flight.task.exception()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        flight = self._calls.get(key)
+        leader = flight is None
+        if flight is None:
+            flight = self._calls[key] = _AsyncFlight(asyncio.ensure_future(fn()))
+            flight.task.add_done_callback(functools.partial(self._finish, key, flight))
+            self.stats.leaders += 1
+        else:
+            self.stats.collapsed += 1
+
+        flight.waiters += 1
+        try:
+            value = await asyncio.shield(flight.task)
+            return value if leader else copy.deepcopy(value)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
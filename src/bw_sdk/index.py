@@ -0,0 +1,463 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+import bw_sdk.model as _m
+from bw_sdk._util import LazyAdapter
+from bw_sdk._util import single as _single
+from bw_sdk._util import uri_host
+from bw_sdk.snapshot import RefreshReport
+
+if TYPE_CHECKING:
+    from bw_sdk import AsyncClient, Client
+
+SCHEMA_VERSION = 1
+MIN_TRIGRAM = 3
+
+SummaryAdapter: LazyAdapter[_m.ItemSummary] = LazyAdapter(_m.ItemSummary)
+OBJECT_ADAPTERS: dict[str, LazyAdapter[Any]] = {
+    "folder": LazyAdapter(_m.Folder),
+    "collection": LazyAdapter(_m.Collection),
+    "organization": LazyAdapter(_m.Organization),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS items (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    type INTEGER NOT NULL,
+    org_id TEXT,
+    folder_id TEXT,
+    username TEXT,
+    revised_at TEXT,
+    deleted_at TEXT
+);
+CREATE INDEX IF NOT EXISTS items_name ON items (name);
+CREATE INDEX IF NOT EXISTS items_org ON items (org_id);
+CREATE INDEX IF NOT EXISTS items_folder ON items (folder_id);
+CREATE TABLE IF NOT EXISTS item_collections (
+    coll_id TEXT NOT NULL, item_id TEXT NOT NULL, PRIMARY KEY (coll_id, item_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS item_hosts (
+    host TEXT NOT NULL, item_id TEXT NOT NULL, PRIMARY KEY (host, item_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS item_fields (
+    name TEXT NOT NULL, item_id TEXT NOT NULL, PRIMARY KEY (name, item_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS item_collections_item ON item_collections (item_id);
+CREATE INDEX IF NOT EXISTS item_hosts_item ON item_hosts (item_id);
+CREATE INDEX IF NOT EXISTS item_fields_item ON item_fields (item_id);
+CREATE TABLE IF NOT EXISTS objects (
+    kind TEXT NOT NULL, id TEXT NOT NULL, name TEXT NOT NULL, org_id TEXT, data TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+"""
+
+TRIGRAM_TABLE = "CREATE VIRTUAL TABLE items_fts USING fts5(name, username, uris, tokenize='trigram')"
+PLAIN_TABLE = "CREATE TABLE items_fts (rowid INTEGER PRIMARY KEY, name TEXT, username TEXT, uris TEXT)"
+
+ITEM_CHILDREN = ("item_collections", "item_hosts", "item_fields")
+
+
+def _phrase(needle: str) -> str:
+    return '"' + needle.replace('"', '""') + '"'
+
+
+def _escape_like(needle: str) -> str:
+    return needle.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _like(needle: str) -> str:
+    return "%" + _escape_like(needle) + "%"
+
+
+def _has_trigram(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.trigram_probe USING fts5(x, tokenize='trigram')")
+    except sqlite3.OperationalError:
+        return False
+    conn.execute("DROP TABLE temp.trigram_probe")
+    return True
+
+
+def _connect(path: str | Path) -> sqlite3.Connection:
+    if str(path) not in (":memory:", ""):
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+    return sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+
+
+def _uris(record: dict[str, Any]) -> list[str]:
+    login = record.get("login") or {}
+    return [x["uri"] for x in login.get("uris") or () if x.get("uri")]
+
+
+class MetadataIndex:
+    def __init__(self, path: str | Path = ":memory:"):
+        self.path = path
+        self._conn = _connect(path)
+        self._lock = threading.RLock()
+        try:
+            with self._lock:
+                self._conn.executescript(SCHEMA)
+                self.trigram = self._create_fts()
+                version = self._get_meta("schema")
+                if version is None:
+                    self._set_meta("schema", str(SCHEMA_VERSION))
+                elif int(version) != SCHEMA_VERSION:
+                    raise Exception(f"unsupported metadata index version [{version}]")
+        except BaseException:
+            self._conn.close()
+            raise
+
+    def _create_fts(self) -> bool:
+        supported = _has_trigram(self._conn)
+        existing = self._scalar("SELECT sql FROM sqlite_master WHERE name = 'items_fts'")
+        if existing is None:
+            self._conn.execute(TRIGRAM_TABLE if supported else PLAIN_TABLE)
+            return supported
+        if "fts5" in existing and not supported:
+            raise Exception(
+                f"metadata index [{self.path}] needs SQLite >= 3.34 with FTS5 "
+                f"(found {sqlite3.sqlite_version}); rebuild it with this SQLite"
+            )
+        return "fts5" in existing
+
+    @classmethod
+    def from_client(cls, client: Client, path: str | Path = ":memory:"):
+        index = cls(path)
+        index.refresh(client)
+        return index
+
+    @classmethod
+    async def from_async_client(cls, client: AsyncClient, path: str | Path = ":memory:"):
+        index = cls(path)
+        await index.arefresh(client)
+        return index
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc: Any):
+        self.close()
+
+    def __len__(self):
+        return self._scalar("SELECT count(*) FROM items WHERE deleted_at IS NULL")
+
+    def _scalar(self, sql: str, *args: Any) -> Any:
+        with self._lock:
+            row = self._conn.execute(sql, args).fetchone()
+        return None if row is None else row[0]
+
+    def _get_meta(self, key: str) -> str | None:
+        return self._scalar("SELECT value FROM meta WHERE key = ?", key)
+
+    def _set_meta(self, key: str, value: str | None):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @property
+    def last_sync(self) -> datetime | None:
+        value = self._get_meta("last_sync")
+        return None if value is None else datetime.fromisoformat(value)
+
+    # region Update
+
+    def _upsert(self, record: dict[str, Any]):
+        summary = SummaryAdapter.validate_python(record)
+        login = record.get("login") or {}
+        uris = _uris(record)
+        fields = [x["name"] for x in record.get("fields") or () if x.get("name")]
+        rowid = self._conn.execute(
+            """
+            INSERT INTO items (id, name, type, org_id, folder_id, username, revised_at, deleted_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                name = excluded.name, type = excluded.type, org_id = excluded.org_id,
+                folder_id = excluded.folder_id, username = excluded.username,
+                revised_at = excluded.revised_at, deleted_at = excluded.deleted_at
+            RETURNING rowid
+            """,
+            (
+                summary.id,
+                summary.name,
+                int(summary.type),
+                summary.org_id,
+                summary.folder_id,
+                login.get("username"),
+                record.get("revisionDate"),
+                record.get("deletedDate"),
+            ),
+        ).fetchone()[0]
+        self._delete_children(summary.id, rowid)
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO item_collections (coll_id, item_id) VALUES (?, ?)",
+            [(x, summary.id) for x in summary.coll_ids],
+        )
+        hosts = {host for host in (uri_host(x) for x in uris) if host is not None}
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO item_hosts (host, item_id) VALUES (?, ?)", [(x, summary.id) for x in hosts]
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO item_fields (name, item_id) VALUES (?, ?)", [(x, summary.id) for x in fields]
+        )
+        self._conn.execute(
+            "INSERT INTO items_fts (rowid, name, username, uris) VALUES (?, ?, ?, ?)",
+            (rowid, summary.name, login.get("username") or "", "\n".join(uris)),
+        )
+
+    def _delete_children(self, obj_id: str, rowid: int):
+        for table in ITEM_CHILDREN:
+            self._conn.execute(f"DELETE FROM {table} WHERE item_id = ?", (obj_id,))
+        self._conn.execute("DELETE FROM items_fts WHERE rowid = ?", (rowid,))
+
+    def _remove(self, obj_id: str, rowid: int):
+        self._delete_children(obj_id, rowid)
+        self._conn.execute("DELETE FROM items WHERE rowid = ?", (rowid,))
+
+    def apply_records(self, records: Iterable[dict[str, Any]]) -> RefreshReport:
+        report = RefreshReport()
+        with self._lock:
+            known = {
+                row[0]: (row[1], row[2], row[3])
+                for row in self._conn.execute("SELECT id, rowid, revised_at, deleted_at FROM items")
+            }
+            seen: set[str] = set()
+            self._conn.execute("BEGIN")
+            try:
+                for record in records:
+                    report.scanned += 1
+                    obj_id = record.get("id")
+                    old = known.get(obj_id) if isinstance(obj_id, str) else None
+                    if old is not None:
+                        seen.add(record["id"])
+                        if old[1:] == (record.get("revisionDate"), record.get("deletedDate")):
+                            continue
+                    self._upsert(record)
+                    report.validated += 1
+                    seen.add(record["id"])
+                    (report.added if old is None else report.changed).append(_m.ItemID(record["id"]))
+                for obj_id, (rowid, _, _) in known.items():
+                    if obj_id not in seen:
+                        self._remove(obj_id, rowid)
+                        report.deleted.append(_m.ItemID(obj_id))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return report
+
+    def replace_objects(self, kind: str, objs: Iterable[_m.Folder | _m.Collection | _m.Organization]):
+        rows = [
+            (kind, x.id, x.name, getattr(x, "org_id", None), x.model_dump_json(by_alias=True, exclude_none=False))
+            for x in objs
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM objects WHERE kind = ?", (kind,))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO objects (kind, id, name, org_id, data) VALUES (?, ?, ?, ?, ?)", rows
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _finish_refresh(self, last_sync: datetime):
+        with self._lock:
+            self._set_meta("last_sync", last_sync.isoformat())
+
+    def refresh(self, client: Client, sync: bool = False) -> RefreshReport:
+        if sync:
+            client.sync()
+        status = client.get_status()
+        records = client._get_raw_items(None) + client._get_raw_items(_m.ItemQuery(trash=True))
+        report = self.apply_records(records)
+        self.replace_objects("folder", client.get_folders())
+        self.replace_objects("collection", client.get_collections())
+        self.replace_objects("organization", client.get_organizations())
+        self._finish_refresh(status.lastSync)
+        return report
+
+    async def arefresh(self, client: AsyncClient, sync: bool = False) -> RefreshReport:
+        if sync:
+            await client.sync()
+        status = await client.get_status()
+        records = await client._get_raw_items(None) + await client._get_raw_items(_m.ItemQuery(trash=True))
+        report = self.apply_records(records)
+        self.replace_objects("folder", await client.get_folders())
+        self.replace_objects("collection", await client.get_collections())
+        self.replace_objects("organization", await client.get_organizations())
+        self._finish_refresh(status.lastSync)
+        return report
+
+    # endregion
+
+    # region Items
+
+    def _search_clause(self, search: str) -> tuple[str, list[Any]]:
+        if self.trigram and len(search) >= MIN_TRIGRAM:
+            sql = "i.rowid IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)"
+            args: list[Any] = [_phrase(search)]
+        else:
+            pattern = _like(search)
+            sql = (
+                "i.rowid IN (SELECT rowid FROM items_fts WHERE name LIKE ? ESCAPE '\\' "
+                "OR username LIKE ? ESCAPE '\\' OR uris LIKE ? ESCAPE '\\')"
+            )
+            args = [pattern, pattern, pattern]
+        if len(search) >= 8:
+            sql = f"({sql} OR i.id LIKE ? ESCAPE '\\')"
+            args.append(_escape_like(search.lower()) + "%")
+        return sql, args
+
+    def search_ids(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+        item_type: _m.ItemType | None = None,
+        field: str | None = None,
+    ) -> list[_m.ItemID]:
+        return [x.id for x in self.get_items(search, org_id, coll_id, folder_id, url, trash, exact, item_type, field)]
+
+    def get_items(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+        item_type: _m.ItemType | None = None,
+        field: str | None = None,
+    ) -> list[_m.ItemSummary]:
+        clauses = ["i.deleted_at IS NOT NULL" if trash else "i.deleted_at IS NULL"]
+        args: list[Any] = []
+        if exact:
+            if search is None:
+                return []
+            clauses.append("i.name = ?")
+            args.append(search)
+        elif search:
+            sql, extra = self._search_clause(search)
+            clauses.append(sql)
+            args.extend(extra)
+        if org_id is not None:
+            clauses.append("i.org_id = ?")
+            args.append(org_id)
+        if folder_id is not None:
+            clauses.append("i.folder_id = ?")
+            args.append(folder_id)
+        if coll_id is not None:
+            clauses.append("i.id IN (SELECT item_id FROM item_collections WHERE coll_id = ?)")
+            args.append(coll_id)
+        if url is not None:
+            host = uri_host(url)
+            if host is None:
+                return []
+            clauses.append("i.id IN (SELECT item_id FROM item_hosts WHERE host = ?)")
+            args.append(host)
+        if item_type is not None:
+            clauses.append("i.type = ?")
+            args.append(int(item_type))
+        if field is not None:
+            clauses.append("i.id IN (SELECT item_id FROM item_fields WHERE name = ?)")
+            args.append(field)
+
+        sql = f"SELECT i.id, i.name, i.type, i.org_id, i.folder_id FROM items i WHERE {' AND '.join(clauses)}"
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY i.rowid", args).fetchall()
+            colls: dict[str, list[str]] = {}
+            ids = [row[0] for row in rows]
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                marks = ",".join("?" * len(chunk))
+                for item_id, coll in self._conn.execute(
+                    f"SELECT item_id, coll_id FROM item_collections WHERE item_id IN ({marks})", chunk
+                ):
+                    colls.setdefault(item_id, []).append(coll)
+        return [
+            _m.ItemSummary.model_construct(
+                object="item",
+                id=row[0],
+                name=row[1],
+                type=_m.ItemType(row[2]),
+                org_id=row[3],
+                folder_id=row[4],
+                coll_ids=colls.get(row[0], []),
+            )
+            for row in rows
+        ]
+
+    def find_item(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return _single(self.get_items(search, org_id, coll_id, folder_id, url, trash, exact), "item")
+
+    # endregion
+
+    # region Objects
+
+    def _objects(self, kind: str, search: str | None, exact: bool, org_id: _m.OrgID | None = None) -> list[Any]:
+        clauses = ["kind = ?"]
+        args: list[Any] = [kind]
+        if exact:
+            clauses.append("name = ?")
+            args.append(search)
+        elif search:
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            args.append(_like(search))
+        if org_id is not None:
+            clauses.append("org_id = ?")
+            args.append(org_id)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM objects WHERE {' AND '.join(clauses)} ORDER BY rowid", args
+            ).fetchall()
+        adapter = OBJECT_ADAPTERS[kind]
+        return [adapter.validate_json(row[0]) for row in rows]
+
+    def get_folders(self, search: str | None = None, exact: bool = False) -> list[_m.Folder]:
+        return self._objects("folder", search, exact)
+
+    def find_folder(self, search: str | None = None, exact: bool = False):
+        return _single(self.get_folders(search, exact), "folder")
+
+    def get_collections(
+        self, search: str | None = None, org_id: _m.OrgID | None = None, exact: bool = False
+    ) -> list[_m.Collection]:
+        return self._objects("collection", search, exact, org_id)
+
+    def find_collection(self, search: str | None = None, org_id: _m.OrgID | None = None, exact: bool = False):
+        return _single(self.get_collections(search, org_id, exact), "collection")
+
+    def get_organizations(self, search: str | None = None, exact: bool = False) -> list[_m.Organization]:
+        return self._objects("organization", search, exact)
+
+    def find_organization(self, search: str | None = None, exact: bool = False):
+        return _single(self.get_organizations(search, exact), "organization")
+
+    # endregion
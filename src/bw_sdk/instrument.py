@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import bisect
+import contextlib
+import dataclasses
+import logging
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TypeVar
+
+import bw_sdk.model as _m
+
+if TYPE_CHECKING:
+    import httpx
+
+    from bw_sdk._util import LazyAdapter
+
+logger = logging.getLogger(__name__)
+
+_ID_SEGMENT = re.compile(r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)")
+
+T = TypeVar("T")
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def endpoint_of(path: str) -> str:
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+@dataclasses.dataclass
+class CallEvent:
+    endpoint: str
+    method: str
+    status: int | None = None
+    bytes_received: int = 0
+    http_latency: float = 0.0
+    validation_latency: float = 0.0
+    item_count: int | None = None
+    error: str | None = None
+
+
+type Hook = Callable[[CallEvent], None]
+
+
+def _count(data: Any) -> int | None:
+    if isinstance(data, _m.DataList):
+        return len(data.data)
+    if isinstance(data, _m.BaseModel):
+        return 1
+    return None
+
+
+class Call:
+    def __init__(self, method: str, path: str):
+        self.event = CallEvent(endpoint=endpoint_of(path), method=method)
+        self.start = time.perf_counter()
+
+    def response(self, res: httpx.Response):
+        self.event.http_latency = time.perf_counter() - self.start
+        self.event.status = res.status_code
+        self.event.bytes_received = len(res.content)
+
+    def validate(self, validator: LazyAdapter[T], content: bytes) -> T:
+        start = time.perf_counter()
+        resp = validator.validate_json(content)
+        self.event.validation_latency += time.perf_counter() - start
+        if isinstance(resp, _m.ErrorResponse):
+            self.event.error = resp.message
+        elif isinstance(resp, _m.ValidResponse):
+            self.event.item_count = _count(resp.data)
+        return resp
+
+    def opened(self, res: httpx.Response):
+        self.event.status = res.status_code
+        self.event.item_count = 0
+
+    def element(self, validator: LazyAdapter[T], raw: bytes) -> T:
+        start = time.perf_counter()
+        obj = validator.validate_json(raw)
+        self.event.validation_latency += time.perf_counter() - start
+        self.event.item_count = (self.event.item_count or 0) + 1
+        return obj
+
+    def received(self, chunk: bytes):
+        self.event.bytes_received += len(chunk)
+        return chunk
+
+    def streamed(self):
+        self.event.http_latency = time.perf_counter() - self.start - self.event.validation_latency
+
+    def finish(self, error: BaseException | None = None):
+        if self.event.status is not None and not self.event.http_latency:
+            self.event.http_latency = time.perf_counter() - self.start - self.event.validation_latency
+        if error is not None and self.event.error is None:
+            self.event.error = str(error) or type(error).__name__
+        if self.event.error is None and self.event.status is not None and self.event.status >= 400:
+            self.event.error = f"HTTP {self.event.status}"
+        return self.event
+
+
+@contextlib.contextmanager
+def observe(hooks: list[Hook], method: str, path: str) -> Iterator[Call]:
+    call = Call(method, path)
+    error = None
+    try:
+        yield call
+    except Exception as exc:
+        error = exc
+        raise
+    finally:
+        if hooks:
+            event = call.finish(error)
+            for hook in hooks:
+                try:
+                    hook(event)
+                except Exception:
+                    logger.exception("hook %r failed for %s %s", hook, event.method, event.endpoint)
+
+
+class Histogram:
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def as_dict(self):
+        cumulative: dict[str, int] = {}
+        seen = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            seen += count
+            cumulative[str(bound)] = seen
+        return {"count": self.count, "sum": self.total, "buckets": cumulative}
+
+
+@dataclasses.dataclass
+class EndpointStats:
+    calls: int = 0
+    errors: int = 0
+    bytes_received: int = 0
+    items: int = 0
+    http: Histogram = dataclasses.field(default_factory=Histogram)
+    validation: Histogram = dataclasses.field(default_factory=Histogram)
+    last_error: str | None = None
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "items": self.items,
+            "http_latency": self.http.as_dict(),
+            "validation_latency": self.validation.as_dict(),
+            "last_error": self.last_error,
+        }
+
+
+class MetricsAggregator:
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.endpoints: dict[tuple[str, str], EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: CallEvent):
+        key = (event.method, event.endpoint)
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointStats(
+                    http=Histogram(self.buckets), validation=Histogram(self.buckets)
+                )
+            stats.calls += 1
+            stats.bytes_received += event.bytes_received
+            stats.items += event.item_count or 0
+            stats.http.observe(event.http_latency)
+            stats.validation.observe(event.validation_latency)
+            if event.error is not None:
+                stats.errors += 1
+                stats.last_error = event.error
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {f"{method} {endpoint}": stats.as_dict() for (method, endpoint), stats in self.endpoints.items()}
+
+    def reset(self):
+        with self._lock:
+            self.endpoints.clear()
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import ipaddress
+import itertools
+import re
+import warnings
+from typing import Any, Iterable
+from urllib.parse import urlsplit
+
+import bw_sdk.model as _m
+from bw_sdk._util import uri_host
+from bw_sdk.model import Match
+
+
+@functools.cache
+def _public_suffixes() -> Any:
+    try:
+        import tldextract
+    except ImportError:
+        warnings.warn(
+            "tldextract is not installed, BaseDomain uri matching falls back to exact host matching"
+            " [pip install bw-sdk[psl]]",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return None
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None, include_psl_private_domains=True)
+
+
+def base_domain(host: str | None) -> str | None:
+    if not host:
+        return None
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        pass
+    suffixes = _public_suffixes()
+    if suffixes is None:
+        return host
+    return suffixes(host).top_domain_under_public_suffix or host
+
+
+def host_port(uri: str | None) -> str | None:
+    if not uri:
+        return None
+    if "://" not in uri:
+        uri = f"http://{uri}"
+    try:
+        netloc = urlsplit(uri).netloc
+    except ValueError:
+        return None
+    return netloc.rsplit("@", 1)[-1].lower() or None
+
+
+def _prefix_host(prefix: str) -> str | None:
+    scheme, sep, rest = prefix.partition("://")
+    if not sep or not scheme or "/" not in rest:
+        return None
+    return uri_host(prefix)
+
+
+@dataclasses.dataclass(frozen=True)
+class Rule:
+    item_id: _m.ItemID
+    uri: str
+    match: Match
+    key: str | None = None
+    pattern: re.Pattern[str] | None = None
+
+    def matches(self, url: str, host: str | None, port_host: str | None, domain: str | None) -> bool:
+        match self.match:
+            case Match.BaseDomain:
+                return domain is not None and self.key == domain
+            case Match.Host:
+                return port_host is not None and self.key == port_host
+            case Match.StartsWith:
+                return url.startswith(self.uri)
+            case Match.Regexp:
+                return self.pattern is not None and self.pattern.search(url) is not None
+            case Match.Excact:
+                return url == self.uri
+        return False
+
+
+class UriMatcher:
+    def __init__(
+        self, items: Iterable[_m.Item] = (), default_match: Match = Match.BaseDomain, include_deleted: bool = False
+    ):
+        self.default_match = default_match
+        self.include_deleted = include_deleted
+        self.items: dict[_m.ItemID, _m.ItemLogin] = {}
+        self._rules: dict[_m.ItemID, list[Rule]] = {}
+        self._order: dict[_m.ItemID, int] = {}
+        self._counter = itertools.count()
+        self._by_domain: dict[str, dict[Rule, None]] = {}
+        self._by_host: dict[str, dict[Rule, None]] = {}
+        self._by_exact: dict[str, dict[Rule, None]] = {}
+        self._by_prefix_host: dict[str, dict[Rule, None]] = {}
+        self._scan: dict[Rule, None] = {}
+        for item in items:
+            self.add_item(item)
+
+    def __len__(self):
+        return len(self.items)
+
+    # region Index
+
+    def _bucket(self, rule: Rule):
+        match rule.match:
+            case Match.BaseDomain:
+                return None if rule.key is None else self._by_domain.setdefault(rule.key, {})
+            case Match.Host:
+                return None if rule.key is None else self._by_host.setdefault(rule.key, {})
+            case Match.Excact:
+                return self._by_exact.setdefault(rule.uri, {})
+            case Match.StartsWith:
+                key = _prefix_host(rule.uri)
+                return self._scan if key is None else self._by_prefix_host.setdefault(key, {})
+            case Match.Regexp:
+                return self._scan
+        return None
+
+    def _rule(self, item_id: _m.ItemID, uri: _m.UriMatch) -> Rule | None:
+        if not uri.uri:
+            return None
+        strategy = self.default_match if uri.match is None else uri.match
+        if strategy == Match.Never:
+            return None
+        match strategy:
+            case Match.BaseDomain:
+                return Rule(item_id, uri.uri, strategy, key=base_domain(uri_host(uri.uri)))
+            case Match.Host:
+                return Rule(item_id, uri.uri, strategy, key=host_port(uri.uri))
+            case Match.Regexp:
+                try:
+                    return Rule(item_id, uri.uri, strategy, pattern=re.compile(uri.uri, re.IGNORECASE))
+                except re.error:
+                    return None
+        return Rule(item_id, uri.uri, strategy)
+
+    def add_item(self, item: _m.Item):
+        self.remove_item(item.id)
+        if not isinstance(item, _m.ItemLogin) or not item.login.uris:
+            return
+        if item.deleted_at is not None and not self.include_deleted:
+            return
+        rules = [x for x in (self._rule(item.id, uri) for uri in item.login.uris) if x is not None]
+        if not rules:
+            return
+        self.items[item.id] = item
+        self._rules[item.id] = rules
+        self._order[item.id] = next(self._counter)
+        for rule in rules:
+            bucket = self._bucket(rule)
+            if bucket is not None:
+                bucket[rule] = None
+
+    def remove_item(self, item: _m.Item | _m.ItemID):
+        obj_id = item if isinstance(item, str) else item.id
+        self.items.pop(obj_id, None)
+        self._order.pop(obj_id, None)
+        for rule in self._rules.pop(obj_id, []):
+            bucket = self._bucket(rule)
+            if bucket is not None:
+                bucket.pop(rule, None)
+
+    # endregion
+
+    def _candidates(self, url: str, host: str | None, port_host: str | None, domain: str | None):
+        if domain is not None:
+            yield from self._by_domain.get(domain, ())
+        if port_host is not None:
+            yield from self._by_host.get(port_host, ())
+        if host is not None:
+            yield from self._by_prefix_host.get(host, ())
+        yield from self._by_exact.get(url, ())
+        yield from self._scan
+
+    def match_ids(self, url: str) -> list[_m.ItemID]:
+        host = uri_host(url)
+        port_host = host_port(url)
+        domain = base_domain(host)
+        found: dict[_m.ItemID, None] = {}
+        for rule in self._candidates(url, host, port_host, domain):
+            if rule.item_id not in found and rule.matches(url, host, port_host, domain):
+                found[rule.item_id] = None
+        return sorted(found, key=self._order.__getitem__)
+
+    def match(self, url: str) -> list[_m.ItemLogin]:
+        return [self.items[x] for x in self.match_ids(url)]
+
+    def match_urls(self, urls: Iterable[str]) -> dict[str, list[_m.ItemLogin]]:
+        res: dict[str, list[_m.ItemLogin]] = {}
+        for url in urls:
+            if url not in res:
+                res[url] = self.match(url)
+        return res
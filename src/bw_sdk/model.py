@@ -38,6 +38,13 @@ class Match(enum.IntEnum):
     Never = 5
 
 
+class ItemType(enum.IntEnum):
+    Login = 1
+    SecureNote = 2
+    Card = 3
+    Identity = 4
+
+
 class ObjectType(enum.StrEnum):
     String = "string"
     Template = "template"
@@ -74,7 +81,7 @@ SecretStrFromStr = (
 
 
 class BaseModel(pydantic.BaseModel):
-    model_config = pydantic.ConfigDict(populate_by_name=True)
+    model_config = pydantic.ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class BaseObj(BaseModel):
@@ -323,6 +330,25 @@ Item = Annotated[
 ItemT = TypeVar("ItemT", ItemLogin, ItemSecureNote, ItemCard, ItemIdentity)
 
 
+class ItemSummary(BaseObj):
+    object: Literal["item"] = pydantic.Field(repr=False)
+
+    id: ItemID
+    name: str
+    type: ItemType
+    org_id: OrgID | None = pydantic.Field(default=None, alias=str("organizationId"))
+    coll_ids: list[CollID] = pydantic.Field(default_factory=list, alias=str("collectionIds"))
+    folder_id: FolderID | None = pydantic.Field(default=None, alias=str("folderId"))
+
+
+ITEM_TYPES: dict[type[ItemTemplate], ItemType] = {
+    ItemLogin: ItemType.Login,
+    ItemSecureNote: ItemType.SecureNote,
+    ItemCard: ItemType.Card,
+    ItemIdentity: ItemType.Identity,
+}
+
+
 class NewItemBase(BaseObj):
     name: str
     org_id: OrgID | None = pydantic.Field(default=None, alias=str("organizationId"))
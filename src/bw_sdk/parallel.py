@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal, TypeVar
+
+from bw_sdk._util import LazyAdapter
+
+T = TypeVar("T")
+
+type Mode = Literal["auto", "serial", "thread"]
+
+DEFAULT_THRESHOLD = 4 * 2**20
+CHUNKS_PER_WORKER = 2
+
+
+def free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def split(records: list[T], parts: int) -> list[list[T]]:
+    parts = max(1, min(parts, len(records)))
+    size, extra = divmod(len(records), parts)
+    chunks: list[list[T]] = []
+    start = 0
+    for idx in range(parts):
+        end = start + size + (idx < extra)
+        chunks.append(records[start:end])
+        start = end
+    return chunks
+
+
+def _envelope(records: list[Any]) -> dict[str, Any]:
+    return {"success": True, "data": {"object": "list", "data": records}}
+
+
+def _validate_records(validator: LazyAdapter[Any], records: list[Any]) -> list[Any]:
+    return validator.validate_python(_envelope(records)).data.data
+
+
+class ParallelAdapter(LazyAdapter[T]):
+    __slots__ = ("inner", "parser")
+
+    def __init__(self, inner: LazyAdapter[T], parser: ParallelParser):
+        super().__init__(inner._tp)
+        self.inner = inner
+        self.parser = parser
+
+    @property
+    def is_built(self) -> bool:
+        return self.inner.is_built
+
+    def validate_python(self, obj: Any, /) -> T:
+        return self.inner.validate_python(obj)
+
+    def validate_json(self, data: str | bytes, /) -> T:
+        if self.parser.mode == "serial" or len(data) < self.parser.threshold or self.parser.workers < 2:
+            return self.inner.validate_json(data)
+        raw = json.loads(data)
+        body = raw.get("data") if isinstance(raw, dict) and raw.get("success") is True else None
+        records = body.get("data") if isinstance(body, dict) else None
+        if not isinstance(body, dict) or not isinstance(records, list) or len(records) < 2:
+            return self.inner.validate_json(data)
+        resp: Any = self.inner.validate_python({**raw, "data": {**body, "data": []}})
+        resp.data.data = self.parser.validate(self.inner, records)
+        return resp
+
+
+class ParallelParser:
+    def __init__(self, workers: int | None = None, threshold: int = DEFAULT_THRESHOLD, mode: Mode = "auto"):
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self.mode: Mode = ("thread" if free_threaded() else "serial") if mode == "auto" else mode
+        self._pool: ThreadPoolExecutor | None = None
+        self._adapters: dict[int, ParallelAdapter[Any]] = {}
+        self._lock = threading.Lock()
+
+    def adapter(self, validator: LazyAdapter[T]) -> ParallelAdapter[T]:
+        with self._lock:
+            wrapped = self._adapters.get(id(validator))
+            if wrapped is None:
+                wrapped = self._adapters[id(validator)] = ParallelAdapter(validator, self)
+            return wrapped
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+    def validate(self, validator: LazyAdapter[Any], records: list[Any]) -> list[Any]:
+        if self.mode == "serial":
+            return _validate_records(validator, records)
+        chunks = split(records, self.workers * CHUNKS_PER_WORKER)
+        parts = self.pool.map(_validate_records, [validator] * len(chunks), chunks)
+        out: list[Any] = []
+        for part in parts:
+            out.extend(part)
+        return out
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc: Any):
+        self.close()
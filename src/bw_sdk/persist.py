@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import bw_sdk.model as _m
+from bw_sdk.snapshot import VaultSnapshot
+
+if TYPE_CHECKING:
+    from bw_sdk import Client
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"BWSNAP"
+VERSION = 2
+NONCE_SIZE = 12
+
+_HEADER = struct.Struct(">6sBI")
+
+
+def _aesgcm(key: bytes) -> Any:
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError as exc:
+        raise Exception("encrypted snapshots need the 'cryptography' package [pip install bw-sdk[crypto]]") from exc
+    return AESGCM(key)
+
+
+def generate_key() -> bytes:
+    return os.urandom(32)
+
+
+@dataclasses.dataclass(frozen=True)
+class SnapshotMeta:
+    last_sync: datetime | None
+    user_id: _m.UserID | None
+    items: int
+    version: int = VERSION
+
+    def dump(self) -> bytes:
+        return json.dumps(
+            {
+                "version": self.version,
+                "lastSync": None if self.last_sync is None else self.last_sync.isoformat(),
+                "userId": self.user_id,
+                "items": self.items,
+            },
+            sort_keys=True,
+        ).encode()
+
+    @classmethod
+    def load(cls, data: bytes):
+        raw = json.loads(data)
+        last_sync = None if raw["lastSync"] is None else datetime.fromisoformat(raw["lastSync"])
+        return cls(last_sync, raw["userId"], raw["items"], raw["version"])
+
+
+def _unpack(blob: bytes):
+    if len(blob) < _HEADER.size:
+        raise ValueError("not a vault snapshot")
+    magic, version, size = _HEADER.unpack_from(blob)
+    if magic != MAGIC:
+        raise ValueError("not a vault snapshot")
+    header = blob[_HEADER.size : _HEADER.size + size]
+    body = blob[_HEADER.size + size :]
+    return version, header, body
+
+
+def _split(blob: bytes):
+    version, header, body = _unpack(blob)
+    if version != VERSION:
+        raise ValueError(f"unsupported vault snapshot version [{version}]")
+    return header, body
+
+
+def dumps_snapshot(snapshot: VaultSnapshot, key: bytes, user_id: _m.UserID | None = None) -> bytes:
+    meta = SnapshotMeta(snapshot.last_sync, user_id, len(snapshot))
+    header = meta.dump()
+    payload = zlib.compress(json.dumps(snapshot.to_records(), separators=(",", ":")).encode(), 1)
+    nonce = os.urandom(NONCE_SIZE)
+    sealed = _aesgcm(key).encrypt(nonce, payload, header)
+    return _HEADER.pack(MAGIC, VERSION, len(header)) + header + nonce + sealed
+
+
+def loads_snapshot(blob: bytes, key: bytes, user_id: _m.UserID | None = None) -> tuple[VaultSnapshot, SnapshotMeta]:
+    header, body = _split(blob)
+    meta = SnapshotMeta.load(header)
+    if user_id is not None and meta.user_id != user_id:
+        raise ValueError("vault snapshot belongs to another user")
+    aead = _aesgcm(key)
+    try:
+        payload = aead.decrypt(body[:NONCE_SIZE], body[NONCE_SIZE:], header)
+    except Exception as exc:
+        raise ValueError("vault snapshot could not be decrypted [wrong key or tampered file]") from exc
+    return VaultSnapshot.from_records(json.loads(zlib.decompress(payload)), meta.last_sync), meta
+
+
+def read_meta(path: Path) -> SnapshotMeta:
+    with open(path, "rb") as fh:
+        head = fh.read(_HEADER.size)
+        size = _HEADER.unpack(head)[2] if len(head) == _HEADER.size else 0
+        header, _ = _split(head + fh.read(size))
+    return SnapshotMeta.load(header)
+
+
+def save_snapshot(snapshot: VaultSnapshot, path: Path, key: bytes, user_id: _m.UserID | None = None):
+    blob = dumps_snapshot(snapshot, key, user_id)
+    path = Path(path)
+    fd, name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(blob)
+        os.replace(name, path)
+    finally:
+        Path(name).unlink(missing_ok=True)
+
+
+def load_snapshot(path: Path, key: bytes, user_id: _m.UserID | None = None) -> tuple[VaultSnapshot, SnapshotMeta]:
+    return loads_snapshot(Path(path).read_bytes(), key, user_id)
+
+
+def warm_start(
+    client: Client, path: Path, key: bytes, background: bool = True
+) -> tuple[VaultSnapshot, threading.Thread | None]:
+    _aesgcm(key)
+    path = Path(path)
+    status = client.get_status()
+    snapshot = None
+    blob = path.read_bytes() if path.exists() else None
+    if blob is not None:
+        try:
+            snapshot, _ = loads_snapshot(blob, key, status.userId)
+        except (ValueError, KeyError, TypeError, struct.error, zlib.error) as exc:
+            logger.warning("vault snapshot %s unusable, rebuilding: %s", path, exc)
+    if snapshot is None:
+        snapshot = VaultSnapshot.from_client(client)
+        save_snapshot(snapshot, path, key, status.userId)
+        return snapshot, None
+
+    def refresh():
+        last_sync = snapshot.last_sync
+        if snapshot.refresh(client) or snapshot.last_sync != last_sync:
+            save_snapshot(snapshot, path, key, status.userId)
+
+    if not background:
+        refresh()
+        return snapshot, None
+    thread = threading.Thread(target=refresh, daemon=True)
+    thread.start()
+    return snapshot, thread
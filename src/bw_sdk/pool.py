@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable
+
+import httpx
+
+from bw_sdk.model import DBStatus
+
+if TYPE_CHECKING:
+    from bw_sdk import Client
+
+BROADCAST = {"/unlock", "/lock", "/sync"}
+
+
+@dataclasses.dataclass(eq=False)
+class Backend:
+    client: Client
+    outstanding: int = 0
+    served: int = 0
+    healthy: bool = True
+    unlocked: bool | None = None
+    stale: bool = False
+    missed: str | None = None
+    checked_at: float | None = None
+    error: str | None = None
+
+    @property
+    def url(self):
+        return str(self.client.http_client.base_url)
+
+    def check(self, now: float):
+        self.checked_at = now
+        try:
+            self.unlocked = self.client.get_status().status == DBStatus.Unlocked
+            if self.missed == "/lock" and self.unlocked:
+                self.client.lock()
+                self.unlocked = False
+            if self.missed == "/lock" or (self.missed == "/unlock" and self.unlocked):
+                self.missed = None
+            if self.stale and self.unlocked:
+                self.client.sync()
+                self.stale = False
+            self.healthy = True
+            self.error = None
+        except Exception as exc:
+            self.healthy = False
+            self.error = str(exc) or type(exc).__name__
+
+    def send(self, request: httpx.Request) -> httpx.Response:
+        http = self.client.http_client
+        headers = {k: v for k, v in request.headers.items() if k.lower() in ("content-type", "accept")}
+        req = http.build_request(
+            request.method, request.url.path, params=request.url.params, content=request.content, headers=headers
+        )
+        res = http.send(req)
+        return httpx.Response(res.status_code, content=res.content, headers={"content-type": "application/json"})
+
+
+class BackendPool(httpx.BaseTransport):
+    def __init__(
+        self,
+        backends: Iterable[Client],
+        health_interval: float = 5.0,
+        sync_after_write: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.backends = [Backend(x) for x in backends]
+        if not self.backends:
+            raise Exception("backend pool needs at least one backend")
+        self.health_interval = health_interval
+        self.sync_after_write = sync_after_write
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._rotation = itertools.count()
+
+    def check_health(self):
+        now = self.clock()
+        for backend in self.backends:
+            backend.check(now)
+        return [x for x in self.backends if x.healthy]
+
+    def _recheck(self):
+        now = self.clock()
+        with self._lock:
+            due = [x for x in self.backends if x.checked_at is None or now - x.checked_at >= self.health_interval]
+            for backend in due:
+                backend.checked_at = now
+        for backend in due:
+            backend.check(now)
+
+    def _acquire(self, exclude: set[Backend]) -> Backend:
+        self._recheck()
+        with self._lock:
+            live = [x for x in self.backends if x.healthy and x.missed is None and x not in exclude]
+            if not live:
+                raise Exception("no healthy bw serve backend")
+            unlocked = [x for x in live if x.unlocked is not False]
+            preferred = [x for x in unlocked if not x.stale] or unlocked or live
+            start = next(self._rotation) % len(preferred)
+            rotated = preferred[start:] + preferred[:start]
+            backend = min(rotated, key=lambda x: x.outstanding)
+            backend.outstanding += 1
+            return backend
+
+    def _release(self, backend: Backend):
+        with self._lock:
+            backend.outstanding -= 1
+            backend.served += 1
+
+    def _fail(self, backend: Backend, exc: Exception):
+        backend.healthy = False
+        backend.error = str(exc) or type(exc).__name__
+        backend.checked_at = self.clock()
+
+    def _send(self, backend: Backend, request: httpx.Request):
+        try:
+            return backend.send(request)
+        except httpx.TransportError as exc:
+            self._fail(backend, exc)
+            raise
+
+    def _read(self, request: httpx.Request):
+        tried: set[Backend] = set()
+        while True:
+            backend = self._acquire(tried)
+            try:
+                return self._send(backend, request)
+            except httpx.TransportError:
+                tried.add(backend)
+                if len(tried) == len(self.backends):
+                    raise
+            finally:
+                self._release(backend)
+
+    def _broadcast(self, request: httpx.Request):
+        strict = request.url.path in ("/unlock", "/lock")
+        first: httpx.Response | None = None
+        failed: httpx.Response | None = None
+        error: Exception | None = None
+        for backend in self.backends:
+            was_healthy = backend.healthy
+            try:
+                res = self._send(backend, request)
+            except httpx.TransportError as exc:
+                if strict:
+                    backend.missed = request.url.path
+                    if was_healthy:
+                        raise Exception(f"{request.url.path} failed on {backend.url}: {exc}") from exc
+                error = exc
+                continue
+            backend.healthy = True
+            if res.status_code == 200 and not strict:
+                backend.stale = False
+            elif strict and res.status_code == 200:
+                backend.unlocked = request.url.path == "/unlock"
+                backend.missed = None
+            elif strict and failed is None:
+                failed = res
+            if first is None or (first.status_code != 200 and res.status_code == 200):
+                first = res
+        if failed is not None:
+            return failed
+        if first is None:
+            raise error or Exception("no healthy bw serve backend")
+        return first
+
+    def _write(self, request: httpx.Request):
+        backend = self._acquire(set())
+        try:
+            res = self._send(backend, request)
+        finally:
+            self._release(backend)
+        if res.status_code >= 400:
+            return res
+        others = [x for x in self.backends if x is not backend]
+        with self._lock:
+            for other in others:
+                other.stale = True
+        if self.sync_after_write:
+            sync = httpx.Request("POST", request.url.copy_with(path="/sync", query=None))
+            for other in others:
+                if not other.healthy:
+                    continue
+                try:
+                    synced = self._send(other, sync).status_code == 200
+                except httpx.TransportError:
+                    continue
+                if synced:
+                    other.stale = False
+        return res
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            return self._read(request)
+        if request.url.path in BROADCAST:
+            return self._broadcast(request)
+        return self._write(request)
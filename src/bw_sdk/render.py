@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Iterable, Iterator
+
+from pydantic import SecretStr
+
+from bw_sdk.resolve import AsyncResolver, Resolved, Resolver
+
+if TYPE_CHECKING:
+    from bw_sdk import AsyncClient, Client
+
+type Source = str | os.PathLike[str] | IO[str]
+type Token = tuple[bool, str]
+
+PLACEHOLDER = re.compile(r"\{\{\s*bw:\s*(.*?)\s*\}\}")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+MAX_PLACEHOLDER = 1024
+
+
+def _carry_start(buf: str, pos: int) -> int:
+    open_at = buf.rfind("{{", pos)
+    if open_at != -1 and len(buf) - open_at <= MAX_PLACEHOLDER:
+        return open_at
+    if buf.endswith("{") and len(buf) - 1 >= pos:
+        return len(buf) - 1
+    return len(buf)
+
+
+def tokenize(chunks: Iterable[str]) -> Iterator[Token]:
+    carry = ""
+    for chunk in chunks:
+        buf = carry + chunk
+        pos = 0
+        for match in PLACEHOLDER.finditer(buf):
+            if match.start() > pos:
+                yield False, buf[pos : match.start()]
+            yield True, match.group(1)
+            pos = match.end()
+        cut = _carry_start(buf, pos)
+        if cut > pos:
+            yield False, buf[pos:cut]
+        carry = buf[cut:]
+    if carry:
+        yield False, carry
+
+
+def read_chunks(fh: IO[str] | _Source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    while chunk := fh.read(chunk_size):
+        yield chunk
+
+
+@dataclasses.dataclass
+class RenderReport:
+    placeholders: int = 0
+    refs: int = 0
+    written: int = 0
+    calls: int = 0
+    errors: dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+class _Source:
+    def __init__(self, fh: IO[str], spool: IO[str] | None = None):
+        self.fh = fh
+        self.spool = spool
+        self.start = fh.tell() if spool is None else 0
+
+    def read(self, size: int) -> str:
+        chunk = self.fh.read(size)
+        if self.spool is not None:
+            self.spool.write(chunk)
+        return chunk
+
+    def rewind(self) -> IO[str]:
+        if self.spool is None:
+            self.fh.seek(self.start)
+            return self.fh
+        self.spool.seek(0)
+        return self.spool
+
+
+@contextlib.contextmanager
+def _open_source(src: Source, chunk_size: int):
+    if isinstance(src, (str, os.PathLike)):
+        with open(src, encoding="utf-8", newline="") as fh:
+            yield _Source(fh)
+    elif src.seekable():
+        yield _Source(src)
+    else:
+        with tempfile.SpooledTemporaryFile(max_size=chunk_size * 16, mode="w+", encoding="utf-8", newline="") as spool:
+            yield _Source(src, spool)
+
+
+@contextlib.contextmanager
+def _open_dest(dst: Source):
+    if not isinstance(dst, (str, os.PathLike)):
+        yield dst
+        return
+    path = Path(dst)
+    fd, name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    tmp = Path(name)
+    try:
+        with contextlib.suppress(FileNotFoundError):
+            os.fchmod(fd, path.stat().st_mode & 0o7777)
+        with open(fd, "w", encoding="utf-8", newline="") as fh:
+            yield fh
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _collect(fh: _Source, chunk_size: int, report: RenderReport) -> list[str]:
+    refs: dict[str, None] = {}
+    for is_ref, text in tokenize(read_chunks(fh, chunk_size)):
+        if is_ref:
+            report.placeholders += 1
+            refs[text] = None
+    report.refs = len(refs)
+    return list(refs)
+
+
+def _check(resolved: Resolved, strict: bool, report: RenderReport):
+    report.calls = resolved.calls
+    report.errors = resolved.errors
+    if strict:
+        resolved.unwrap()
+
+
+def _substitute(tokens: Iterable[Token], values: dict[str, SecretStr]) -> Iterator[str]:
+    for is_ref, text in tokens:
+        if not is_ref:
+            yield text
+            continue
+        secret = values.get(text)
+        yield "{{ bw:" + text + " }}" if secret is None else secret.get_secret_value()
+
+
+def _write(fh: IO[str], out: IO[str], chunk_size: int, values: dict[str, SecretStr], report: RenderReport):
+    for text in _substitute(tokenize(read_chunks(fh, chunk_size)), values):
+        out.write(text)
+        report.written += len(text)
+
+
+class Renderer:
+    def __init__(
+        self,
+        client: Client,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        strict: bool = True,
+        resolver: Resolver | None = None,
+    ):
+        self.client = client
+        self.chunk_size = chunk_size
+        self.strict = strict
+        self.resolver = resolver or Resolver(client)
+
+    def render(self, src: Source, dst: Source) -> RenderReport:
+        report = RenderReport()
+        with _open_source(src, self.chunk_size) as source:
+            refs = _collect(source, self.chunk_size, report)
+            resolved = self.resolver.resolve(refs) if refs else Resolved()
+            _check(resolved, self.strict, report)
+            with _open_dest(dst) as out:
+                _write(source.rewind(), out, self.chunk_size, resolved.values, report)
+        return report
+
+    def render_string(self, text: str) -> str:
+        refs = list(dict.fromkeys(x for is_ref, x in tokenize([text]) if is_ref))
+        resolved = self.resolver.resolve(refs) if refs else Resolved()
+        _check(resolved, self.strict, RenderReport())
+        return "".join(_substitute(tokenize([text]), resolved.values))
+
+
+class AsyncRenderer:
+    def __init__(
+        self,
+        client: AsyncClient,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        strict: bool = True,
+        resolver: AsyncResolver | None = None,
+    ):
+        self.client = client
+        self.chunk_size = chunk_size
+        self.strict = strict
+        self.resolver = resolver or AsyncResolver(client)
+
+    async def render(self, src: Source, dst: Source) -> RenderReport:
+        report = RenderReport()
+        with _open_source(src, self.chunk_size) as source:
+            refs = _collect(source, self.chunk_size, report)
+            resolved = await self.resolver.resolve(refs) if refs else Resolved()
+            _check(resolved, self.strict, report)
+            with _open_dest(dst) as out:
+                _write(source.rewind(), out, self.chunk_size, resolved.values, report)
+        return report
+
+    async def render_string(self, text: str) -> str:
+        refs = list(dict.fromkeys(x for is_ref, x in tokenize([text]) if is_ref))
+        resolved = await self.resolver.resolve(refs) if refs else Resolved()
+        _check(resolved, self.strict, RenderReport())
+        return "".join(_substitute(tokenize([text]), resolved.values))
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import dataclasses
+import re
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable
+
+from pydantic import SecretStr
+
+import bw_sdk.model as _m
+from bw_sdk.bulk import DEFAULT_CONCURRENCY, ItemResult
+
+if TYPE_CHECKING:
+    from bw_sdk import AsyncClient, Client
+
+type FieldMap = dict[str, SecretStr | None]
+
+UUID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+
+DEFAULT_ID_THRESHOLD = 8
+
+NAME_SPECIAL = "\\/#"
+FIELD_SPECIAL = "\\#"
+CUSTOM_PREFIX = "fields."
+
+DEFAULT_FIELDS: dict[type[_m.ItemTemplate], str] = {
+    _m.ItemLogin: "password",
+    _m.ItemSecureNote: "notes",
+    _m.ItemCard: "number",
+}
+
+
+def _secret(value: str | SecretStr | None) -> SecretStr | None:
+    if value is None or isinstance(value, SecretStr):
+        return value
+    return SecretStr(value)
+
+
+def _escape(text: str, special: str) -> str:
+    escaped = "".join(f"\\{x}" if x in special else x for x in text)
+    if escaped[:1].isspace():
+        escaped = f"\\{escaped}"
+    if escaped[-1:].isspace():
+        escaped = f"{escaped[:-1]}\\{escaped[-1]}"
+    return escaped
+
+
+@dataclasses.dataclass(frozen=True)
+class SecretRef:
+    item: str
+    field: str | None = None
+    folder: str | None = None
+
+    @classmethod
+    def parse(cls, ref: str):
+        parts = [""]
+        field: str | None = None
+        escaped = spaced = after_sep = False
+        text = ref.strip()
+        if (len(text) - len(text.rstrip("\\"))) % 2:
+            text = ref.lstrip()[: len(text) + 1]
+        for char in text:
+            if not escaped and char == "\\":
+                escaped = True
+                continue
+            sep = not escaped and (char == "#" or (char == "/" and field is None))
+            space = not escaped and char.isspace()
+            if (sep and (spaced or (char == "#" and field is not None))) or (space and after_sep):
+                raise Exception(f"ambiguous secret reference [{ref}], escape '#' and '/' in names as '\\#' and '\\/'")
+            escaped, spaced, after_sep = False, space, sep
+            if sep and char == "#":
+                field = ""
+            elif sep:
+                parts.append("")
+            elif field is not None:
+                field += char
+            else:
+                parts[-1] += char
+        name = parts.pop()
+        if escaped or not name or field == "" or not all(parts):
+            raise Exception(f"invalid secret reference [{ref}]")
+        return cls(name, field, "/".join(parts) or None)
+
+    @property
+    def by_id(self):
+        return self.folder is None and UUID_RE.match(self.item) is not None
+
+    def __str__(self):
+        path = _escape(self.item, NAME_SPECIAL)
+        if self.folder is not None:
+            path = f"{_escape(self.folder, FIELD_SPECIAL)}/{path}"
+        return path if self.field is None else f"{path}#{_escape(self.field, FIELD_SPECIAL)}"
+
+
+class FieldIndex:
+    def __init__(self):
+        self._maps: dict[_m.ItemID, tuple[datetime, FieldMap]] = {}
+        self.builds = 0
+
+    def __len__(self):
+        return len(self._maps)
+
+    def get(self, item: _m.Item) -> FieldMap:
+        cached = self._maps.get(item.id)
+        if cached is not None and cached[0] == item.revised_at:
+            return cached[1]
+        fields = self._build(item)
+        self._maps[item.id] = (item.revised_at, fields)
+        self.builds += 1
+        return fields
+
+    def _build(self, item: _m.Item) -> FieldMap:
+        builtin: dict[str, str | SecretStr | None] = {"name": item.name, "notes": item.notes}
+        match item:
+            case _m.ItemLogin(login=login):
+                uris = [x.uri for x in login.uris or () if x.uri]
+                builtin.update(username=login.username, password=login.password, totp=login.totp)
+                builtin["uri"] = uris[0] if uris else None
+            case _m.ItemCard(card=card):
+                builtin.update(card.model_dump())
+            case _m.ItemIdentity(identity=identity):
+                builtin.update(identity.model_dump())
+        custom: dict[str, str | SecretStr | None] = {}
+        for field in item.fields:
+            if field.name is None or field.name in custom:
+                continue
+            match field:
+                case _m.FieldBool(value=value):
+                    custom[field.name] = "true" if value else "false"
+                case _m.FieldLink(linkedId=target):
+                    custom[field.name] = builtin.get(target.name.lower())
+                case _:
+                    custom[field.name] = field.value
+        fields = {key: _secret(raw) for key, raw in builtin.items()}
+        for name, raw in custom.items():
+            fields.setdefault(name, _secret(raw))
+            fields[f"{CUSTOM_PREFIX}{name}"] = _secret(raw)
+        return fields
+
+
+@dataclasses.dataclass
+class Plan:
+    refs: dict[str, SecretRef]
+    errors: dict[str, str]
+    ids: list[_m.ItemID]
+    list_items: bool
+    list_folders: bool
+
+    @property
+    def calls(self):
+        return int(self.list_folders) + (1 if self.list_items else len(self.ids))
+
+
+def plan(refs: Iterable[str | SecretRef], id_threshold: int = DEFAULT_ID_THRESHOLD) -> Plan:
+    parsed: dict[str, SecretRef] = {}
+    errors: dict[str, str] = {}
+    for ref in refs:
+        key = str(ref)
+        if key in parsed or key in errors:
+            continue
+        try:
+            parsed[key] = ref if isinstance(ref, SecretRef) else SecretRef.parse(ref)
+        except Exception as exc:
+            errors[key] = str(exc)
+    ids = list(dict.fromkeys(_m.ItemID(x.item) for x in parsed.values() if x.by_id))
+    by_name = any(not x.by_id for x in parsed.values())
+    list_folders = any(x.folder is not None for x in parsed.values())
+    return Plan(parsed, errors, ids, by_name or len(ids) > id_threshold, list_folders)
+
+
+@dataclasses.dataclass
+class Resolved:
+    values: dict[str, SecretStr] = dataclasses.field(default_factory=dict)
+    errors: dict[str, str] = dataclasses.field(default_factory=dict)
+    calls: int = 0
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def unwrap(self) -> dict[str, SecretStr]:
+        if self.errors:
+            details = "; ".join(f"{key}: {msg}" for key, msg in self.errors.items())
+            raise Exception(f"unresolved secret references [{details}]")
+        return self.values
+
+
+class _Lookup:
+    def __init__(self, items: Iterable[_m.Item], folders: Iterable[_m.Folder], failed: dict[_m.ItemID, str]):
+        self.by_id: dict[_m.ItemID, _m.Item] = {}
+        self.by_name: dict[str, list[_m.Item]] = {}
+        self.folders: dict[str, list[_m.FolderID]] = {}
+        self.failed = failed
+        for item in items:
+            self.by_id[item.id] = item
+            self.by_name.setdefault(item.name, []).append(item)
+        for folder in folders:
+            self.folders.setdefault(folder.name, []).append(folder.id)
+
+    def find(self, ref: SecretRef) -> _m.Item:
+        if ref.by_id:
+            item = self.by_id.get(_m.ItemID(ref.item))
+            if item is None:
+                raise Exception(self.failed.get(_m.ItemID(ref.item), "item not found"))
+            return item
+        found = self.by_name.get(ref.item, [])
+        if ref.folder is not None:
+            folder_ids = self.folders.get(ref.folder)
+            if not folder_ids:
+                raise Exception(f"folder [{ref.folder}] not found")
+            found = [x for x in found if x.folder_id in folder_ids]
+        if not found:
+            raise Exception("item not found")
+        if len(found) > 1:
+            raise Exception(f"ambiguous reference [{len(found)} items named {ref.item!r}]")
+        return found[0]
+
+
+def _resolve_one(ref: SecretRef, lookup: _Lookup, index: FieldIndex) -> SecretStr:
+    item = lookup.find(ref)
+    field = ref.field or DEFAULT_FIELDS.get(type(item))
+    if field is None:
+        raise Exception(f"{type(item).__name__} has no default field, name one")
+    fields = index.get(item)
+    if field not in fields:
+        raise Exception(f"field [{field}] not found on item {item.id}")
+    value = fields[field]
+    if value is None:
+        raise Exception(f"field [{field}] is empty on item {item.id}")
+    return value
+
+
+def _finish(work: Plan, lookup: _Lookup, index: FieldIndex) -> Resolved:
+    res = Resolved(errors=dict(work.errors), calls=work.calls)
+    for key, ref in work.refs.items():
+        try:
+            res.values[key] = _resolve_one(ref, lookup, index)
+        except Exception as exc:
+            res.errors[key] = str(exc)
+    return res
+
+
+def _fetched(results: list[ItemResult]):
+    items = [x.item for x in results if x.item is not None]
+    failed = {x.id: str(x.error) for x in results if x.error is not None}
+    return items, failed
+
+
+class Resolver:
+    def __init__(
+        self,
+        client: Client,
+        id_threshold: int = DEFAULT_ID_THRESHOLD,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        index: FieldIndex | None = None,
+    ):
+        self.client = client
+        self.id_threshold = id_threshold
+        self.max_concurrency = max_concurrency
+        self.index = index or FieldIndex()
+
+    def resolve(self, refs: Iterable[str | SecretRef]) -> Resolved:
+        work = plan(refs, self.id_threshold)
+        folders = self.client.get_folders() if work.list_folders else []
+        failed: dict[_m.ItemID, str] = {}
+        if work.list_items:
+            items = self.client.get_items()
+        else:
+            items, failed = _fetched(self.client.get_items_by_id(work.ids, self.max_concurrency))
+        return _finish(work, _Lookup(items, folders, failed), self.index)
+
+
+class AsyncResolver:
+    def __init__(
+        self,
+        client: AsyncClient,
+        id_threshold: int = DEFAULT_ID_THRESHOLD,
+        max_concurrency: int = DEFAULT_CONCURRENCY,
+        index: FieldIndex | None = None,
+    ):
+        self.client = client
+        self.id_threshold = id_threshold
+        self.max_concurrency = max_concurrency
+        self.index = index or FieldIndex()
+
+    async def resolve(self, refs: Iterable[str | SecretRef]) -> Resolved:
+        work = plan(refs, self.id_threshold)
+        folders = await self.client.get_folders() if work.list_folders else []
+        failed: dict[_m.ItemID, str] = {}
+        if work.list_items:
+            items = await self.client.get_items()
+        else:
+            items, failed = _fetched(await self.client.get_items_by_id(work.ids, self.max_concurrency))
+        return _finish(work, _Lookup(items, folders, failed), self.index)
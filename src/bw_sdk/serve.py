@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Mapping, Sequence
+
+import httpx
+from pydantic import SecretStr
+
+from bw_sdk.model import DBStatus
+
+if TYPE_CHECKING:
+    from bw_sdk import Client
+
+
+def free_port(host: str = "127.0.0.1") -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+@dataclasses.dataclass(eq=False)
+class ServeProcess:
+    proc: subprocess.Popen[bytes]
+    client: Client
+    port: int
+    appdata: Path
+
+    @property
+    def alive(self):
+        return self.proc.poll() is None
+
+    def stop(self, timeout: float = 5.0):
+        if self.alive:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        self.client.http_client.close()
+
+
+class ServeManager:
+    def __init__(
+        self,
+        command: Sequence[str] = ("bw",),
+        password: SecretStr | None = None,
+        size: int = 1,
+        standby: int = 1,
+        host: str = "127.0.0.1",
+        appdata_root: Path | None = None,
+        seed_appdata: Path | None = None,
+        env: Mapping[str, str] | None = None,
+        ready_timeout: float = 30.0,
+    ):
+        if size < 1 or standby < 0:
+            raise Exception("serve manager needs size >= 1 and standby >= 0")
+        self.command = list(command)
+        self.password = password
+        self.size = size
+        self.standby_size = standby
+        self.host = host
+        self.appdata_root = appdata_root
+        self.seed_appdata = seed_appdata
+        self.env = dict(env or {})
+        self.ready_timeout = ready_timeout
+        self.active: list[ServeProcess] = []
+        self.standby: list[ServeProcess] = []
+        self.restarts = 0
+        self._lock = threading.Lock()
+        self._rotation = itertools.count()
+        self._refills: list[threading.Thread] = []
+        self._refill_error: Exception | None = None
+        self._closed = False
+
+    # region Processes
+
+    def _appdata(self):
+        root = self.appdata_root or Path(tempfile.gettempdir())
+        root.mkdir(parents=True, exist_ok=True)
+        path = Path(tempfile.mkdtemp(prefix="bw-serve-", dir=root))
+        if self.seed_appdata is not None:
+            shutil.copytree(self.seed_appdata, path, dirs_exist_ok=True)
+        return path
+
+    def _wait_ready(self, served: ServeProcess):
+        deadline = time.monotonic() + self.ready_timeout
+        while True:
+            if not served.alive:
+                raise Exception(f"bw serve exited during startup [code {served.proc.returncode}]")
+            try:
+                return served.client.get_status()
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    raise Exception(f"bw serve not ready after {self.ready_timeout}s [port {served.port}]")
+                time.sleep(0.05)
+
+    def _spawn(self) -> ServeProcess:
+        from bw_sdk import Client
+
+        port = free_port(self.host)
+        appdata = self._appdata()
+        env = {**os.environ, **self.env, "BITWARDENCLI_APPDATA_DIR": str(appdata)}
+        proc = subprocess.Popen(
+            [*self.command, "serve", "--hostname", self.host, "--port", str(port)],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        client = Client(http_client=httpx.Client(base_url=f"http://{self.host}:{port}"))
+        served = ServeProcess(proc, client, port, appdata)
+        try:
+            status = self._wait_ready(served)
+            if status.status == DBStatus.Locked and self.password is not None:
+                client.unlock(self.password)
+        except BaseException:
+            self._discard(served)
+            raise
+        return served
+
+    def _discard(self, served: ServeProcess):
+        served.stop()
+        if self.appdata_root is None:
+            shutil.rmtree(served.appdata, ignore_errors=True)
+
+    def _refill(self):
+        while True:
+            with self._lock:
+                if self._closed or len(self.standby) + self._pending() >= self.standby_size:
+                    return
+            try:
+                served = self._spawn()
+            except Exception as exc:
+                with self._lock:
+                    self._refill_error = exc
+                return
+            with self._lock:
+                closed = self._closed
+                if not closed:
+                    self.standby.append(served)
+            if closed:
+                self._discard(served)
+                return
+
+    def _pending(self):
+        return sum(1 for x in self._refills if x.is_alive() and x is not threading.current_thread())
+
+    def _refill_async(self):
+        thread = threading.Thread(target=self._refill, daemon=True)
+        self._refills = [x for x in self._refills if x.is_alive()] + [thread]
+        thread.start()
+
+    # endregion
+
+    def start(self):
+        count = self.size + self.standby_size
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            futures = [pool.submit(self._spawn) for _ in range(count)]
+        spawned = [x.result() for x in futures if x.exception() is None]
+        errors = [exc for exc in (x.exception() for x in futures) if exc is not None]
+        if errors:
+            for served in spawned:
+                self._discard(served)
+            raise errors[0]
+        with self._lock:
+            self._closed = False
+            self.active = spawned[: self.size]
+            self.standby = spawned[self.size :]
+        return self
+
+    def check(self):
+        with self._lock:
+            dead = [x for x in self.active if not x.alive]
+            dead_standby = [x for x in self.standby if not x.alive]
+            self.standby = [x for x in self.standby if x.alive]
+            for served in dead:
+                self.active.remove(served)
+                self.restarts += 1
+                if self.standby:
+                    self.active.append(self.standby.pop(0))
+            missing = self.size - len(self.active)
+        for served in dead + dead_standby:
+            self._discard(served)
+        for _ in range(missing):
+            served = self._spawn()
+            with self._lock:
+                self.active.append(served)
+        if self.standby_size:
+            with self._lock:
+                if len(self.standby) + self._pending() < self.standby_size:
+                    self._refill_async()
+        return len(dead)
+
+    def wait_standby(self, timeout: float = 30.0):
+        deadline = time.monotonic() + timeout
+        while len(self.standby) < self.standby_size:
+            with self._lock:
+                error, self._refill_error = self._refill_error, None
+            if error is not None:
+                raise error
+            if time.monotonic() > deadline:
+                raise Exception("standby bw serve not ready")
+            time.sleep(0.01)
+
+    def client(self) -> Client:
+        self.check()
+        with self._lock:
+            if not self.active:
+                raise Exception("no running bw serve process")
+            return self.active[next(self._rotation) % len(self.active)].client
+
+    def stop(self):
+        with self._lock:
+            self._closed = True
+            running = self.active + self.standby
+            self.active, self.standby = [], []
+        for thread in self._refills:
+            thread.join()
+        with self._lock:
+            running += self.standby
+            self.standby = []
+        for served in running:
+            self._discard(served)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_: object):
+        self.stop()
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable
+
+from pydantic import SecretStr
+
+from bw_sdk.model import DBStatus
+
+if TYPE_CHECKING:
+    from bw_sdk import AsyncClient, Client
+
+DEFAULT_IDLE_TIMEOUT = 30.0
+DEFAULT_MAX_STALENESS = 300.0
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+def _is_stale(last_sync: datetime | None, now: datetime, max_staleness: float):
+    if last_sync is None:
+        return True
+    if last_sync.tzinfo is None:
+        last_sync = last_sync.replace(tzinfo=timezone.utc)
+    return now - last_sync > timedelta(seconds=max_staleness)
+
+
+class SessionManager:
+    def __init__(
+        self,
+        client: Client,
+        password: SecretStr | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_staleness: float | None = DEFAULT_MAX_STALENESS,
+        now: Callable[[], datetime] = _utcnow,
+    ):
+        self.client = client
+        self.password = password
+        self.idle_timeout = idle_timeout
+        self.max_staleness = max_staleness
+        self.now = now
+        self.refs = 0
+        self.unlocks = 0
+        self.syncs = 0
+        self.last_sync: datetime | None = None
+        self._owns_unlock = False
+        self._timer: threading.Timer | None = None
+        self._lock = threading.RLock()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _ensure_unlocked(self):
+        status = self.client.get_status()
+        self.last_sync = status.lastSync
+        if status.status == DBStatus.Locked:
+            if self.password is None:
+                raise Exception("locked bw and no password")
+            self.client.unlock(self.password)
+            self.unlocks += 1
+            self._owns_unlock = True
+
+    def _ensure_fresh(self):
+        if self.max_staleness is None or not _is_stale(self.last_sync, self.now(), self.max_staleness):
+            return
+        self.client.sync()
+        self.syncs += 1
+        self.last_sync = self.client.get_status().lastSync
+
+    def acquire(self) -> Client:
+        with self._lock:
+            self._cancel_timer()
+            if self.refs == 0:
+                self._ensure_unlocked()
+            self._ensure_fresh()
+            self.refs += 1
+            return self.client
+
+    def release(self):
+        with self._lock:
+            if self.refs == 0:
+                raise Exception("session released more often than acquired")
+            self.refs -= 1
+            if self.refs > 0 or not self._owns_unlock:
+                return
+            if self.idle_timeout <= 0:
+                self._expire()
+                return
+            self._timer = threading.Timer(self.idle_timeout, self._on_idle)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_idle(self):
+        with self._lock:
+            if self.refs == 0 and self._timer is not None and self._timer is threading.current_thread():
+                self._timer = None
+                self._expire()
+
+    def _expire(self):
+        if self._owns_unlock:
+            self.client.lock()
+            self._owns_unlock = False
+
+    @contextlib.contextmanager
+    def session(self):
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release()
+
+    def close(self):
+        with self._lock:
+            self._cancel_timer()
+            if self.refs == 0:
+                self._expire()
+
+
+class AsyncSessionManager:
+    def __init__(
+        self,
+        client: AsyncClient,
+        password: SecretStr | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_staleness: float | None = DEFAULT_MAX_STALENESS,
+        now: Callable[[], datetime] = _utcnow,
+    ):
+        self.client = client
+        self.password = password
+        self.idle_timeout = idle_timeout
+        self.max_staleness = max_staleness
+        self.now = now
+        self.refs = 0
+        self.unlocks = 0
+        self.syncs = 0
+        self.last_sync: datetime | None = None
+        self._owns_unlock = False
+        self._timer: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    async def _ensure_unlocked(self):
+        status = await self.client.get_status()
+        self.last_sync = status.lastSync
+        if status.status == DBStatus.Locked:
+            if self.password is None:
+                raise Exception("locked bw and no password")
+            await self.client.unlock(self.password)
+            self.unlocks += 1
+            self._owns_unlock = True
+
+    async def _ensure_fresh(self):
+        if self.max_staleness is None or not _is_stale(self.last_sync, self.now(), self.max_staleness):
+            return
+        await self.client.sync()
+        self.syncs += 1
+        self.last_sync = (await self.client.get_status()).lastSync
+
+    async def acquire(self) -> AsyncClient:
+        async with self._lock:
+            self._cancel_timer()
+            if self.refs == 0:
+                await self._ensure_unlocked()
+            await self._ensure_fresh()
+            self.refs += 1
+            return self.client
+
+    async def release(self):
+        async with self._lock:
+            if self.refs == 0:
+                raise Exception("session released more often than acquired")
+            self.refs -= 1
+            if self.refs > 0 or not self._owns_unlock:
+                return
+            if self.idle_timeout <= 0:
+                await self._expire()
+                return
+            self._timer = asyncio.create_task(self._on_idle())
+
+    async def _on_idle(self):
+        await asyncio.sleep(self.idle_timeout)
+        async with self._lock:
+            if self.refs == 0 and self._timer is asyncio.current_task():
+                self._timer = None
+                await self._expire()
+
+    async def _expire(self):
+        if self._owns_unlock:
+            await self.client.lock()
+            self._owns_unlock = False
+
+    @contextlib.asynccontextmanager
+    async def session(self):
+        client = await self.acquire()
+        try:
+            yield client
+        finally:
+            await self.release()
+
+    async def close(self):
+        async with self._lock:
+            self._cancel_timer()
+            if self.refs == 0:
+                await self._expire()
@@ -0,0 +1,563 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable, TypeVar
+
+import pydantic
+
+import bw_sdk.model as _m
+from bw_sdk._util import LazyAdapter
+from bw_sdk._util import single as _single
+from bw_sdk.matcher import UriMatcher
+
+if TYPE_CHECKING:
+    from bw_sdk import AsyncClient, Client
+
+K = TypeVar("K")
+NamedT = TypeVar("NamedT", _m.Folder, _m.Collection, _m.Organization)
+
+type Index[KeyT] = dict[KeyT, dict[_m.ItemID, None]]
+
+ItemAdapter: LazyAdapter[_m.Item] = LazyAdapter(_m.Item)
+
+
+def _add(index: Index[K], key: K, item_id: _m.ItemID):
+    index.setdefault(key, {})[item_id] = None
+
+
+def _remove(index: Index[K], key: K, item_id: _m.ItemID):
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.pop(item_id, None)
+    if not bucket:
+        del index[key]
+
+
+def _matches_search(item: _m.Item, needle: str) -> bool:
+    if needle in item.name.lower():
+        return True
+    if len(needle) >= 8 and item.id.startswith(needle):
+        return True
+    if isinstance(item, _m.ItemLogin):
+        login = item.login
+        if login.username is not None and needle in login.username.lower():
+            return True
+        if login.uris and any(uri.uri is not None and needle in uri.uri.lower() for uri in login.uris):
+            return True
+    return False
+
+
+def _parse_date(value: str | None) -> datetime | None:
+    return None if value is None else datetime.fromisoformat(value)
+
+
+def _is_unchanged(record: dict[str, Any], item: _m.Item) -> bool:
+    try:
+        revised_at = _parse_date(record.get("revisionDate"))
+        deleted_at = _parse_date(record.get("deletedDate"))
+    except (TypeError, ValueError):
+        return False
+    return revised_at == item.revised_at and deleted_at == item.deleted_at
+
+
+def _item_record(item: _m.Item) -> dict[str, Any]:
+    history = item.password_history
+    return {
+        **item.model_dump(mode="json", by_alias=True),
+        "passwordHistory": None if history is None else [x.model_dump(mode="json") for x in history],
+        "revisionDate": item.revised_at.isoformat(),
+        "creationDate": item.created_at.isoformat(),
+        "deletedDate": None if item.deleted_at is None else item.deleted_at.isoformat(),
+    }
+
+
+def _search_named(objs: Iterable[NamedT], search: str | None, exact: bool) -> list[NamedT]:
+    if exact:
+        return [x for x in objs if x.name == search]
+    if search is None:
+        return list(objs)
+    needle = search.lower()
+    return [x for x in objs if needle in x.name.lower()]
+
+
+@dataclasses.dataclass
+class RefreshReport:
+    added: list[_m.ItemID] = dataclasses.field(default_factory=list)
+    changed: list[_m.ItemID] = dataclasses.field(default_factory=list)
+    deleted: list[_m.ItemID] = dataclasses.field(default_factory=list)
+    scanned: int = 0
+    validated: int = 0
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.deleted)
+
+
+@dataclasses.dataclass
+class VaultSnapshot:
+    items: dict[_m.ItemID, _m.Item] = dataclasses.field(default_factory=dict)
+    folders: dict[_m.FolderID, _m.Folder] = dataclasses.field(default_factory=dict)
+    collections: dict[_m.CollID, _m.Collection] = dataclasses.field(default_factory=dict)
+    organizations: dict[_m.OrgID, _m.Organization] = dataclasses.field(default_factory=dict)
+    last_sync: datetime | None = None
+
+    _by_name: Index[str] = dataclasses.field(default_factory=dict, init=False, repr=False)
+    _by_folder: Index[_m.FolderID | None] = dataclasses.field(default_factory=dict, init=False, repr=False)
+    _by_org: Index[_m.OrgID | None] = dataclasses.field(default_factory=dict, init=False, repr=False)
+    _by_coll: Index[_m.CollID] = dataclasses.field(default_factory=dict, init=False, repr=False)
+    _by_type: Index[type] = dataclasses.field(default_factory=dict, init=False, repr=False)
+    _matcher: UriMatcher = dataclasses.field(
+        default_factory=lambda: UriMatcher(include_deleted=True), init=False, repr=False, compare=False
+    )
+    _lock: threading.RLock = dataclasses.field(default_factory=threading.RLock, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for item in self.items.values():
+            self._index(item)
+
+    @classmethod
+    def build(
+        cls,
+        items: Iterable[_m.Item],
+        folders: Iterable[_m.Folder] = (),
+        collections: Iterable[_m.Collection] = (),
+        organizations: Iterable[_m.Organization] = (),
+        last_sync: datetime | None = None,
+    ):
+        return cls(
+            items={x.id: x for x in items},
+            folders={x.id: x for x in folders},
+            collections={x.id: x for x in collections},
+            organizations={x.id: x for x in organizations},
+            last_sync=last_sync,
+        )
+
+    @classmethod
+    def from_client(cls, client: Client):
+        status = client.get_status()
+        return cls.build(
+            client.get_items() + client.get_items(trash=True),
+            client.get_folders(),
+            client.get_collections(),
+            client.get_organizations(),
+            status.lastSync,
+        )
+
+    @classmethod
+    async def from_async_client(cls, client: AsyncClient):
+        status = await client.get_status()
+        return cls.build(
+            await client.get_items() + await client.get_items(trash=True),
+            await client.get_folders(),
+            await client.get_collections(),
+            await client.get_organizations(),
+            status.lastSync,
+        )
+
+    @classmethod
+    def from_records(cls, records: dict[str, list[dict[str, Any]]], last_sync: datetime | None = None):
+        return cls.build(
+            (ItemAdapter.validate_python(x) for x in records["items"]),
+            (_m.Folder.model_validate(x) for x in records["folders"]),
+            (_m.Collection.model_validate(x) for x in records["collections"]),
+            (_m.Organization.model_validate(x) for x in records["organizations"]),
+            last_sync,
+        )
+
+    def to_records(self) -> dict[str, list[dict[str, Any]]]:
+        with self._lock:
+            items = list(self.items.values())
+            groups: dict[str, Iterable[pydantic.BaseModel]] = {
+                "folders": self.folders.values(),
+                "collections": self.collections.values(),
+                "organizations": self.organizations.values(),
+            }
+        records = {name: [x.model_dump(mode="json", by_alias=True) for x in objs] for name, objs in groups.items()}
+        records["items"] = [_item_record(x) for x in items]
+        return records
+
+    def __len__(self):
+        return len(self.items)
+
+    # region Index
+
+    def _index(self, item: _m.Item):
+        _add(self._by_name, item.name, item.id)
+        _add(self._by_folder, item.folder_id, item.id)
+        _add(self._by_org, item.org_id, item.id)
+        _add(self._by_type, type(item), item.id)
+        for coll_id in item.coll_ids:
+            _add(self._by_coll, coll_id, item.id)
+        self._matcher.add_item(item)
+
+    def _unindex(self, item: _m.Item):
+        _remove(self._by_name, item.name, item.id)
+        _remove(self._by_folder, item.folder_id, item.id)
+        _remove(self._by_org, item.org_id, item.id)
+        _remove(self._by_type, type(item), item.id)
+        for coll_id in item.coll_ids:
+            _remove(self._by_coll, coll_id, item.id)
+        self._matcher.remove_item(item.id)
+
+    def upsert_item(self, item: _m.Item):
+        with self._lock:
+            old = self.items.get(item.id)
+            if old is not None:
+                self._unindex(old)
+            self.items[item.id] = item
+            self._index(item)
+
+    def remove_item(self, item: _m.Item | _m.ItemID):
+        obj_id = item if isinstance(item, str) else item.id
+        with self._lock:
+            old = self.items.pop(obj_id, None)
+            if old is not None:
+                self._unindex(old)
+
+    # endregion
+
+    # region Refresh
+
+    def apply_records(self, records: Iterable[dict[str, Any]]) -> RefreshReport:
+        report = RefreshReport()
+        seen: set[_m.ItemID] = set()
+        with self._lock:
+            for record in records:
+                report.scanned += 1
+                obj_id = record.get("id")
+                old = self.items.get(_m.ItemID(obj_id)) if isinstance(obj_id, str) else None
+                if old is not None:
+                    seen.add(old.id)
+                    if _is_unchanged(record, old):
+                        continue
+                item = ItemAdapter.validate_python(record)
+                report.validated += 1
+                seen.add(item.id)
+                self.upsert_item(item)
+                (report.added if old is None else report.changed).append(item.id)
+
+            report.deleted = [obj_id for obj_id in self.items if obj_id not in seen]
+            for obj_id in report.deleted:
+                self.remove_item(obj_id)
+        return report
+
+    def _apply(
+        self,
+        records: list[dict[str, Any]],
+        folders: list[_m.Folder],
+        collections: list[_m.Collection],
+        organizations: list[_m.Organization],
+        last_sync: datetime,
+    ):
+        with self._lock:
+            report = self.apply_records(records)
+            self.folders = {x.id: x for x in folders}
+            self.collections = {x.id: x for x in collections}
+            self.organizations = {x.id: x for x in organizations}
+            self.last_sync = last_sync
+        return report
+
+    def refresh(self, client: Client, sync: bool = False) -> RefreshReport:
+        if sync:
+            client.sync()
+        status = client.get_status()
+        records = client._get_raw_items(None) + client._get_raw_items(_m.ItemQuery(trash=True))
+        return self._apply(
+            records, client.get_folders(), client.get_collections(), client.get_organizations(), status.lastSync
+        )
+
+    async def arefresh(self, client: AsyncClient, sync: bool = False) -> RefreshReport:
+        if sync:
+            await client.sync()
+        status = await client.get_status()
+        records = await client._get_raw_items(None) + await client._get_raw_items(_m.ItemQuery(trash=True))
+        folders = await client.get_folders()
+        collections = await client.get_collections()
+        organizations = await client.get_organizations()
+        return self._apply(records, folders, collections, organizations, status.lastSync)
+
+    # endregion
+
+    # region Items
+
+    def get_item(self, item: _m.Item | _m.ItemID):
+        obj_id = item if isinstance(item, str) else item.id
+        obj = self.items.get(obj_id)
+        if obj is None:
+            raise Exception("Could not get obj [Not found.]")
+        return obj
+
+    def _get_specific_item(self, item: _m.Item | _m.ItemID, typ: type[_m.ItemT]) -> _m.ItemT:
+        obj = self.get_item(item)
+        if not isinstance(obj, typ):
+            raise Exception("invalid item type")
+        return obj
+
+    def get_item_login(self, item: _m.Item | _m.ItemID):
+        return self._get_specific_item(item, _m.ItemLogin)
+
+    def get_item_card(self, item: _m.Item | _m.ItemID):
+        return self._get_specific_item(item, _m.ItemCard)
+
+    def get_item_securenote(self, item: _m.Item | _m.ItemID):
+        return self._get_specific_item(item, _m.ItemSecureNote)
+
+    def get_item_identity(self, item: _m.Item | _m.ItemID):
+        return self._get_specific_item(item, _m.ItemIdentity)
+
+    def _candidates(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        exact: bool,
+        typ: type[_m.ItemTemplate] | None,
+    ) -> Iterable[_m.ItemID]:
+        buckets: list[dict[_m.ItemID, None]] = []
+        if exact:
+            buckets.append(self._by_name.get(search, {}) if search is not None else {})
+        if org_id is not None:
+            buckets.append(self._by_org.get(org_id, {}))
+        if coll_id is not None:
+            buckets.append(self._by_coll.get(coll_id, {}))
+        if folder_id is not None:
+            buckets.append(self._by_folder.get(folder_id, {}))
+        if url is not None:
+            buckets.append(dict.fromkeys(self._matcher.match_ids(url)))
+        if typ is not None:
+            buckets.append(self._by_type.get(typ, {}))
+        if not buckets:
+            return self.items.keys()
+
+        buckets.sort(key=len)
+        first, rest = buckets[0], buckets[1:]
+        return [obj_id for obj_id in first if all(obj_id in bucket for bucket in rest)]
+
+    def _query(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+        typ: type[_m.ItemTemplate] | None,
+    ) -> list[_m.Item]:
+        with self._lock:
+            ids = self._candidates(search, org_id, coll_id, folder_id, url, exact, typ)
+            items = (self.items[obj_id] for obj_id in ids)
+            items = (x for x in items if (x.deleted_at is not None) == trash)
+            if search is not None and not exact:
+                needle = search.lower()
+                items = (x for x in items if _matches_search(x, needle))
+            return list(items)
+
+    def get_items(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return self._query(search, org_id, coll_id, folder_id, url, trash, exact, None)
+
+    def _get_specific_items(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+        typ: type[_m.ItemT],
+    ) -> list[_m.ItemT]:
+        objs = self._query(search, org_id, coll_id, folder_id, url, trash, exact, typ)
+        return [obj for obj in objs if isinstance(obj, typ)]
+
+    def get_item_logins(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemLogin)
+
+    def get_item_cards(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemCard)
+
+    def get_item_identities(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemIdentity)
+
+    def get_item_securenotes(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        return self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemSecureNote)
+
+    def find_item(
+        self,
+        search: str | None = None,
+        org_id: _m.OrgID | None = None,
+        coll_id: _m.CollID | None = None,
+        folder_id: _m.FolderID | None = None,
+        url: str | None = None,
+        trash: bool = False,
+        exact: bool = False,
+    ):
+        res = self.get_items(search, org_id, coll_id, folder_id, url, trash, exact)
+        return _single(res, "item")
+
+    def _find_specific_item(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+        typ: type[_m.ItemT],
+    ) -> _m.ItemT:
+        res = self._get_specific_items(search, org_id, coll_id, folder_id, url, trash, exact, typ)
+        return _single(res, "item")
+
+    def find_item_login(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+    ):
+        return self._find_specific_item(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemLogin)
+
+    def find_item_card(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+    ):
+        return self._find_specific_item(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemCard)
+
+    def find_item_identity(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+    ):
+        return self._find_specific_item(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemIdentity)
+
+    def find_item_securenote(
+        self,
+        search: str | None,
+        org_id: _m.OrgID | None,
+        coll_id: _m.CollID | None,
+        folder_id: _m.FolderID | None,
+        url: str | None,
+        trash: bool,
+        exact: bool,
+    ):
+        return self._find_specific_item(search, org_id, coll_id, folder_id, url, trash, exact, _m.ItemSecureNote)
+
+    # endregion
+
+    # region Folders
+
+    def get_folder(self, folder: _m.Folder | _m.FolderID):
+        obj_id = folder if isinstance(folder, str) else folder.id
+        obj = self.folders.get(obj_id)
+        if obj is None:
+            raise Exception("Could not get obj [Not found.]")
+        return obj
+
+    def get_folders(self, search: str | None = None, exact: bool = False):
+        return _search_named(self.folders.values(), search, exact)
+
+    def find_folder(self, search: str | None = None, exact: bool = False):
+        return _single(self.get_folders(search, exact), "folder")
+
+    # endregion
+
+    # region Organization
+
+    def get_organization(self, obj: _m.Organization | _m.OrgID):
+        obj_id = obj if isinstance(obj, str) else obj.id
+        org = self.organizations.get(obj_id)
+        if org is None:
+            raise Exception("Could not get obj [Not found.]")
+        return org
+
+    def get_organizations(self, search: str | None = None, exact: bool = False):
+        return _search_named(self.organizations.values(), search, exact)
+
+    def find_organization(self, search: str | None = None, exact: bool = False):
+        return _single(self.get_organizations(search, exact), "organization")
+
+    # endregion
+
+    # region Collections
+
+    def get_collection(self, obj: _m.Collection | _m.CollID):
+        obj_id = obj if isinstance(obj, str) else obj.id
+        coll = self.collections.get(obj_id)
+        if coll is None:
+            raise Exception("Could not get obj [Not found.]")
+        return coll
+
+    def get_collections(self, search: str | None = None, org_id: _m.OrgID | None = None, exact: bool = False):
+        colls = list(self.collections.values())
+        if org_id is not None:
+            colls = [x for x in colls if x.org_id == org_id]
+        return _search_named(colls, search, exact)
+
+    def find_collection(self, search: str | None = None, org_id: _m.OrgID | None = None, exact: bool = False):
+        return _single(self.get_collections(search, org_id, exact), "collection")
+
+    # endregion
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator, Literal
+
+import bw_sdk.model as _m
+from bw_sdk._util import LazyAdapter
+
+if TYPE_CHECKING:
+    from bw_sdk import AsyncClient, Client
+
+logger = logging.getLogger(__name__)
+
+type ObjectKind = Literal["folder", "collection", "item"]
+type ChangeKind = Literal["added", "modified", "deleted"]
+type WatchedObj = _m.Item | _m.Folder | _m.Collection
+type Fingerprint = tuple[str | None, str | None, bytes | None]
+
+ALL_KINDS: tuple[ObjectKind, ...] = ("folder", "collection", "item")
+
+DEFAULT_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 60.0
+DEFAULT_BACKOFF = 2.0
+
+SOURCES: dict[ObjectKind, tuple[str, LazyAdapter[Any]]] = {
+    "folder": ("folders", LazyAdapter(_m.Folder)),
+    "collection": ("collections", LazyAdapter(_m.Collection)),
+    "item": ("items", LazyAdapter(_m.Item)),
+}
+
+
+def _digest(record: dict[str, Any]) -> bytes:
+    return hashlib.blake2b(json.dumps(record, sort_keys=True, default=str).encode(), digest_size=16).digest()
+
+
+@dataclasses.dataclass(frozen=True)
+class ChangeEvent:
+    kind: ChangeKind
+    obj_type: ObjectKind
+    id: str
+    obj: WatchedObj | None
+
+
+class _Tracker:
+    def __init__(self, kinds: Iterable[ObjectKind], initial: bool, hash_content: bool):
+        self.kinds: tuple[ObjectKind, ...] = tuple(x for x in ALL_KINDS if x in set(kinds))
+        if not self.kinds:
+            raise Exception("nothing to watch")
+        self.initial = initial
+        self.hash_content = hash_content
+        self.seen: dict[ObjectKind, dict[str, Fingerprint]] = {x: {} for x in self.kinds}
+        self.objects: dict[ObjectKind, dict[str, WatchedObj | dict[str, Any]]] = {x: {} for x in self.kinds}
+        self.primed = False
+        self.polls = 0
+        self.validated = 0
+
+    def fingerprint(self, record: dict[str, Any]) -> Fingerprint:
+        digest = _digest(record) if self.hash_content else None
+        return record.get("revisionDate"), record.get("deletedDate"), digest
+
+    def diff(self, obj_type: ObjectKind, records: list[dict[str, Any]]) -> list[ChangeEvent]:
+        seen = self.seen[obj_type]
+        objects = self.objects[obj_type]
+        validator = SOURCES[obj_type][1]
+        emit = self.primed or self.initial
+        current: dict[str, Fingerprint] = {}
+        events: list[ChangeEvent] = []
+        for record in records:
+            if record.get("deletedDate") is not None:
+                continue
+            obj_id = record["id"]
+            fingerprint = self.fingerprint(record)
+            current[obj_id] = fingerprint
+            old = seen.get(obj_id)
+            if old == fingerprint:
+                continue
+            if not emit:
+                objects[obj_id] = record
+                continue
+            obj = validator.validate_python(record)
+            self.validated += 1
+            objects[obj_id] = obj
+            events.append(ChangeEvent("added" if old is None else "modified", obj_type, obj_id, obj))
+        for obj_id in seen.keys() - current.keys():
+            events.append(ChangeEvent("deleted", obj_type, obj_id, self.removed(obj_type, obj_id)))
+        self.seen[obj_type] = current
+        return events
+
+    def removed(self, obj_type: ObjectKind, obj_id: str) -> WatchedObj | None:
+        obj = self.objects[obj_type].pop(obj_id, None)
+        if isinstance(obj, dict):
+            self.validated += 1
+            return SOURCES[obj_type][1].validate_python(obj)
+        return obj
+
+    def apply(self, listed: Iterable[tuple[ObjectKind, list[dict[str, Any]]]]) -> list[ChangeEvent]:
+        events: list[ChangeEvent] = []
+        for obj_type, records in listed:
+            events.extend(self.diff(obj_type, records))
+        self.primed = True
+        self.polls += 1
+        return events
+
+
+class _BaseWatcher:
+    def __init__(
+        self,
+        client: Any,
+        interval: float = DEFAULT_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = DEFAULT_BACKOFF,
+        kinds: Iterable[ObjectKind] = ALL_KINDS,
+        sync: bool = True,
+        initial: bool = False,
+        hash_content: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.client = client
+        self.min_interval = interval
+        self.max_interval = max(interval, max_interval)
+        self.backoff = backoff
+        self.interval = interval
+        self.sync = sync
+        self.clock = clock
+        self.errors = 0
+        self.last_error: Exception | None = None
+        self._tracker = _Tracker(kinds, initial, hash_content)
+
+    @property
+    def polls(self):
+        return self._tracker.polls
+
+    @property
+    def validated(self):
+        return self._tracker.validated
+
+    def _adapt(self, changed: bool):
+        self.interval = self.min_interval if changed else min(self.interval * self.backoff, self.max_interval)
+
+    def _finish(self, listed: Iterable[tuple[ObjectKind, list[dict[str, Any]]]]) -> list[ChangeEvent]:
+        primed = self._tracker.primed
+        events = self._tracker.apply(listed)
+        self._adapt(bool(events) or not primed)
+        return events
+
+    def _failed(self, exc: Exception):
+        self.errors += 1
+        self.last_error = exc
+        self._adapt(False)
+        logger.warning("watch poll failed, retrying in %.1fs: %s", self.interval, exc)
+
+    def _delay(self, started: float) -> float:
+        return self.interval - (self.clock() - started)
+
+
+class Watcher(_BaseWatcher):
+    client: Client
+
+    def poll(self) -> list[ChangeEvent]:
+        if self.sync:
+            self.client.sync()
+        kinds = self._tracker.kinds
+        return self._finish([(x, self.client._get_raw_list(SOURCES[x][0], None)) for x in kinds])
+
+    def watch(self, stop: threading.Event | None = None) -> Iterator[ChangeEvent]:
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            started = self.clock()
+            try:
+                events = self.poll()
+            except Exception as exc:
+                self._failed(exc)
+                events = []
+            yield from events
+            delay = self._delay(started)
+            if delay > 0:
+                stop.wait(delay)
+
+    def __iter__(self):
+        return self.watch()
+
+
+class AsyncWatcher(_BaseWatcher):
+    client: AsyncClient
+
+    async def poll(self) -> list[ChangeEvent]:
+        if self.sync:
+            await self.client.sync()
+        kinds = self._tracker.kinds
+        listed = await asyncio.gather(*(self.client._get_raw_list(SOURCES[x][0], None) for x in kinds))
+        return self._finish(zip(kinds, listed))
+
+    async def watch(self, stop: asyncio.Event | None = None) -> AsyncIterator[ChangeEvent]:
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            started = self.clock()
+            try:
+                events = await self.poll()
+            except Exception as exc:
+                self._failed(exc)
+                events = []
+            for event in events:
+                yield event
+            delay = self._delay(started)
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(stop.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    def __aiter__(self):
+        return self.watch()
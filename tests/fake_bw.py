@@ -0,0 +1,243 @@
+import collections
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from bw_sdk import AsyncClient, Client
+
+from .vault import Vault
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _host(uri: str | None):
+    if not uri:
+        return None
+    if "://" not in uri:
+        uri = f"http://{uri}"
+    return urlsplit(uri).hostname
+
+
+def _message(title: str):
+    return {"object": "message", "noColor": False, "title": title, "message": None}
+
+
+class FakeBW:
+    def __init__(
+        self,
+        vault: Vault | None = None,
+        password: str = "hunter2",
+        locked: bool = False,
+        service_time: float = 0.0,
+    ):
+        vault = vault or Vault([], [], [], [])
+        self.items: dict[str, dict[str, Any]] = {x["id"]: x for x in vault.items}
+        self.folders: dict[str, dict[str, Any]] = {x["id"]: x for x in vault.folders}
+        self.collections: dict[str, dict[str, Any]] = {x["id"]: x for x in vault.collections}
+        self.organizations: dict[str, dict[str, Any]] = {x["id"]: x for x in vault.organizations}
+        self.password = password
+        self.locked = locked
+        self.last_sync = _now()
+        self.service_time = service_time
+        self.requests: collections.Counter[str] = collections.Counter()
+        self._lock = threading.RLock()
+
+    # region Helpers
+
+    @property
+    def transport(self):
+        return httpx.MockTransport(self.handle)
+
+    def client(self, **kwargs: Any):
+        return Client(http_client=httpx.Client(base_url="http://bw", transport=self.transport), **kwargs)
+
+    def async_client(self, **kwargs: Any):
+        return AsyncClient(http_client=httpx.AsyncClient(base_url="http://bw", transport=self.transport), **kwargs)
+
+    def list_body(self, params: dict[str, str] | None = None):
+        return json.dumps({"success": True, "data": {"object": "list", "data": self._items(params or {})}}).encode()
+
+    @staticmethod
+    def ok(data: Any = None):
+        body: dict[str, Any] = {"success": True}
+        if data is not None:
+            body["data"] = data
+        return httpx.Response(200, content=json.dumps(body))
+
+    @staticmethod
+    def error(message: str, status: int = 400):
+        return httpx.Response(status, content=json.dumps({"success": False, "message": message}))
+
+    # endregion
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            if self.service_time:
+                time.sleep(self.service_time)
+            return self._handle(request)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        method = request.method
+        parts = request.url.path.strip("/").split("/")
+        params = dict(request.url.params)
+        payload = json.loads(request.content) if request.content else None
+        self.requests[f"{method} /{'/'.join(parts[:2])}"] += 1
+
+        match method, parts:
+            case "GET", ["status"]:
+                return self.ok({"object": "template", "template": self.status()})
+            case "POST", ["unlock"]:
+                if payload is None or payload.get("password") != self.password:
+                    return self.error("Invalid master password.")
+                self.locked = False
+                return self.ok({**_message("Your vault is now unlocked!"), "raw": "session-key"})
+            case "POST", ["lock"]:
+                self.locked = True
+                return self.ok(_message("Your vault is locked."))
+
+        if self.locked:
+            return self.error("Vault is locked.")
+
+        match method, parts:
+            case "POST", ["sync"]:
+                self.last_sync = _now()
+                return self.ok(_message("Syncing complete."))
+            case "GET", ["object", "fingerprint", "me"]:
+                return self.ok({"object": "string", "data": "correct-horse-battery-staple"})
+            case "GET", ["list", "object", "items"]:
+                return self.ok({"object": "list", "data": self._items(params)})
+            case "GET", ["list", "object", "folders"]:
+                return self.ok({"object": "list", "data": self._named(self.folders, params)})
+            case "GET", ["list", "object", "organizations"]:
+                return self.ok({"object": "list", "data": self._named(self.organizations, params)})
+            case "GET", ["list", "object", "collections" | "org-collections"]:
+                colls = self._named(self.collections, params)
+                if "organizationId" in params:
+                    colls = [x for x in colls if x["organizationId"] == params["organizationId"]]
+                return self.ok({"object": "list", "data": colls})
+            case "GET", ["object", "item", obj_id]:
+                return self._get(self.items, obj_id)
+            case "GET", ["object", "folder", obj_id]:
+                return self._get(self.folders, obj_id)
+            case "GET", ["object", "organization", obj_id]:
+                return self._get(self.organizations, obj_id)
+            case "GET", ["object", "collection", obj_id]:
+                return self._get(self.collections, obj_id)
+            case "POST", ["object", "item"]:
+                return self._post_item(payload)
+            case "PUT", ["object", "item", obj_id]:
+                return self._put_item(obj_id, payload)
+            case "DELETE", ["object", "item", obj_id]:
+                if obj_id not in self.items:
+                    return self.error("Not found.", 404)
+                self.items[obj_id] = {**self.items[obj_id], "deletedDate": _now(), "revisionDate": _now()}
+                return self.ok()
+            case "POST", ["restore", "item", obj_id]:
+                if obj_id not in self.items:
+                    return self.error("Not found.", 404)
+                self.items[obj_id] = {**self.items[obj_id], "deletedDate": None, "revisionDate": _now()}
+                return self.ok()
+            case "POST", ["object", "folder"]:
+                folder = {"object": "folder", "id": str(uuid.uuid4()), "name": payload["name"]}
+                self.folders[folder["id"]] = folder
+                return self.ok(folder)
+            case "PUT", ["object", "folder", obj_id]:
+                if obj_id not in self.folders:
+                    return self.error("Not found.", 404)
+                self.folders[obj_id] = {**self.folders[obj_id], "name": payload["name"]}
+                return self.ok(self.folders[obj_id])
+            case "DELETE", ["object", "folder", obj_id]:
+                if self.folders.pop(obj_id, None) is None:
+                    return self.error("Not found.", 404)
+                for item_id, item in self.items.items():
+                    if item["folderId"] == obj_id:
+                        self.items[item_id] = {**item, "folderId": None, "revisionDate": _now()}
+                return self.ok()
+            case "POST", ["object", "org-collection"]:
+                coll = {"object": "collection", "id": str(uuid.uuid4()), "externalId": None, **payload}
+                self.collections[coll["id"]] = coll
+                return self.ok(coll)
+            case "PUT", ["object", "org-collection", obj_id]:
+                if obj_id not in self.collections:
+                    return self.error("Not found.", 404)
+                self.collections[obj_id] = {**self.collections[obj_id], **payload}
+                return self.ok(self.collections[obj_id])
+            case "DELETE", ["object", "org-collection", obj_id]:
+                if self.collections.pop(obj_id, None) is None:
+                    return self.error("Not found.", 404)
+                return self.ok()
+        return self.error("Not found.", 404)
+
+    def status(self):
+        return {
+            "serverUrl": None,
+            "lastSync": self.last_sync,
+            "userEmail": "user@example.com",
+            "userId": "6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c",
+            "status": "locked" if self.locked else "unlocked",
+        }
+
+    def _get(self, objs: dict[str, dict[str, Any]], obj_id: str):
+        obj = objs.get(obj_id)
+        if obj is None:
+            return self.error("Not found.", 404)
+        return self.ok(obj)
+
+    def _named(self, objs: dict[str, dict[str, Any]], params: dict[str, str]):
+        needle = params.get("search", "").lower()
+        return [x for x in objs.values() if needle in x["name"].lower()]
+
+    def _items(self, params: dict[str, str]):
+        needle = params.get("search", "").lower()
+        trash = params.get("trash") in ("true", "True")
+        url_host = _host(params.get("url"))
+        out = []
+        for item in self.items.values():
+            if (item["deletedDate"] is not None) != trash:
+                continue
+            if "organizationId" in params and item["organizationId"] != params["organizationId"]:
+                continue
+            if "collectionId" in params and params["collectionId"] not in item["collectionIds"]:
+                continue
+            if "folderid" in params and item["folderId"] != params["folderid"]:
+                continue
+            login = item.get("login") or {}
+            uris = [x["uri"] for x in login.get("uris") or []]
+            if url_host is not None and url_host not in {_host(uri) for uri in uris}:
+                continue
+            if needle:
+                haystack = [item["name"], login.get("username") or "", *uris]
+                if not any(needle in x.lower() for x in haystack):
+                    continue
+            out.append(item)
+        return out
+
+    def _post_item(self, payload: dict[str, Any]):
+        stamp = _now()
+        item = {
+            **payload,
+            "object": "item",
+            "id": str(uuid.uuid4()),
+            "revisionDate": stamp,
+            "creationDate": stamp,
+            "deletedDate": None,
+            "passwordHistory": None,
+        }
+        self.items[item["id"]] = item
+        return self.ok(item)
+
+    def _put_item(self, obj_id: str, payload: dict[str, Any]):
+        old = self.items.get(obj_id)
+        if old is None:
+            return self.error("Not found.", 404)
+        item = {**old, **payload, "id": obj_id, "revisionDate": _now()}
+        self.items[obj_id] = item
+        return self.ok(item)
@@ -0,0 +1,51 @@
+import argparse
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+
+def make_handler(fake: FakeBW):
+    class Handler(BaseHTTPRequestHandler):
+        def _serve(self):
+            length = int(self.headers.get("content-length") or 0)
+            body = self.rfile.read(length) if length else b""
+            request = httpx.Request(self.command, f"http://bw{self.path}", content=body)
+            response = fake.handle(request)
+            self.send_response(response.status_code)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(response.content)))
+            self.end_headers()
+            self.wfile.write(response.content)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+        def log_message(self, format: str, *args: object):
+            pass
+
+    return Handler
+
+
+def main(argv: list[str]):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("cmd", choices=["serve"])
+    parser.add_argument("--hostname", default="localhost")
+    parser.add_argument("--port", type=int, default=8087)
+    args = parser.parse_args(argv)
+
+    appdata = os.environ.get("BITWARDENCLI_APPDATA_DIR")
+    if appdata:
+        (Path(appdata) / "stub.pid").write_text(str(os.getpid()))
+
+    fake = FakeBW(generate_vault(int(os.environ.get("STUB_BW_ITEMS", "20"))), locked=True)
+    server = ThreadingHTTPServer((args.hostname, args.port), make_handler(fake))
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+import httpx
+
+from bw_sdk import AsyncClient, DBStatus
+
+STATUS = {
+    "serverUrl": None,
+    "lastSync": "2023-11-01T10:00:00.000Z",
+    "userEmail": "user@example.com",
+    "userId": "6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c",
+    "status": "unlocked",
+}
+
+ITEM = {
+    "object": "item",
+    "id": "0e9a5a3b-3b9e-4a8e-9b3e-b0a5012a1b2c",
+    "organizationId": None,
+    "folderId": None,
+    "type": 1,
+    "reprompt": 0,
+    "name": "example",
+    "notes": None,
+    "favorite": False,
+    "login": {"uris": [{"match": None, "uri": "https://example.com"}], "username": "user", "password": "pw"},
+    "collectionIds": [],
+    "revisionDate": "2023-11-01T10:00:00.000Z",
+    "creationDate": "2023-11-01T10:00:00.000Z",
+    "deletedDate": None,
+    "passwordHistory": None,
+}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    match request.url.path:
+        case "/status":
+            data = {"object": "template", "template": STATUS}
+        case "/list/object/items":
+            data = {"object": "list", "data": [ITEM]}
+        case "/object/item/0e9a5a3b-3b9e-4a8e-9b3e-b0a5012a1b2c":
+            data = ITEM
+        case _:
+            return httpx.Response(404, content=json.dumps({"success": False, "message": "Not found."}))
+    return httpx.Response(200, content=json.dumps({"success": True, "data": data}))
+
+
+def test_async_client():
+    async def run():
+        client = AsyncClient(
+            http_client=httpx.AsyncClient(base_url="http://bw", transport=httpx.MockTransport(handler))
+        )
+        status = await client.get_status()
+        assert status.status == DBStatus.Unlocked
+
+        items = await asyncio.gather(*(client.get_item(ITEM["id"]) for _ in range(50)))
+        assert all(item.name == "example" for item in items)
+
+        login = await client.find_item_login("example", None, None, None, None, False, True)
+        assert login.login.username == "user"
+
+        assert [item.name async for item in client.iter_items()] == ["example"]
+
+    asyncio.run(run())
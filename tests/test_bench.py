@@ -0,0 +1,210 @@
+import functools
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from bw_sdk import ItemsResp, Op, ParallelParser, UriMatcher, VaultSnapshot, load_snapshot, save_snapshot
+from bw_sdk.parallel import free_threaded
+from bw_sdk.persist import generate_key
+
+from .fake_bw import FakeBW
+from .vault import HOSTS, generate_vault
+
+SIZES = [int(x) for x in os.environ.get("BW_BENCH_SIZES", "1000").split(",")]
+
+pytestmark = pytest.mark.bench
+
+
+@functools.cache
+def vault(size: int):
+    return generate_vault(size, seed=size)
+
+
+def report(name: str, size: int, value: float, unit: str):
+    print(f"\n[bench] {name:<24} n={size:<7} {value:12.2f} {unit}")
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"n{size}")
+def fake(request: pytest.FixtureRequest):
+    return FakeBW(vault(request.param))
+
+
+def test_list_latency(fake: FakeBW):
+    client = fake.client()
+    client.get_items()
+
+    start = time.perf_counter()
+    items = client.get_items()
+    elapsed = time.perf_counter() - start
+
+    assert len(items) == len(fake.items)
+    report("list latency", len(fake.items), elapsed * 1000, "ms")
+
+
+def test_get_latency(fake: FakeBW):
+    client = fake.client()
+    ids = list(fake.items)[:200]
+
+    start = time.perf_counter()
+    for obj_id in ids:
+        assert client.get_item(obj_id).id == obj_id
+    elapsed = time.perf_counter() - start
+
+    report("get latency", len(fake.items), elapsed / len(ids) * 1e6, "us/item")
+
+
+def test_parse_throughput(fake: FakeBW):
+    body = fake.list_body()
+    ItemsResp.validate_json(body)
+
+    start = time.process_time()
+    res = ItemsResp.validate_json(body)
+    elapsed = time.process_time() - start
+
+    assert len(res.data.data) == len(fake.items)
+    report("parse throughput", len(fake.items), len(fake.items) / elapsed, "items/s")
+    report("parse throughput", len(fake.items), len(body) / elapsed / 2**20, "MiB/s")
+
+
+def test_peak_memory(fake: FakeBW):
+    client = fake.client()
+    client.get_items()
+
+    tracemalloc.start()
+    items = client.get_items()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(items) == len(fake.items)
+    report("list peak memory", len(fake.items), peak / 2**20, "MiB")
+
+
+def test_write_throughput(fake: FakeBW):
+    client = fake.client()
+    items = client.get_items()[:100]
+
+    start = time.perf_counter()
+    for item in items:
+        item.name = f"{item.name} (renamed)"
+        client.put_item(item)
+    elapsed = time.perf_counter() - start
+
+    assert all(fake.items[x.id]["name"].endswith("(renamed)") for x in items)
+    report("write throughput", len(fake.items), len(items) / elapsed, "ops/s")
+
+
+def test_batch_write_throughput(fake: FakeBW):
+    client = fake.client()
+    items = client.get_items()[:100]
+
+    batch = client.apply_batch(Op.update(x.model_copy(update={"name": f"{x.name} (batched)"})) for x in items)
+
+    assert batch.failed == []
+    report("batch write throughput", len(fake.items), batch.ops_per_sec, "ops/s")
+
+
+def test_url_match_throughput(fake: FakeBW):
+    client = fake.client()
+    urls = [f"https://{host}/{idx}" for idx in range(50) for host in HOSTS]
+
+    start = time.perf_counter()
+    remote = {url: client.get_items(url=url) for url in urls[:60]}
+    remote_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher = UriMatcher(client.get_items())
+    build_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    local = matcher.match_urls(urls)
+    local_elapsed = time.perf_counter() - start
+
+    assert all({x.id for x in local[url]} == {x.id for x in res} for url, res in remote.items())
+    report("url match (server)", len(fake.items), len(remote) / remote_elapsed, "urls/s")
+    report("url match (index build)", len(fake.items), build_elapsed * 1000, "ms")
+    report("url match (local)", len(fake.items), len(local) / local_elapsed, "urls/s")
+
+
+def test_snapshot_cold_start(fake: FakeBW, tmp_path):
+    pytest.importorskip("cryptography")
+    client = fake.client()
+    key = generate_key()
+    path = tmp_path / "vault.snap"
+
+    start = time.perf_counter()
+    snapshot = VaultSnapshot.from_client(client)
+    fetch_elapsed = time.perf_counter() - start
+    save_snapshot(snapshot, path, key)
+
+    start = time.perf_counter()
+    loaded, _ = load_snapshot(path, key)
+    load_elapsed = time.perf_counter() - start
+
+    assert len(loaded) == len(fake.items)
+    report("cold start (fetch)", len(fake.items), fetch_elapsed * 1000, "ms")
+    report("cold start (snapshot)", len(fake.items), load_elapsed * 1000, "ms")
+    report("snapshot size", len(fake.items), path.stat().st_size / 2**10, "KiB")
+
+
+def _retained(fn):
+    fn()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    res = fn()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return res, after - before, peak - before
+
+
+def test_compact_memory(fake: FakeBW):
+    client = fake.client()
+
+    models, model_retained, model_peak = _retained(client.get_items)
+    compact, compact_retained, compact_peak = _retained(client.get_items_compact)
+
+    assert len(models) == len(compact) == len(fake.items)
+    assert compact_retained < model_retained
+    report("retained (models)", len(fake.items), model_retained / 2**20, "MiB")
+    report("retained (compact)", len(fake.items), compact_retained / 2**20, "MiB")
+    report("peak (models)", len(fake.items), model_peak / 2**20, "MiB")
+    report("peak (compact)", len(fake.items), compact_peak / 2**20, "MiB")
+
+    start = time.perf_counter()
+    converted = [x.to_summary() for x in compact]
+    elapsed = time.perf_counter() - start
+    assert [x.id for x in converted] == [x.id for x in models]
+    report("compact to_summary", len(fake.items), elapsed / len(converted) * 1e6, "us/item")
+
+
+def test_parallel_parse_scaling(fake: FakeBW):
+    body = fake.list_body()
+    ItemsResp.validate_json(body)
+
+    start = time.perf_counter()
+    expected = ItemsResp.validate_json(body).data.data
+    serial = time.perf_counter() - start
+    report("parse serial", len(fake.items), serial * 1000, "ms")
+
+    cores = os.cpu_count() or 1
+    speedups: dict[int, float] = {}
+    for workers in sorted({2, *(x for x in (4, 8, 16) if x <= cores), max(2, cores)}):
+        with ParallelParser(workers=workers, threshold=0, mode="thread") as parser:
+            adapter = parser.adapter(ItemsResp)
+            adapter.validate_json(body)
+
+            start = time.perf_counter()
+            res = adapter.validate_json(body).data.data
+            elapsed = time.perf_counter() - start
+
+        assert res == expected
+        speedups[workers] = serial / elapsed
+        report(f"parse thread x{workers}", len(fake.items), speedups[workers], "x speedup")
+
+    if not free_threaded():
+        assert ParallelParser().mode == "serial"
+        pytest.skip("threads cannot speed up validation while the GIL is enabled")
+    if cores < 4:
+        pytest.skip(f"speedup needs at least 4 cores [{cores} available]")
+    assert max(speedups.values()) > 1.5
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+import bw_sdk.model as _m
+from bw_sdk import Client, Op, bulk
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+MISSING = "6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c"
+
+
+@pytest.fixture
+def fake():
+    return FakeBW(generate_vault(40, seed=11))
+
+
+def test_get_items_by_id(fake: FakeBW):
+    client = fake.client()
+    ids = list(fake.items)[:20]
+    wanted = [ids[3], MISSING, *ids, ids[3]]
+
+    res = client.get_items_by_id(wanted, max_concurrency=4)
+
+    assert [x.id for x in res] == wanted
+    assert [x.item.id for x in res if x.ok] == [x for x in wanted if x != MISSING]
+    assert not res[1].ok and "Not found" in str(res[1].error)
+    assert res[0] is res[-1]
+    assert fake.requests["GET /object/item"] == 21
+
+
+def test_get_items_by_id_bounded(fake: FakeBW):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        try:
+            threading.Event().wait(0.005)
+            return fake.handle(request)
+        finally:
+            with lock:
+                active -= 1
+
+    client = Client(http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)))
+    res = client.get_items_by_id(list(fake.items), max_concurrency=3)
+
+    assert all(x.ok for x in res)
+    assert 1 < peak <= 3
+
+    with pytest.raises(Exception, match="max_concurrency"):
+        client.get_items_by_id([], max_concurrency=0)
+
+
+def test_async_get_items_by_id(fake: FakeBW):
+    client = fake.async_client()
+    ids = list(fake.items)[:10]
+
+    res = asyncio.run(client.get_items_by_id([*ids, MISSING, ids[0]], max_concurrency=3))
+
+    assert [x.id for x in res] == [*ids, MISSING, ids[0]]
+    assert [x.ok for x in res] == [True] * 10 + [False, True]
+    assert fake.requests["GET /object/item"] == 11
+
+
+def test_apply_batch(fake: FakeBW):
+    client = fake.client()
+    items = client.get_items()
+    first, second, third = items[:3]
+    renamed = first.model_copy(update={"name": "renamed"})
+    final = first.model_copy(update={"name": "final"})
+    folder = client.get_folders()[0]
+
+    ops = [
+        Op.create(_m.NewItemLogin(name="created")),
+        Op.update(renamed),
+        Op.delete(second.id),
+        Op.update(final),
+        Op.restore(second),
+        Op.create(_m.NewFolder(name="new folder")),
+        Op.update(folder.model_copy(update={"name": "renamed folder"})),
+        Op.delete(third),
+        Op.restore(folder),
+    ]
+    report = client.apply_batch(ops, max_concurrency=4)
+
+    assert [x.op for x in report.results] == ops
+    assert [x.ok for x in report.results] == [True] * 8 + [False]
+    assert "unsupported operation" in str(report.results[-1].error)
+    assert report.results[1].coalesced and report.results[1].value.name == "final"
+    assert fake.requests["PUT /object/item"] == 1
+    assert fake.items[first.id]["name"] == "final"
+    assert fake.items[second.id]["deletedDate"] is None
+    assert fake.items[third.id]["deletedDate"] is not None
+    assert fake.folders[folder.id]["name"] == "renamed folder"
+    assert report.ops_per_sec > 0 and report.requests == 8
+
+
+def test_apply_batch_retries(fake: FakeBW):
+    failures = {"count": 2}
+    item = list(fake.items)[0]
+
+    def handler(request: httpx.Request):
+        if request.url.path == f"/object/item/{item}" and failures["count"]:
+            failures["count"] -= 1
+            return httpx.Response(503)
+        return fake.handle(request)
+
+    client = Client(http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)))
+    report = bulk.apply_batch(client, [Op.delete(item), Op.delete(MISSING)], backoff=0)
+
+    assert report.results[0].ok and report.results[0].attempts == 3
+    assert not report.results[1].ok and report.results[1].attempts == 1
+
+
+def test_apply_batch_retries_writes(fake: FakeBW):
+    first = fake.client().get_items()[0]
+    failures = {"PUT": [httpx.Response(503, json={"success": False, "message": "busy"})]}
+    failures["POST"] = [httpx.ConnectError, httpx.ReadTimeout]
+
+    def handler(request: httpx.Request):
+        pending = failures.get(request.method)
+        if pending:
+            failure = pending.pop(0)
+            if isinstance(failure, httpx.Response):
+                return failure
+            raise failure("flaky", request=request)
+        return fake.handle(request)
+
+    client = Client(http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)))
+    ops = [Op.update(first.model_copy(update={"name": "retried"})), Op.create(_m.NewItemLogin(name="once"))]
+    report = bulk.apply_batch(client, ops, max_concurrency=1, backoff=0)
+
+    assert report.results[0].ok and report.results[0].attempts == 2
+    assert fake.items[first.id]["name"] == "retried"
+    assert isinstance(report.results[1].error, httpx.ReadTimeout) and report.results[1].attempts == 2
+
+
+def test_transient_status_outside_batch(fake: FakeBW):
+    first = fake.client().get_items()[0]
+
+    def handler(request: httpx.Request):
+        if request.method != "GET":
+            return httpx.Response(503, json={"success": False, "message": "busy"})
+        return fake.handle(request)
+
+    client = Client(http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)))
+    with pytest.raises(Exception, match="busy") as caught:
+        client.put_item(first)
+    assert not isinstance(caught.value, httpx.HTTPStatusError)
+
+    report = bulk.apply_batch(client, [Op.update(first)], retries=1, backoff=0)
+    assert isinstance(report.results[0].error, httpx.HTTPStatusError) and report.results[0].attempts == 2
+
+
+def test_async_apply_batch(fake: FakeBW):
+    client = fake.async_client()
+    items = list(fake.items)[:5]
+
+    report = asyncio.run(client.apply_batch([Op.delete(x) for x in items], max_concurrency=2))
+
+    assert len(report.succeeded) == 5 and report.failed == []
+    assert all(fake.items[x]["deletedDate"] is not None for x in items)
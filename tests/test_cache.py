@@ -0,0 +1,123 @@
+import json
+
+import httpx
+
+from bw_sdk import Client, ObjectCache
+
+ITEM_ID = "0e9a5a3b-3b9e-4a8e-9b3e-b0a5012a1b2c"
+
+ITEM = {
+    "object": "item",
+    "id": ITEM_ID,
+    "organizationId": None,
+    "folderId": None,
+    "type": 2,
+    "reprompt": 0,
+    "name": "note",
+    "notes": "text",
+    "favorite": False,
+    "secureNote": {"type": 0},
+    "collectionIds": [],
+    "revisionDate": "2023-11-01T10:00:00.000Z",
+    "creationDate": "2023-11-01T10:00:00.000Z",
+    "deletedDate": None,
+    "passwordHistory": None,
+}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_and_ttl():
+    clock = Clock()
+    cache = ObjectCache(max_size=2, ttl={"item": 10.0}, clock=clock)
+
+    cache.put("item", "a", 1)
+    cache.put("item", "b", 2)
+    assert cache.get("item", "a") == 1
+    cache.put("item", "c", 3)
+    assert cache.get("item", "b") is None
+    assert cache.stats.evictions == 1
+
+    clock.now = 11.0
+    assert cache.get("item", "a") is None
+    assert cache.stats.expirations == 1
+
+    cache.put("folder", "x", 4)
+    assert cache.get("folder", "x") is None
+    assert len(cache) == 1
+
+
+def test_client_cache_invalidation():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(f"{request.method} {request.url.path}")
+        if request.url.path == "/sync":
+            data = {"object": "message", "noColor": False, "title": "Syncing complete.", "message": None}
+        else:
+            data = ITEM
+        return httpx.Response(200, content=json.dumps({"success": True, "data": data}))
+
+    client = Client(
+        http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)),
+        cache=ObjectCache(),
+    )
+    assert client.cache is not None
+
+    item = client.get_item(ITEM_ID)
+    cached = client.get_item(ITEM_ID)
+    assert cached == item and cached is not item
+    cached.name = "changed"
+    assert client.get_item(ITEM_ID).name == "note"
+    assert calls.count(f"GET /object/item/{ITEM_ID}") == 1
+
+    client.put_item(item)
+    client.get_item(ITEM_ID)
+    assert calls.count(f"GET /object/item/{ITEM_ID}") == 2
+
+    client.sync()
+    client.get_item(ITEM_ID)
+    assert calls.count(f"GET /object/item/{ITEM_ID}") == 3
+    assert client.cache.stats.hits == 2
+    assert client.cache.stats.misses == 3
+
+
+def test_stale_put_after_invalidation():
+    cache = ObjectCache()
+    generation = cache.generation("item", "a")
+    cache.invalidate("item", "a")
+    cache.put("item", "a", 1, generation)
+    assert cache.get("item", "a") is None
+
+    for invalidate in (lambda: cache.invalidate_type("item"), cache.clear):
+        generation = cache.generation("item", "a")
+        invalidate()
+        cache.put("item", "a", 1, generation)
+        assert cache.get("item", "a") is None
+    assert cache.stats.stale == 3
+
+    cache.put("item", "a", 2, cache.generation("item", "a"))
+    assert cache.get("item", "a") == 2
+
+
+def test_client_get_racing_write():
+    client: Client
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            client._invalidate("item", ITEM_ID)
+        return httpx.Response(200, content=json.dumps({"success": True, "data": ITEM}))
+
+    client = Client(
+        http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)),
+        cache=ObjectCache(),
+    )
+    assert client.cache is not None
+    client.get_item(ITEM_ID)
+    assert len(client.cache) == 0 and client.cache.stats.stale == 1
@@ -0,0 +1,60 @@
+import pytest
+
+import bw_sdk.model as _m
+from bw_sdk import DBStatus, SecretStr
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+
+@pytest.fixture
+def fake():
+    return FakeBW(generate_vault(100, seed=7), locked=True)
+
+
+def test_session(fake: FakeBW):
+    client = fake.client()
+    with pytest.raises(Exception, match="locked bw and no password"):
+        with client.session(None):
+            pass
+
+    with client.session(SecretStr("hunter2")) as session:
+        assert session.get_status().status == DBStatus.Unlocked
+        assert len(session.get_items()) == 100
+    assert fake.locked
+    assert fake.requests["POST /sync"] == 1
+
+
+def test_item_crud(fake: FakeBW):
+    client = fake.client()
+    client.unlock(SecretStr("hunter2"))
+
+    new = client.post_item(_m.NewItemLogin(name="new login", login=_m.LoginData(username="me", password="pw")))
+    assert isinstance(new, _m.ItemLogin)
+    assert client.find_item_login("new login", None, None, None, None, False, True).id == new.id
+
+    new.name = "renamed login"
+    client.put_item(new)
+    assert client.get_item(new.id).name == "renamed login"
+
+    client.del_item(new)
+    assert client.get_items("renamed login", exact=True) == []
+    assert [x.id for x in client.get_items("renamed login", trash=True)] == [new.id]
+
+    client.restore_item(new.id)
+    assert client.get_item_login(new.id).login.password == SecretStr("pw")
+
+
+def test_folders(fake: FakeBW):
+    client = fake.client()
+    client.unlock(SecretStr("hunter2"))
+
+    folder = client.post_folder(_m.NewFolder(name="ops"))
+    assert client.find_folder("ops", exact=True).id == folder.id
+
+    folder.name = "dev-ops"
+    client.put_folder(folder)
+    assert client.get_folder(folder.id).name == "dev-ops"
+
+    client.del_folder(folder)
+    assert client.get_folders("dev-ops") == []
@@ -0,0 +1,88 @@
+import asyncio
+import dataclasses
+
+import pytest
+
+import bw_sdk.model as _m
+from bw_sdk import CompactItem
+from bw_sdk.compact import ato_models, to_models
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+
+@pytest.fixture
+def fake():
+    return FakeBW(generate_vault(60, seed=7))
+
+
+def test_compact_items(fake: FakeBW):
+    client = fake.client()
+    models = {x.id: x for x in client.get_items()}
+    compact = client.get_items_compact()
+
+    assert [x.id for x in compact] == list(models)
+    for item in compact:
+        model = models[item.id]
+        assert item.to_model(client) == model
+        assert item.name == model.name and item.type == _m.ITEM_TYPES[type(model)]
+        assert item.revised_at == model.revised_at and item.deleted_at is None
+        assert item.coll_ids == tuple(model.coll_ids)
+        assert item.to_summary() == _m.ItemSummary.model_validate(model.model_dump(by_alias=True))
+        if isinstance(model, _m.ItemLogin):
+            assert item.username == model.login.username
+
+    by_coll: dict[tuple[str, ...], set[int]] = {}
+    for item in compact:
+        by_coll.setdefault(item.coll_ids, set()).add(id(item.coll_ids))
+    assert all(len(x) == 1 for x in by_coll.values())
+    orgs = {id(x.org_id) for x in compact if x.org_id is not None}
+    assert len(orgs) == len({x.org_id for x in compact if x.org_id is not None})
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(compact[0], "name", "changed")
+    assert not hasattr(compact[0], "__dict__")
+
+
+def test_compact_drops_secrets(fake: FakeBW):
+    compact = fake.client().get_items_compact()
+    fields = {x.name for x in dataclasses.fields(CompactItem)}
+    assert fields.isdisjoint({"raw", "notes", "login", "card", "identity", "fields", "passwordHistory"})
+    for item in compact:
+        record = fake.items[item.id]
+        secrets = [record.get("notes"), *(x.get("value") for x in record.get("fields") or [])]
+        secrets += [(record.get("login") or {}).get(x) for x in ("password", "totp")]
+        assert not any(isinstance(x, str) and x in dataclasses.astuple(item) for x in secrets)
+
+
+def test_compact_filters(fake: FakeBW):
+    client = fake.client()
+    name = next(iter(fake.items.values()))["name"]
+    found = client.get_items_compact(search=name, exact=True)
+    assert [x.name for x in found] == [name]
+    assert isinstance(found[0], CompactItem)
+
+    async def run():
+        return await fake.async_client().get_items_compact()
+
+    assert len(asyncio.run(run())) == len(fake.items)
+
+
+@pytest.mark.parametrize("size", [10, 100])
+def test_to_models_batches(size: int):
+    fake = FakeBW(generate_vault(size, seed=7))
+    client = fake.client()
+    expected = client.get_items()
+    compact = client.get_items_compact()[::-1]
+    requests = dict(fake.requests)
+
+    assert to_models(client, compact) == expected[::-1]
+    lists = fake.requests["GET /list/object"] - requests.get("GET /list/object", 0)
+    gets = fake.requests["GET /object/item"] - requests.get("GET /object/item", 0)
+    assert (lists, gets) == ((1, 0) if size >= 64 else (0, size))
+
+    async def run():
+        async_client = fake.async_client()
+        return await ato_models(async_client, await async_client.get_items_compact())
+
+    assert asyncio.run(run()) == expected
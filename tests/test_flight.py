@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from bw_sdk import AsyncClient, AsyncSingleFlight, Client, SingleFlight
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+MISSING = "6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c"
+
+
+@pytest.fixture
+def fake():
+    return FakeBW(generate_vault(20, seed=5))
+
+
+def _wait_for(cond, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not cond():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.001)
+
+
+def test_single_flight(fake: FakeBW):
+    release = threading.Event()
+
+    def handler(request: httpx.Request):
+        release.wait()
+        return fake.handle(request)
+
+    flight = SingleFlight()
+    client = Client(
+        http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)), single_flight=flight
+    )
+    item_id = list(fake.items)[0]
+    results: list[object] = []
+
+    def work(obj_id: str):
+        try:
+            results.append(client.get_item(obj_id))
+        except Exception as exc:
+            results.append(exc)
+
+    threads = [threading.Thread(target=work, args=(x,)) for x in [item_id] * 6 + [MISSING] * 2]
+    for thread in threads:
+        thread.start()
+    _wait_for(lambda: flight.stats.calls == 8)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    items = [x for x in results if not isinstance(x, Exception)]
+    errors = [x for x in results if isinstance(x, Exception)]
+    assert len(items) == 6 and all(x == items[0] for x in items)
+    assert len({id(x) for x in items}) == 6
+    assert len(errors) == 2 and all("Not found" in str(x) for x in errors)
+    assert (flight.stats.leaders, flight.stats.collapsed) == (2, 6)
+    assert fake.requests["GET /object/item"] == 2
+    assert len(flight) == 0
+
+    client.get_items("a")
+    client.get_items("b")
+    client.get_item_summaries("a")
+    assert flight.stats.collapsed == 6
+
+
+def test_async_single_flight(fake: FakeBW):
+    async def handler(request: httpx.Request):
+        await asyncio.sleep(0.01)
+        return fake.handle(request)
+
+    flight = AsyncSingleFlight()
+    client = AsyncClient(
+        http_client=httpx.AsyncClient(base_url="http://bw", transport=httpx.MockTransport(handler)),
+        single_flight=flight,
+    )
+
+    async def run():
+        return await asyncio.gather(*(client.get_items(search="a") for _ in range(5)), client.get_items(search="b"))
+
+    *same, other = asyncio.run(run())
+    assert all(x == same[0] for x in same) and len({id(x) for x in same}) == 5
+    same[1][0].name = "changed"
+    assert same[0][0].name != "changed"
+    assert (flight.stats.leaders, flight.stats.collapsed) == (2, 4)
+    assert fake.requests["GET /list/object"] == 2
+
+
+def test_async_leader_cancel(fake: FakeBW):
+    async def handler(request: httpx.Request):
+        await asyncio.sleep(0.05)
+        return fake.handle(request)
+
+    flight = AsyncSingleFlight()
+    client = AsyncClient(
+        http_client=httpx.AsyncClient(base_url="http://bw", transport=httpx.MockTransport(handler)),
+        single_flight=flight,
+    )
+
+    async def run():
+        leader = asyncio.ensure_future(client.get_items(search="a"))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(client.get_items(search="a")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        assert leader.cancelled() and all(x == results[0] for x in results)
+        assert len({id(x) for x in results}) == 3
+
+        alone = asyncio.ensure_future(client.get_items(search="b"))
+        await asyncio.sleep(0.01)
+        alone.cancel()
+        await asyncio.sleep(0.1)
+        assert alone.cancelled() and len(flight) == 0
+
+    asyncio.run(run())
+    assert fake.requests["GET /list/object"] == 1
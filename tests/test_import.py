@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET_MS = float(os.environ.get("BW_SDK_IMPORT_BUDGET_MS", "150"))
+
+CHECK_LAZY = """
+import bw_sdk
+from bw_sdk._util import LazyAdapter
+
+adapters = [v for v in vars(bw_sdk).values() if isinstance(v, LazyAdapter)]
+adapters += list(bw_sdk.SpecificItemsAdapter.values())
+print(len(adapters), sum(a.is_built for a in adapters))
+"""
+
+CHECK_DEFERRED = """
+import sys
+import bw_sdk
+
+print(" ".join(x for x in ("sqlite3", "multiprocessing") if x in sys.modules))
+bw_sdk.MetadataIndex
+print("sqlite3" in sys.modules)
+"""
+
+
+def run(*args: str):
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+def test_adapters_are_lazy():
+    total, built = map(int, run("-c", CHECK_LAZY).stdout.split())
+    assert total > 0
+    assert built == 0
+
+
+def test_features_are_deferred():
+    loaded, index_loaded = run("-c", CHECK_DEFERRED).stdout.splitlines()
+    assert loaded == ""
+    assert index_loaded == "True"
+
+
+@pytest.mark.bench
+def test_import_time():
+    res = run("-X", "importtime", "-c", "import bw_sdk")
+
+    own: dict[str, int] = {}
+    for line in res.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        if name.strip().startswith("bw_sdk") and self_us.strip().isdigit():
+            own[name.strip()] = int(self_us)
+
+    total_ms = sum(own.values()) / 1000
+    print(f"bw_sdk import: {total_ms:.1f}ms", {name: f"{us / 1000:.1f}ms" for name, us in own.items()})
+    assert "bw_sdk" in own
+    assert total_ms < IMPORT_BUDGET_MS
@@ -0,0 +1,110 @@
+import stat
+from pathlib import Path
+
+import pytest
+
+import bw_sdk.index
+import bw_sdk.model as _m
+from bw_sdk import MetadataIndex, VaultSnapshot
+
+from .fake_bw import FakeBW
+from .vault import HOSTS, generate_vault
+
+
+@pytest.fixture
+def fake():
+    return FakeBW(generate_vault(400, seed=5))
+
+
+def _ids(objs):
+    return sorted(x.id for x in objs)
+
+
+@pytest.mark.parametrize("trigram", [True, False])
+def test_matches_snapshot(fake: FakeBW, monkeypatch: pytest.MonkeyPatch, trigram: bool):
+    if not trigram:
+        monkeypatch.setattr(bw_sdk.index, "_has_trigram", lambda conn: False)
+    client = fake.client()
+    index = MetadataIndex.from_client(client)
+    assert index.trigram is trigram
+    snapshot = VaultSnapshot.from_client(client)
+    assert len(index) == len(snapshot) == len(fake.items)
+
+    some = next(iter(fake.items.values()))
+    coll = next(iter(fake.collections.values()))
+    folder = next(iter(fake.folders.values()))
+    queries = [
+        {"search": some["name"][:5]},
+        {"search": some["name"].upper()[2:6]},
+        {"search": "ab"},
+        {"search": some["id"][:8]},
+        {"search": some["id"][:4] + "%___"},
+        {"search": HOSTS[1]},
+        {"search": some["name"], "exact": True},
+        {"coll_id": coll["id"]},
+        {"org_id": coll["organizationId"]},
+        {"folder_id": folder["id"]},
+        {"url": f"https://{HOSTS[0]}/x"},
+        {"search": "a", "folder_id": folder["id"]},
+    ]
+    for query in queries:
+        assert _ids(index.get_items(**query)) == _ids(snapshot.get_items(**query)), query
+    assert index.get_items(search="________") == []
+
+    summary = index.find_item(some["name"], exact=True)
+    assert summary.coll_ids == some["collectionIds"] and summary.folder_id == some["folderId"]
+    assert client.get_item(summary).id == some["id"]
+    assert index.find_folder(folder["name"], exact=True).id == folder["id"]
+    assert index.find_collection(coll["name"], org_id=coll["organizationId"], exact=True).id == coll["id"]
+    assert [x.type for x in index.get_items(item_type=_m.ItemType.Card)] == [_m.ItemType.Card] * len(
+        snapshot.get_item_cards()
+    )
+
+
+def test_incremental_refresh(fake: FakeBW, tmp_path: Path):
+    client = fake.client()
+    path = tmp_path / "index.sqlite"
+    index = MetadataIndex.from_client(client, path)
+    unchanged = index.refresh(client)
+    assert not unchanged and unchanged.validated == 0
+
+    ids = list(fake.items)
+    fake.items[ids[0]] = {**fake.items[ids[0]], "name": "zebra crossing", "revisionDate": "2030-01-01T00:00:00.000Z"}
+    fields = [{"name": "deploy token", "value": "x", "type": 1, "linkedId": None}]
+    fake.items[ids[1]] = {**fake.items[ids[1]], "fields": fields, "revisionDate": "2030-01-01T00:00:00.000Z"}
+    client.del_item(ids[2])
+    del fake.items[ids[3]]
+
+    report = index.refresh(client, sync=True)
+    assert report.changed == [ids[0], ids[1], ids[2]] and report.deleted == [ids[3]]
+    assert report.validated == 3 and report.scanned == len(fake.items)
+
+    assert index.search_ids("zebra") == [ids[0]]
+    assert index.search_ids("zebra crossing", exact=True) == [ids[0]]
+    assert index.search_ids(field="deploy token") == [ids[1]]
+    assert index.search_ids(trash=True) == [ids[2]]
+    assert ids[3] not in index.search_ids()
+    last_sync = index.last_sync
+    index.close()
+
+    with MetadataIndex(path) as reopened:
+        assert reopened.last_sync == last_sync
+        assert reopened.search_ids("zebra") == [ids[0]]
+        assert not reopened.refresh(client)
+
+
+def test_on_disk_index(fake: FakeBW, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "index.sqlite"
+    MetadataIndex.from_client(fake.client(), path).close()
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    monkeypatch.setattr(bw_sdk.index, "_has_trigram", lambda conn: False)
+    with pytest.raises(Exception, match="needs SQLite >= 3.34 with FTS5"):
+        MetadataIndex(path)
+
+    plain = tmp_path / "plain.sqlite"
+    MetadataIndex.from_client(fake.client(), plain).close()
+    monkeypatch.undo()
+    with MetadataIndex(plain) as index:
+        assert not index.trigram
+        assert len(index.get_items(search=HOSTS[1])) > 0
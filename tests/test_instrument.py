@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+import bw_sdk.model as _m
+from bw_sdk import CallEvent, MetricsAggregator, SecretStr
+from bw_sdk.instrument import Histogram, endpoint_of
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+
+@pytest.fixture
+def fake():
+    return FakeBW(generate_vault(50, seed=3))
+
+
+def test_endpoint_of():
+    assert endpoint_of("/object/item/6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c") == "/object/item/{id}"
+    assert endpoint_of("/restore/item/6C2CF2D1-1B3E-4D0E-A7A4-B0A5012A1B2C") == "/restore/item/{id}"
+    assert endpoint_of("/object/fingerprint/me") == "/object/fingerprint/me"
+
+
+def test_histogram():
+    hist = Histogram([0.01, 0.1, 1.0])
+    for value in (0.005, 0.05, 0.05, 0.5, 5.0):
+        hist.observe(value)
+    assert hist.count == 5
+    assert hist.quantile(0.5) == 0.1
+    assert hist.quantile(1.0) == float("inf")
+    assert hist.as_dict()["buckets"] == {"0.01": 1, "0.1": 3, "1.0": 4, "inf": 5}
+
+
+def test_events(fake: FakeBW):
+    events: list[CallEvent] = []
+    client = fake.client(hooks=[events.append])
+
+    items = client.get_items()
+    event = events[-1]
+    assert (event.method, event.endpoint, event.status) == ("GET", "/list/object/items", 200)
+    assert event.item_count == len(items) == 50
+    assert event.bytes_received > 0
+    assert event.http_latency > 0 and event.validation_latency > 0
+    assert event.error is None
+
+    client.get_item(items[0].id)
+    assert (events[-1].endpoint, events[-1].item_count) == ("/object/item/{id}", 1)
+
+    with pytest.raises(Exception, match="Not found"):
+        client.get_folder("6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c")
+    assert (events[-1].status, events[-1].error) == (404, "Not found.")
+
+    with pytest.raises(Exception):
+        client.del_item("6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c")
+    assert (events[-1].method, events[-1].status) == ("DELETE", 404)
+    assert events[-1].error is not None
+
+    assert len(list(client.iter_items())) == 50
+    assert (events[-1].item_count, events[-1].bytes_received) == (50, len(fake.list_body()))
+
+    with pytest.raises(Exception, match="Invalid master password"):
+        client.unlock(SecretStr("wrong"))
+    assert events[-1].error == "Invalid master password."
+
+
+def test_failing_hook(fake: FakeBW, caplog: pytest.LogCaptureFixture):
+    def broken(event: CallEvent):
+        raise RuntimeError("broken hook")
+
+    events: list[CallEvent] = []
+    client = fake.client(hooks=[broken, events.append])
+    assert len(client.get_items()) == 50
+    assert [x.endpoint for x in events] == ["/list/object/items"]
+    assert "broken hook" in caplog.text and "/list/object/items" in caplog.text
+
+    with pytest.raises(Exception, match="Not found"):
+        client.get_folder("6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c")
+    assert events[-1].status == 404
+
+
+def test_aggregator(fake: FakeBW):
+    metrics = MetricsAggregator()
+    client = fake.client(hooks=[metrics])
+
+    items = client.get_items()
+    for item in items[:10]:
+        client.get_item(item)
+    client.put_item(items[0])
+    client.post_folder(_m.NewFolder(name="ops"))
+
+    report = metrics.report()
+    assert set(report) == {
+        "GET /list/object/items",
+        "GET /object/item/{id}",
+        "PUT /object/item/{id}",
+        "POST /object/folder",
+    }
+    assert report["GET /object/item/{id}"]["calls"] == 10
+    assert report["GET /object/item/{id}"]["http_latency"]["count"] == 10
+    assert report["GET /list/object/items"]["items"] == 50
+    assert all(x["errors"] == 0 for x in report.values())
+
+    metrics.reset()
+    assert metrics.report() == {}
+
+
+def test_async_events(fake: FakeBW):
+    events: list[CallEvent] = []
+    client = fake.async_client(hooks=[events.append])
+
+    async def run():
+        await client.get_items()
+        return [x async for x in client.iter_folders()]
+
+    folders = asyncio.run(run())
+    assert [x.endpoint for x in events] == ["/list/object/items", "/list/object/folders"]
+    assert events[-1].item_count == len(folders)
@@ -0,0 +1,56 @@
+import json
+import time
+
+import httpx
+
+import bw_sdk.model as _m
+from bw_sdk import Client, ItemsResp
+
+from .vault import generate_items
+
+
+def make_client(items: list[dict]):
+    body = json.dumps({"success": True, "data": {"object": "list", "data": items}}).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body)
+
+    return Client(http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler))), body
+
+
+def test_typed_listing():
+    items = generate_items(200, seed=1)
+    client, _ = make_client(items)
+
+    expected = {typ: [x["id"] for x in items if x["type"] == tag] for typ, tag in _m.ITEM_TYPES.items()}
+    assert [x.id for x in client.get_item_logins()] == expected[_m.ItemLogin]
+    assert [x.id for x in client.get_item_securenotes()] == expected[_m.ItemSecureNote]
+    assert [x.id for x in client.get_item_cards()] == expected[_m.ItemCard]
+    assert [x.id for x in client.get_item_identities()] == expected[_m.ItemIdentity]
+
+    card = next(x for x in items if x["type"] == 3)
+    assert client.find_item_card(card["name"], None, None, None, None, False, True).id == card["id"]
+
+
+def test_typed_listing_benchmark():
+    items = generate_items(2000, seed=2, weights=(1, 1, 1, 1))
+    client, body = make_client(items)
+
+    def full():
+        return [x for x in ItemsResp.validate_json(body).data.data if isinstance(x, _m.ItemCard)]
+
+    def prefiltered():
+        return client.get_item_cards()
+
+    timings = {}
+    for name, fn in [("full", full), ("prefiltered", prefiltered)]:
+        fn()
+        start = time.process_time()
+        for _ in range(3):
+            res = fn()
+        timings[name] = (time.process_time() - start) / 3
+        assert len(res) == sum(1 for x in items if x["type"] == 3)
+
+    full_ms, prefiltered_ms = timings["full"] * 1000, timings["prefiltered"] * 1000
+    print(f"cards from {len(items)} items: full {full_ms:.1f}ms prefiltered {prefiltered_ms:.1f}ms")
+    assert timings["prefiltered"] < timings["full"]
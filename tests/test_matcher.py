@@ -0,0 +1,107 @@
+import sys
+import warnings
+
+import pytest
+
+import bw_sdk.matcher
+from bw_sdk import Match, UriMatcher
+from bw_sdk.matcher import base_domain, host_port
+
+from .test_snapshot import make_item
+
+
+def login(idx: int, *uris: tuple[Match | None, str], **extra):
+    data = {"uris": [{"match": m, "uri": u} for m, u in uris], "username": f"user{idx}", "password": "pw"}
+    return make_item(idx, 1, f"login {idx}", login=data, **extra)
+
+
+@pytest.fixture
+def matcher():
+    return UriMatcher(
+        [
+            login(1, (None, "https://github.com/login")),
+            login(2, (Match.Host, "https://mail.example.com:8443")),
+            login(3, (Match.StartsWith, "https://example.com/app/")),
+            login(4, (Match.Regexp, r"^https://[a-z]+\.corp\.local/")),
+            login(5, (Match.Excact, "https://bank.co.uk/login")),
+            login(6, (Match.Never, "https://github.com")),
+            login(7, (Match.BaseDomain, "shop.bank.co.uk"), (Match.Regexp, "[")),
+            login(8, (None, "https://github.com"), deletedDate="2023-11-02T10:00:00.000Z"),
+            make_item(9, 2, "note", secureNote={"type": 0}),
+        ]
+    )
+
+
+def ids(items):
+    return [int(x.id[-3:]) for x in items]
+
+
+def test_helpers():
+    pytest.importorskip("tldextract")
+    assert base_domain("a.b.github.com") == "github.com"
+    assert base_domain("www.bank.co.uk") == "bank.co.uk"
+    assert base_domain("10.0.0.1") == "10.0.0.1"
+    assert base_domain("localhost") == "localhost"
+    assert host_port("https://user@Mail.Example.com:8443/x") == "mail.example.com:8443"
+    assert host_port("example.com") == "example.com"
+
+
+def test_strategies(matcher: UriMatcher):
+    pytest.importorskip("tldextract")
+    assert len(matcher) == 6
+    assert ids(matcher.match("https://gist.github.com/x")) == [1]
+    assert ids(matcher.match("https://mail.example.com:8443/inbox")) == [2]
+    assert ids(matcher.match("https://mail.example.com/inbox")) == []
+    assert ids(matcher.match("https://example.com/app/settings")) == [3]
+    assert ids(matcher.match("https://example.com/other")) == []
+    assert ids(matcher.match("https://wiki.corp.local/page")) == [4]
+    assert ids(matcher.match("https://bank.co.uk/login")) == [5, 7]
+    assert ids(matcher.match("https://bank.co.uk/login?x=1")) == [7]
+    assert ids(matcher.match("https://unknown.org")) == []
+
+
+def test_updates_and_batch(matcher: UriMatcher):
+    pytest.importorskip("tldextract")
+    matcher.remove_item(login(1))
+    matcher.add_item(login(2, (None, "github.com")))
+    res = matcher.match_urls(["https://github.com", "https://mail.example.com:8443", "https://github.com"])
+    assert {url: ids(items) for url, items in res.items()} == {
+        "https://github.com": [2],
+        "https://mail.example.com:8443": [],
+    }
+
+
+def test_public_suffixes():
+    pytest.importorskip("tldextract")
+    assert base_domain("a.github.io") == "a.github.io"
+    assert base_domain("x.a.github.io") == "a.github.io"
+    assert base_domain("github.io") == "github.io"
+    assert base_domain("tenant.herokuapp.com") == "tenant.herokuapp.com"
+    assert base_domain("www.city.kawasaki.jp") == "city.kawasaki.jp"
+    assert base_domain("wiki.corp.local") == "wiki.corp.local"
+
+    matcher = UriMatcher([login(1, (None, "https://a.github.io/")), login(2, (None, "https://one.herokuapp.com"))])
+    assert ids(matcher.match("https://docs.a.github.io/x")) == [1]
+    assert ids(matcher.match("https://b.github.io/")) == []
+    assert ids(matcher.match("https://two.herokuapp.com")) == []
+
+
+def test_fails_closed_without_public_suffixes(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(bw_sdk.matcher, "_public_suffixes", lambda: None)
+    assert base_domain("gist.github.com") == "gist.github.com"
+    matcher = UriMatcher([login(1, (None, "https://github.com/login"))])
+    assert ids(matcher.match("https://github.com/explore")) == [1]
+    assert ids(matcher.match("https://gist.github.com/x")) == []
+
+
+def test_warns_once_without_tldextract(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(sys.modules, "tldextract", None)
+    bw_sdk.matcher._public_suffixes.cache_clear()
+    try:
+        with pytest.warns(RuntimeWarning, match="exact host matching"):
+            matcher = UriMatcher([login(1, (None, "https://github.com/login"))])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert ids(matcher.match("https://gist.github.com/x")) == []
+    finally:
+        bw_sdk.matcher._public_suffixes.cache_clear()
@@ -0,0 +1,46 @@
+import pytest
+
+import bw_sdk.parallel
+from bw_sdk import ItemsResp, ParallelParser
+from bw_sdk.parallel import free_threaded, split
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+
+@pytest.fixture
+def fake():
+    return FakeBW(generate_vault(300, seed=11))
+
+
+def test_split():
+    assert split(list(range(7)), 3) == [[0, 1, 2], [3, 4], [5, 6]]
+    assert split([1], 4) == [[1]]
+
+
+@pytest.mark.parametrize("mode", ["thread", "serial"])
+def test_parallel_matches_serial(fake: FakeBW, mode):
+    expected = fake.client().get_items()
+    with ParallelParser(workers=3, threshold=0, mode=mode) as parser:
+        client = fake.client(parallel=parser)
+        assert client.get_items() == expected
+        assert [x.name for x in client.get_folders()] == [x["name"] for x in fake.folders.values()]
+        assert (parser._pool is not None) is (mode == "thread")
+
+        fake.locked = True
+        with pytest.raises(Exception, match="Vault is locked"):
+            client.get_items()
+
+
+def test_parallel_threshold(fake: FakeBW):
+    parser = ParallelParser(workers=4, mode="thread")
+    client = fake.client(parallel=parser)
+    assert len(client.get_items()) == 300
+    assert parser._pool is None
+    assert parser.adapter(ItemsResp) is parser.adapter(ItemsResp)
+
+
+def test_auto_mode(monkeypatch: pytest.MonkeyPatch):
+    assert ParallelParser().mode == ("thread" if free_threaded() else "serial")
+    monkeypatch.setattr(bw_sdk.parallel, "free_threaded", lambda: True)
+    assert ParallelParser().mode == "thread"
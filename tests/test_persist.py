@@ -0,0 +1,138 @@
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import pytest
+
+import bw_sdk.model as _m
+from bw_sdk import SecretStr, VaultSnapshot, load_snapshot, save_snapshot, warm_start
+from bw_sdk.persist import _HEADER, NONCE_SIZE, VERSION, generate_key, read_meta
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+pytest.importorskip("cryptography")
+
+USER_ID = "6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c"
+
+
+@pytest.fixture
+def fake():
+    return FakeBW(generate_vault(200, seed=13))
+
+
+def test_roundtrip(fake: FakeBW, tmp_path: Path):
+    snapshot = VaultSnapshot.from_client(fake.client())
+    key = generate_key()
+    path = tmp_path / "vault.snap"
+
+    save_snapshot(snapshot, path, key, USER_ID)
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert b"password" not in path.read_bytes()
+
+    meta = read_meta(path)
+    assert (meta.user_id, meta.last_sync, meta.items) == (USER_ID, snapshot.last_sync, 200)
+
+    loaded, _ = load_snapshot(path, key, USER_ID)
+    assert loaded.items == snapshot.items
+    assert loaded.folders == snapshot.folders and loaded.collections == snapshot.collections
+    login = next(x for x in loaded.items.values() if isinstance(x, _m.ItemLogin))
+    assert loaded.get_item_logins(login.name, exact=True)[0].login.password == login.login.password
+    assert isinstance(login.login.password, SecretStr)
+
+    with pytest.raises(Exception, match="another user"):
+        load_snapshot(path, key, "00000000-0000-4000-8000-000000000000")
+    with pytest.raises(Exception, match="could not be decrypted"):
+        load_snapshot(path, generate_key())
+
+    blob = bytearray(path.read_bytes())
+    blob[blob.index(b'"items": 200') + 10] = ord("9")
+    path.write_bytes(bytes(blob))
+    with pytest.raises(Exception, match="could not be decrypted"):
+        load_snapshot(path, key)
+
+
+def test_warm_start(fake: FakeBW, tmp_path: Path):
+    key = generate_key()
+    path = tmp_path / "vault.snap"
+    client = fake.client()
+
+    snapshot, thread = warm_start(client, path, key)
+    assert thread is None and len(snapshot) == 200 and path.exists()
+
+    item_id = next(iter(fake.items))
+    time.sleep(0.002)
+    fake.items[item_id] = {**fake.items[item_id], "name": "renamed", "revisionDate": "2024-06-01T00:00:00.000Z"}
+    fake.requests.clear()
+    client.sync()
+
+    for idx, obj_id in enumerate(list(fake.items)[1:150]):
+        fake.items[obj_id] = {**fake.items[obj_id], "name": f"bulk {idx}", "revisionDate": "2024-06-01T00:00:00.000Z"}
+    errors: list[Exception] = []
+
+    warm, thread = warm_start(client, path, key)
+    assert warm.get_item(item_id).name != "renamed"
+    assert thread is not None
+
+    def read():
+        try:
+            while thread.is_alive():
+                assert len(warm.get_items()) == 200
+                warm.get_items(search="bulk")
+        except Exception as exc:
+            errors.append(exc)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    thread.join()
+    reader.join()
+    assert errors == []
+    assert warm.get_item(item_id).name == "renamed"
+    assert load_snapshot(path, key)[0].get_item(item_id).name == "renamed"
+
+    blob = bytearray(path.read_bytes())
+    blob[6] = VERSION - 1
+    path.write_bytes(bytes(blob))
+    rebuilt, thread = warm_start(client, path, key)
+    assert thread is None and rebuilt.get_item(item_id).name == "renamed"
+    assert read_meta(path).version == VERSION
+
+
+def _reseal(blob: bytes, key: bytes, payload: bytes):
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    header = blob[: _HEADER.size + _HEADER.unpack_from(blob)[2]]
+    nonce = os.urandom(NONCE_SIZE)
+    return header + nonce + AESGCM(key).encrypt(nonce, payload, header[_HEADER.size :])
+
+
+@pytest.mark.parametrize("damage", ["wrong key", "garbage", "truncated", "not zlib", "invalid records"])
+def test_warm_start_rebuilds(fake: FakeBW, tmp_path: Path, caplog: pytest.LogCaptureFixture, damage: str):
+    key = generate_key()
+    path = tmp_path / "vault.snap"
+    client = fake.client()
+    warm_start(client, path, key)
+    blob = path.read_bytes()
+
+    match damage:
+        case "wrong key":
+            key = generate_key()
+        case "garbage":
+            path.write_bytes(b"not a snapshot")
+        case "truncated":
+            path.write_bytes(blob[: len(blob) // 2])
+        case "not zlib":
+            path.write_bytes(_reseal(blob, key, b"not zlib"))
+        case "invalid records":
+            records = {"items": [{"type": 99}], "folders": [], "collections": [], "organizations": []}
+            path.write_bytes(_reseal(blob, key, zlib.compress(json.dumps(records).encode())))
+
+    with caplog.at_level(logging.WARNING, logger="bw_sdk.persist"):
+        rebuilt, thread = warm_start(client, path, key)
+    assert thread is None and len(rebuilt) == 200
+    assert "unusable, rebuilding" in caplog.text
+    assert len(load_snapshot(path, key)[0]) == 200
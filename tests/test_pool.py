@@ -0,0 +1,193 @@
+import threading
+import time
+
+import httpx
+import pytest
+
+import bw_sdk.model as _m
+from bw_sdk import BackendPool, Client, NewPooledClient, SecretStr
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+
+@pytest.fixture
+def fakes():
+    vault = generate_vault(30, seed=9)
+    return [FakeBW(vault, locked=True) for _ in range(3)]
+
+
+def _pool(client: Client) -> BackendPool:
+    return client.http_client._transport
+
+
+def _wait_for(cond, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not cond():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.001)
+
+
+def test_pool_routing(fakes: list[FakeBW]):
+    client = NewPooledClient([x.client() for x in fakes], sync_after_write=True)
+
+    client.unlock(SecretStr("hunter2"))
+    assert not any(x.locked for x in fakes)
+
+    for _ in range(30):
+        client.get_folders()
+    counts = [x.requests["GET /list/object"] for x in fakes]
+    assert sum(counts) == 30 and all(x == 10 for x in counts)
+
+    item = client.post_item(_m.NewItemLogin(name="pooled"))
+    owners = [x for x in fakes if item.id in x.items]
+    assert len(owners) == 1
+    assert [x.requests["POST /sync"] for x in fakes if x is not owners[0]] == [1, 1]
+
+    client.sync()
+    assert all(x.requests["POST /sync"] >= 1 for x in fakes)
+
+    client.lock()
+    assert all(x.locked for x in fakes)
+
+
+def test_pool_least_outstanding(fakes: list[FakeBW]):
+    for fake in fakes:
+        fake.locked = False
+    gate = threading.Event()
+
+    def slow(request: httpx.Request):
+        if request.url.path != "/status":
+            gate.wait()
+        return fakes[0].handle(request)
+
+    slow_client = Client(http_client=httpx.Client(base_url="http://slow", transport=httpx.MockTransport(slow)))
+    client = NewPooledClient([slow_client, fakes[1].client(), fakes[2].client()])
+    pool = _pool(client)
+    pool.check_health()
+
+    blocked = threading.Thread(target=client.get_folders)
+    blocked.start()
+    _wait_for(lambda: pool.backends[0].outstanding > 0)
+
+    for _ in range(10):
+        client.get_folders()
+    assert fakes[0].requests["GET /list/object"] == 0
+    assert fakes[1].requests["GET /list/object"] + fakes[2].requests["GET /list/object"] == 10
+
+    gate.set()
+    blocked.join()
+    assert fakes[0].requests["GET /list/object"] == 1
+
+
+def test_pool_health(fakes: list[FakeBW]):
+    for fake in fakes:
+        fake.locked = False
+
+    def down(request: httpx.Request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    dead = Client(http_client=httpx.Client(base_url="http://dead", transport=httpx.MockTransport(down)))
+    now = [0.0]
+    pool = BackendPool([dead, fakes[0].client()], health_interval=10, clock=lambda: now[0])
+    client = Client(http_client=httpx.Client(base_url="http://bw-pool", transport=pool))
+
+    assert len(client.get_items()) == 30
+    assert [x.healthy for x in pool.backends] == [False, True]
+    assert "connection refused" in pool.backends[0].error
+
+    pool.backends[0].healthy = True
+    for _ in range(3):
+        assert len(client.get_items()) == 30
+    assert not pool.backends[0].healthy
+    assert pool.backends[0].served <= 1
+
+    now[0] = 20
+    assert pool.check_health() == [pool.backends[1]]
+
+    only_dead = Client(http_client=httpx.Client(base_url="http://bw-pool", transport=BackendPool([dead])))
+    with pytest.raises(Exception, match="no healthy"):
+        only_dead.get_items()
+
+
+def test_pool_partial_transitions(fakes: list[FakeBW]):
+    fakes[1].password = "other"
+    client = NewPooledClient([x.client() for x in fakes])
+    with pytest.raises(Exception, match="Invalid master password"):
+        client.unlock(SecretStr("hunter2"))
+    assert [x.locked for x in fakes] == [False, True, False]
+
+    item = client.post_item(_m.NewItemLogin(name="synced"))
+    owner = next(x for x in fakes if item.id in x.items)
+    assert [x.stale for x in _pool(client).backends] == [x is not owner and x.locked for x in fakes]
+
+    resets = [1]
+
+    def flaky(request: httpx.Request):
+        if request.url.path == "/lock" and resets[0]:
+            resets[0] -= 1
+            raise httpx.ReadError("connection reset", request=request)
+        return fakes[2].handle(request)
+
+    flaky_client = Client(http_client=httpx.Client(base_url="http://flaky", transport=httpx.MockTransport(flaky)))
+    client = NewPooledClient([fakes[0].client(), flaky_client])
+    pool = _pool(client)
+    with pytest.raises(Exception, match="/lock failed on http://flaky"):
+        client.lock()
+    assert fakes[0].locked and not fakes[2].locked
+    assert pool.backends[1].missed == "/lock"
+
+    reads = fakes[2].requests["GET /list/object"]
+    with pytest.raises(Exception, match="Vault is locked"):
+        client.get_folders()
+    assert fakes[2].requests["GET /list/object"] == reads
+
+    pool.check_health()
+    assert fakes[2].locked and pool.backends[1].missed is None
+
+
+def test_pool_missed_unlock(fakes: list[FakeBW]):
+    down = [True]
+
+    def flaky(request: httpx.Request):
+        if down[0]:
+            raise httpx.ConnectError("connection refused", request=request)
+        return fakes[1].handle(request)
+
+    flaky_client = Client(http_client=httpx.Client(base_url="http://flaky", transport=httpx.MockTransport(flaky)))
+    now = [0.0]
+    pool = BackendPool([fakes[0].client(), flaky_client], health_interval=10, clock=lambda: now[0])
+    client = Client(http_client=httpx.Client(base_url="http://bw-pool", transport=pool))
+    pool.check_health()
+
+    client.unlock(SecretStr("hunter2"))
+    assert pool.backends[1].missed == "/unlock"
+
+    down[0] = False
+    now[0] = 20
+    for _ in range(4):
+        client.get_folders()
+    assert pool.backends[1].healthy and fakes[1].requests["GET /list/object"] == 0
+
+    client.unlock(SecretStr("hunter2"))
+    assert pool.backends[1].missed is None and not fakes[1].locked
+
+
+def test_pool_stale_without_sync(fakes: list[FakeBW]):
+    for fake in fakes:
+        fake.locked = False
+    client = NewPooledClient([x.client() for x in fakes], sync_after_write=False)
+    pool = _pool(client)
+
+    item = client.post_item(_m.NewItemLogin(name="not synced"))
+    owner = next(x for x in fakes if item.id in x.items)
+    assert sum(x.requests["POST /sync"] for x in fakes) == 0
+    assert [x.stale for x in pool.backends] == [x is not owner for x in fakes]
+
+    for _ in range(6):
+        client.get_folders()
+    assert [x.requests["GET /list/object"] for x in fakes] == [6 if x is owner else 0 for x in fakes]
+
+    client.sync()
+    assert not any(x.stale for x in pool.backends)
@@ -0,0 +1,108 @@
+import asyncio
+import io
+from pathlib import Path
+
+import pytest
+
+from bw_sdk import AsyncRenderer, Renderer
+from bw_sdk.render import tokenize
+
+from .fake_bw import FakeBW
+from .test_resolve import FOLDER, _id, make_fake
+
+TEMPLATE = """\
+upstream db {{ server {{ bw:infra/db/postgres#uri }}; }}
+DB_USER={{bw:infra/db/postgres#username}}
+DB_PASSWORD={{ bw: infra/db/postgres }}
+API_KEY={{ bw:infra/db/postgres#api key }}
+TLS={{ bw:tls key }}
+CARD={{ bw:%s#number }}
+JINJA={{ not_bw }}
+""" % _id(4)
+
+RENDERED = """\
+upstream db {{ server https://db.example.com; }}
+DB_USER=admin
+DB_PASSWORD=s3cret
+API_KEY=k-123
+TLS=-----BEGIN KEY-----
+CARD=4111
+JINJA={{ not_bw }}
+"""
+
+
+@pytest.fixture
+def fake():
+    return make_fake()
+
+
+class _Pipe(io.StringIO):
+    def seekable(self):
+        return False
+
+
+def _merged(chunks: list[str]):
+    merged: list[tuple[bool, str]] = []
+    for is_ref, part in tokenize(chunks):
+        if merged and not is_ref and not merged[-1][0]:
+            merged[-1] = (False, merged[-1][1] + part)
+        else:
+            merged.append((is_ref, part))
+    return merged
+
+
+def test_tokenize_chunk_boundaries():
+    text = TEMPLATE * 3
+    expected = _merged([text])
+    for size in (1, 2, 3, 7, 64):
+        assert _merged([text[x : x + size] for x in range(0, len(text), size)]) == expected
+    assert "".join(x for is_ref, x in expected if not is_ref).count("{{") == 6
+    assert [x for is_ref, x in expected if is_ref][:3] == [
+        "infra/db/postgres#uri",
+        "infra/db/postgres#username",
+        "infra/db/postgres",
+    ]
+
+
+def test_render_file(fake: FakeBW, tmp_path: Path):
+    src = tmp_path / "app.conf.tmpl"
+    dst = tmp_path / "app.conf"
+    src.write_text(TEMPLATE * 200)
+
+    report = Renderer(fake.client(), chunk_size=97).render(src, dst)
+    assert dst.read_text() == RENDERED * 200
+    assert report.placeholders == 1200 and report.refs == 6
+    assert report.calls == 2 and fake.requests["GET /list/object"] == 2
+    assert report.written == len(RENDERED) * 200
+    assert dst.stat().st_mode & 0o777 == 0o600
+
+    dst.chmod(0o640)
+    Renderer(fake.client()).render(src, dst)
+    assert dst.stat().st_mode & 0o777 == 0o640
+    assert sorted(x.name for x in tmp_path.iterdir()) == [dst.name, src.name]
+
+
+def test_render_stream(fake: FakeBW):
+    out = io.StringIO()
+    report = fake.client().render_template(_Pipe(TEMPLATE), out)
+    assert out.getvalue() == RENDERED and report.refs == 6
+
+
+def test_render_errors(fake: FakeBW, tmp_path: Path):
+    src = tmp_path / "broken.tmpl"
+    dst = tmp_path / "broken"
+    src.write_text("A={{ bw:missing }}\nB={{ bw:tls key }}\n")
+
+    with pytest.raises(Exception, match="missing: item not found"):
+        Renderer(fake.client()).render(src, dst)
+    assert not dst.exists() and list(tmp_path.iterdir()) == [src]
+
+    report = Renderer(fake.client(), strict=False).render(src, dst)
+    assert dst.read_text() == "A={{ bw:missing }}\nB=-----BEGIN KEY-----\n"
+    assert list(report.errors) == ["missing"]
+
+
+def test_async_render(fake: FakeBW):
+    renderer = AsyncRenderer(fake.async_client())
+    text = asyncio.run(renderer.render_string(f"{{{{ bw:{_id(1)}#region }}}}/{FOLDER}"))
+    assert text == f"eu/{FOLDER}"
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from bw_sdk import AsyncResolver, Resolver, SecretRef
+
+from .fake_bw import FakeBW
+from .test_snapshot import item_data
+from .vault import Vault
+
+FOLDER = "5d1a4b2e-0000-4000-8000-000000000003"
+OTHER = "5d1a4b2e-0000-4000-8000-000000000004"
+
+FIELDS = [
+    {"name": "api key", "value": "k-123", "type": 1, "linkedId": None},
+    {"name": "region", "value": "eu", "type": 0, "linkedId": None},
+    {"name": "enabled", "value": "true", "type": 2, "linkedId": None},
+    {"name": "login alias", "value": None, "type": 3, "linkedId": 100},
+    {"name": "username", "value": "shadowed", "type": 0, "linkedId": None},
+]
+
+
+def _id(idx: int):
+    return f"00000000-0000-4000-8000-{idx:012d}"
+
+
+def make_fake():
+    login = {"uris": [{"match": None, "uri": "https://db.example.com"}], "username": "admin", "password": "s3cret"}
+    card = {"cardholderName": "A", "brand": "Visa", "number": "4111", "expMonth": "1", "expYear": "2030", "code": "1"}
+    items = [
+        item_data(1, 1, "postgres", folderId=FOLDER, login=login, fields=FIELDS),
+        item_data(2, 1, "postgres", folderId=OTHER, login={**login, "password": "other"}),
+        item_data(3, 2, "tls key", notes="-----BEGIN KEY-----"),
+        item_data(4, 3, "corp card", card=card),
+        item_data(5, 1, "empty", login={"uris": [], "username": None, "password": None}),
+    ]
+    folders = [{"object": "folder", "id": FOLDER, "name": "infra/db"}, {"object": "folder", "id": OTHER, "name": "dev"}]
+    return FakeBW(Vault(items, folders, [], []))
+
+
+@pytest.fixture
+def fake():
+    return make_fake()
+
+
+def test_parse():
+    assert SecretRef.parse("infra/db/postgres#api key") == SecretRef("postgres", "api key", "infra/db")
+    assert SecretRef.parse(_id(1)).by_id
+    assert not SecretRef.parse(f"dev/{_id(1)}").by_id
+    assert str(SecretRef("postgres", "password", "infra/db")) == "infra/db/postgres#password"
+    with pytest.raises(Exception, match="invalid secret reference"):
+        SecretRef.parse("postgres#")
+
+    assert SecretRef.parse(r"Account \#2") == SecretRef("Account #2")
+    assert SecretRef.parse(r"AWS\/prod#key") == SecretRef("AWS/prod", "key")
+    assert SecretRef.parse(r"infra/db/a\\b#x/y") == SecretRef("a\\b", "x/y", "infra/db")
+    for ref in ["Account #2", "a#b#c", "dev/ postgres", "dev /postgres"]:
+        with pytest.raises(Exception, match="ambiguous secret reference"):
+            SecretRef.parse(ref)
+    for ref in ["a//b", "/b", "trailing\\"]:
+        with pytest.raises(Exception, match="invalid secret reference"):
+            SecretRef.parse(ref)
+    for ref in [SecretRef("AWS/prod", "x#y"), SecretRef("Account #2 ", None, "a#b"), SecretRef(" x\\")]:
+        assert SecretRef.parse(str(ref)) == ref
+
+
+def test_resolve(fake: FakeBW):
+    resolver = Resolver(fake.client())
+    refs = [
+        "infra/db/postgres",
+        "infra/db/postgres#api key",
+        "infra/db/postgres#region",
+        "infra/db/postgres#enabled",
+        "infra/db/postgres#login alias",
+        "infra/db/postgres#uri",
+        "infra/db/postgres#username",
+        "infra/db/postgres#fields.username",
+        "dev/postgres#password",
+        "tls key",
+        f"{_id(4)}#code",
+        "corp card",
+        "postgres",
+        "missing",
+        "nowhere/postgres",
+        "infra/db/postgres#nope",
+        "empty#password",
+        "#",
+    ]
+    res = resolver.resolve(refs)
+    values = {key: value.get_secret_value() for key, value in res.values.items()}
+    assert values == {
+        "infra/db/postgres": "s3cret",
+        "infra/db/postgres#api key": "k-123",
+        "infra/db/postgres#region": "eu",
+        "infra/db/postgres#enabled": "true",
+        "infra/db/postgres#login alias": "admin",
+        "infra/db/postgres#uri": "https://db.example.com",
+        "infra/db/postgres#username": "admin",
+        "infra/db/postgres#fields.username": "shadowed",
+        "dev/postgres#password": "other",
+        "tls key": "-----BEGIN KEY-----",
+        f"{_id(4)}#code": "1",
+        "corp card": "4111",
+    }
+    assert res.errors["postgres"].startswith("ambiguous reference")
+    assert res.errors["missing"] == "item not found"
+    assert res.errors["nowhere/postgres"] == "folder [nowhere] not found"
+    assert "field [nope] not found" in res.errors["infra/db/postgres#nope"]
+    assert "is empty" in res.errors["empty#password"]
+    assert "invalid secret reference" in res.errors["#"]
+
+    assert res.calls == 2
+    assert fake.requests["GET /list/object"] == 2 and fake.requests["GET /object/item"] == 0
+    assert resolver.index.builds == 5
+
+    resolver.resolve(["infra/db/postgres#region"])
+    assert resolver.index.builds == 5
+
+    with pytest.raises(Exception, match="unresolved secret references"):
+        res.unwrap()
+
+
+def test_resolve_by_id(fake: FakeBW):
+    client = fake.client()
+    secrets = client.resolve_secrets([f"{_id(1)}#api key", _id(3), _id(1)])
+    assert secrets[_id(1)].get_secret_value() == "s3cret"
+    assert fake.requests["GET /object/item"] == 2 and fake.requests["GET /list/object"] == 0
+
+    res = Resolver(client).resolve([_id(99)])
+    assert "Not found" in res.errors[_id(99)]
+
+    ids = [_id(x) for x in range(1, 6)]
+    assert Resolver(client, id_threshold=4).resolve(ids).calls == 1
+
+
+def test_async_resolve(fake: FakeBW):
+    res = asyncio.run(AsyncResolver(fake.async_client()).resolve(["infra/db/postgres#api key", _id(3)]))
+    assert res.ok and res.calls == 2
+    assert res.values["infra/db/postgres#api key"].get_secret_value() == "k-123"
@@ -0,0 +1,60 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from bw_sdk import DBStatus, SecretStr, ServeManager
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STUB = [sys.executable, "-m", "tests.stub_bw"]
+ENV = {"PYTHONPATH": os.pathsep.join([str(ROOT), str(ROOT / "src"), os.environ.get("PYTHONPATH", "")])}
+
+
+def test_serve_manager(tmp_path: Path):
+    manager = ServeManager(STUB, SecretStr("hunter2"), size=2, standby=1, appdata_root=tmp_path, env=ENV)
+    with manager:
+        assert len(manager.active) == 2 and len(manager.standby) == 1
+        assert len({x.port for x in manager.active + manager.standby}) == 3
+        assert len(list(tmp_path.glob("*/stub.pid"))) == 3
+
+        client = manager.client()
+        assert client.get_status().status == DBStatus.Unlocked
+        assert len(client.get_items()) == 20
+
+        standby = manager.standby[0]
+        crashed = manager.active[0]
+        crashed.proc.kill()
+        crashed.proc.wait()
+
+        assert manager.check() == 1
+        assert manager.restarts == 1
+        assert standby in manager.active and crashed not in manager.active
+        manager.wait_standby()
+        assert all(x.alive for x in manager.active + manager.standby)
+        assert manager.client().get_status().status == DBStatus.Unlocked
+
+        procs = manager.active + manager.standby
+    assert not any(x.alive for x in procs)
+    assert manager.active == [] and manager.standby == []
+
+
+def test_serve_manager_startup_failure(tmp_path: Path):
+    manager = ServeManager([sys.executable, "-c", "raise SystemExit(3)"], standby=0, appdata_root=tmp_path)
+    with pytest.raises(Exception, match="exited during startup"):
+        manager.start()
+
+
+def test_serve_manager_refill_failure(tmp_path: Path):
+    manager = ServeManager(STUB, SecretStr("hunter2"), size=1, standby=1, appdata_root=tmp_path, env=ENV)
+    with manager:
+        manager.command = [sys.executable, "-c", "raise SystemExit(3)"]
+        crashed = manager.active[0]
+        crashed.proc.kill()
+        crashed.proc.wait()
+
+        assert manager.check() == 1
+        with pytest.raises(Exception, match="exited during startup"):
+            manager.wait_standby()
+        assert manager.standby == [] and len(manager.active) == 1
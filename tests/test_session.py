@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from bw_sdk import AsyncSessionManager, SecretStr, SessionManager
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+
+@pytest.fixture
+def fake():
+    return FakeBW(generate_vault(10, seed=1), locked=True)
+
+
+def _wait_for(cond, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not cond():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_shared_session(fake: FakeBW):
+    manager = SessionManager(fake.client(), SecretStr("hunter2"), idle_timeout=0.1)
+
+    with manager.session() as outer:
+        with manager.session() as inner:
+            assert inner is outer
+            assert len(inner.get_items()) == 10
+    for _ in range(5):
+        with manager.session() as client:
+            client.get_folders()
+
+    assert manager.unlocks == 1 and fake.requests["POST /unlock"] == 1
+    assert manager.syncs == 0 and fake.requests["POST /sync"] == 0
+    assert not fake.locked
+
+    _wait_for(lambda: fake.locked)
+    assert fake.requests["POST /lock"] == 1
+
+    with manager.session():
+        assert manager.unlocks == 2
+    manager.close()
+    assert fake.locked and fake.requests["POST /lock"] == 2
+
+
+def test_concurrent_sessions(fake: FakeBW):
+    manager = SessionManager(fake.client(), SecretStr("hunter2"), idle_timeout=60)
+
+    def work():
+        for _ in range(10):
+            with manager.session() as client:
+                client.get_status()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fake.requests["POST /unlock"] == 1 and manager.refs == 0
+    manager.close()
+    assert fake.locked
+
+
+def test_staleness(fake: FakeBW):
+    clock = [datetime.now(timezone.utc)]
+    manager = SessionManager(
+        fake.client(), SecretStr("hunter2"), idle_timeout=0, max_staleness=60, now=lambda: clock[0]
+    )
+
+    with manager.session():
+        pass
+    assert fake.requests["POST /sync"] == 0 and fake.locked
+
+    fake.locked = False
+    clock[0] += timedelta(seconds=120)
+    with manager.session():
+        assert fake.requests["POST /sync"] == 1
+    assert manager.syncs == 1
+    assert not fake.locked
+
+    with pytest.raises(Exception, match="released more often"):
+        manager.release()
+
+
+def test_async_session(fake: FakeBW):
+    manager = AsyncSessionManager(fake.async_client(), SecretStr("hunter2"), idle_timeout=0.05)
+
+    async def run():
+        async def use():
+            async with manager.session() as client:
+                await client.get_items()
+
+        await asyncio.gather(*(use() for _ in range(5)))
+        assert not fake.locked
+        await asyncio.sleep(0.2)
+
+    asyncio.run(run())
+    assert fake.locked
+    assert fake.requests["POST /unlock"] == 1 and fake.requests["POST /lock"] == 1
@@ -0,0 +1,181 @@
+import json
+
+import httpx
+import pydantic
+import pytest
+
+import bw_sdk.model as _m
+from bw_sdk import Client, VaultSnapshot
+from bw_sdk.matcher import UriMatcher
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+ItemAdapter = pydantic.TypeAdapter(_m.Item)
+
+ORG = "5d1a4b2e-0000-4000-8000-000000000001"
+COLL = "5d1a4b2e-0000-4000-8000-000000000002"
+FOLDER = "5d1a4b2e-0000-4000-8000-000000000003"
+
+
+def item_data(idx: int, typ: int, name: str, **extra):
+    data = {
+        "object": "item",
+        "id": f"00000000-0000-4000-8000-{idx:012d}",
+        "organizationId": None,
+        "folderId": None,
+        "type": typ,
+        "reprompt": 0,
+        "name": name,
+        "notes": None,
+        "favorite": False,
+        "collectionIds": [],
+        "revisionDate": "2023-11-01T10:00:00.000Z",
+        "creationDate": "2023-11-01T10:00:00.000Z",
+        "deletedDate": None,
+        "passwordHistory": None,
+    }
+    match typ:
+        case 1:
+            data["login"] = {"uris": [], "username": None, "password": None}
+        case 2:
+            data["secureNote"] = {"type": 0}
+    data.update(extra)
+    return data
+
+
+def make_item(idx: int, typ: int, name: str, **extra):
+    return ItemAdapter.validate_python(item_data(idx, typ, name, **extra))
+
+
+@pytest.fixture
+def snapshot():
+    items = [
+        make_item(
+            1,
+            1,
+            "github",
+            login={"uris": [{"match": None, "uri": "https://github.com/login"}], "username": "octo", "password": "pw"},
+        ),
+        make_item(2, 1, "gitlab", folderId=FOLDER, login={"uris": [], "username": "tanuki", "password": "pw"}),
+        make_item(3, 2, "github", organizationId=ORG, collectionIds=[COLL], secureNote={"type": 0}),
+        make_item(4, 2, "deleted", deletedDate="2023-11-02T10:00:00.000Z"),
+    ]
+    folders = [_m.Folder(id=FOLDER, name="work")]
+    return VaultSnapshot.build(items, folders)
+
+
+def test_exact_and_search(snapshot: VaultSnapshot):
+    assert {x.id for x in snapshot.get_items("github", exact=True)} == {
+        "00000000-0000-4000-8000-000000000001",
+        "00000000-0000-4000-8000-000000000003",
+    }
+    assert len(snapshot.get_items("git")) == 3
+    assert snapshot.find_item_login("github", None, None, None, None, False, True).login.username == "octo"
+    assert snapshot.get_item_logins("tanuki")[0].name == "gitlab"
+    with pytest.raises(Exception, match="multiple items matches"):
+        snapshot.find_item("github", exact=True)
+
+
+def test_indexes(snapshot: VaultSnapshot):
+    assert [x.name for x in snapshot.get_items(folder_id=FOLDER)] == ["gitlab"]
+    assert [x.name for x in snapshot.get_item_securenotes(org_id=ORG, coll_id=COLL)] == ["github"]
+    assert [x.name for x in snapshot.get_items(url="https://github.com/explore")] == ["github"]
+    assert [x.name for x in snapshot.get_items(trash=True)] == ["deleted"]
+    assert snapshot.find_folder("work", exact=True).id == FOLDER
+
+
+def test_url_match_strategies():
+    pytest.importorskip("tldextract")
+    items = [
+        make_item(1, 1, "base", login={"uris": [{"match": None, "uri": "https://accounts.example.co.uk/login"}]}),
+        make_item(2, 1, "host", login={"uris": [{"match": 1, "uri": "https://accounts.example.co.uk"}]}),
+        make_item(3, 1, "never", login={"uris": [{"match": 5, "uri": "https://mail.example.co.uk"}]}),
+        make_item(4, 1, "regex", login={"uris": [{"match": 3, "uri": r"^https://[a-z]+\.example\.co\.uk/"}]}),
+    ]
+    snapshot = VaultSnapshot.build(items, [])
+    matcher = UriMatcher(items)
+    for url in ["https://mail.example.co.uk/inbox", "https://accounts.example.co.uk/x", "https://other.co.uk/"]:
+        assert [x.id for x in snapshot.get_items(url=url)] == matcher.match_ids(url)
+    assert [x.name for x in snapshot.get_items(url="https://mail.example.co.uk/inbox")] == ["base", "regex"]
+    assert [x.name for x in snapshot.get_items(url="https://accounts.example.co.uk/x")] == ["base", "host", "regex"]
+
+    trashed = make_item(5, 1, "trashed", deletedDate="2023-11-02T10:00:00.000Z", login={"uris": items[0].login.uris})
+    snapshot.upsert_item(trashed)
+    assert [x.name for x in snapshot.get_items(url="https://www.example.co.uk", trash=True)] == ["trashed"]
+
+
+def test_upsert_and_remove(snapshot: VaultSnapshot):
+    renamed = make_item(2, 1, "gitea", login={"uris": [], "username": "tea", "password": "pw"})
+    snapshot.upsert_item(renamed)
+    assert snapshot.get_items("gitlab", exact=True) == []
+    assert snapshot.get_items(folder_id=FOLDER) == []
+    assert snapshot.find_item("gitea", exact=True) is renamed
+
+    snapshot.remove_item(renamed.id)
+    assert snapshot.get_items("gitea", exact=True) == []
+    with pytest.raises(Exception):
+        snapshot.get_item(renamed.id)
+
+
+def test_refresh():
+    records = [item_data(idx, 2, f"note {idx}") for idx in range(10)]
+    status = {
+        "serverUrl": None,
+        "lastSync": "2023-11-01T10:00:00.000Z",
+        "userEmail": "user@example.com",
+        "userId": "6c2cf2d1-1b3e-4d0e-a7a4-b0a5012a1b2c",
+        "status": "unlocked",
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        match request.url.path:
+            case "/status":
+                data = {"object": "template", "template": status}
+            case "/list/object/items":
+                trash = request.url.params.get("trash") == "true"
+                data = {"object": "list", "data": [x for x in records if (x["deletedDate"] is not None) == trash]}
+            case _:
+                data = {"object": "list", "data": []}
+        return httpx.Response(200, content=json.dumps({"success": True, "data": data}))
+
+    client = Client(http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)))
+    snapshot = VaultSnapshot.from_client(client)
+    assert len(snapshot) == 10
+
+    unchanged = snapshot.refresh(client)
+    assert not unchanged and unchanged.validated == 0 and unchanged.scanned == 10
+
+    records[3] = item_data(3, 2, "renamed", revisionDate="2023-11-02T10:00:00.000Z")
+    del records[5]
+    records.append(item_data(42, 2, "new"))
+    status["lastSync"] = "2023-11-02T10:00:00.000Z"
+
+    report = snapshot.refresh(client)
+    assert report.added == ["00000000-0000-4000-8000-000000000042"]
+    assert report.changed == ["00000000-0000-4000-8000-000000000003"]
+    assert report.deleted == ["00000000-0000-4000-8000-000000000005"]
+    assert report.scanned == 10
+    assert report.validated == 2
+    assert snapshot.find_item("renamed", exact=True).id == "00000000-0000-4000-8000-000000000003"
+    assert snapshot.last_sync is not None and snapshot.last_sync.day == 2
+
+    records[0] = item_data(0, 2, "edited locally", revisionDate="2023-11-03T10:00:00.000Z")
+    assert snapshot.refresh(client).changed == ["00000000-0000-4000-8000-000000000000"]
+    assert snapshot.find_item("edited locally", exact=True).id == "00000000-0000-4000-8000-000000000000"
+
+
+def test_client_snapshot_includes_trash():
+    fake = FakeBW(generate_vault(20, seed=3))
+    client = fake.client()
+    trashed, second = list(fake.items)[:2]
+    client.del_item(trashed)
+
+    snapshot = VaultSnapshot.from_client(client)
+    assert len(snapshot) == 20
+    assert [x.id for x in snapshot.get_items(trash=True)] == [trashed]
+
+    client.del_item(second)
+    report = snapshot.refresh(client)
+    assert report.changed == [second] and report.deleted == []
+    assert {x.id for x in snapshot.get_items(trash=True)} == {trashed, second}
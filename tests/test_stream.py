@@ -0,0 +1,70 @@
+import json
+
+import httpx
+import pytest
+
+from bw_sdk import Client
+from bw_sdk._stream import ListScanner
+
+
+def folder(idx: int, name: str):
+    return {"object": "folder", "id": f"00000000-0000-4000-8000-{idx:012d}", "name": name}
+
+
+TRICKY = ["plain", "brace { and ] bracket", 'quote " and \\ backslash', "unicode æøå", '{["]}']
+
+
+def list_body(objs: list[dict]):
+    return json.dumps({"success": True, "data": {"object": "list", "data": objs}}).encode()
+
+
+def test_scanner_byte_by_byte():
+    objs = [folder(idx, name) for idx, name in enumerate(TRICKY)]
+    body = list_body(objs)
+
+    scanner = ListScanner()
+    out: list[bytes] = []
+    for idx in range(len(body)):
+        out.extend(scanner.feed(body[idx : idx + 1]))
+
+    assert scanner.found
+    assert [json.loads(raw) for raw in out] == objs
+
+
+def test_scanner_buffer_stays_small():
+    body = list_body([folder(idx, f"folder {idx}") for idx in range(5000)])
+
+    scanner = ListScanner()
+    count = 0
+    largest = 0
+    for idx in range(0, len(body), 4096):
+        count += len(scanner.feed(body[idx : idx + 4096]))
+        largest = max(largest, len(scanner.buf))
+
+    assert count == 5000
+    assert largest < 2 * 4096
+
+
+def chunked(body: bytes, size: int = 7):
+    for idx in range(0, len(body), size):
+        yield body[idx : idx + size]
+
+
+def test_client_iter_folders():
+    objs = [folder(idx, name) for idx, name in enumerate(TRICKY)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=chunked(list_body(objs)))
+
+    client = Client(http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)))
+    assert [x.name for x in client.iter_folders()] == TRICKY
+    assert [x.name for x in client.iter_folders("plain", exact=True)] == ["plain"]
+
+
+def test_client_iter_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, content=json.dumps({"success": False, "message": "Vault is locked."}))
+
+    client = Client(http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)))
+    with pytest.raises(Exception, match="Vault is locked"):
+        list(client.iter_items())
@@ -0,0 +1,61 @@
+import json
+import time
+import tracemalloc
+
+import httpx
+
+import bw_sdk.model as _m
+from bw_sdk import Client
+
+from .vault import generate_items
+
+
+def make_client(items: list[dict]):
+    body = json.dumps({"success": True, "data": {"object": "list", "data": items}}).encode()
+    by_id = {x["id"]: x for x in items}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/object/item/"):
+            data = by_id[request.url.path.rsplit("/", 1)[1]]
+            return httpx.Response(200, content=json.dumps({"success": True, "data": data}))
+        return httpx.Response(200, content=body)
+
+    return Client(http_client=httpx.Client(base_url="http://bw", transport=httpx.MockTransport(handler)))
+
+
+def test_summaries():
+    items = generate_items(50, seed=3)
+    client = make_client(items)
+
+    summaries = client.get_item_summaries()
+    assert [(x.id, x.name, x.type) for x in summaries] == [(x["id"], x["name"], x["type"]) for x in items]
+    assert [x.id for x in client.iter_item_summaries()] == [x.id for x in summaries]
+
+    login = next(x for x in summaries if x.type == _m.ItemType.Login)
+    assert client.get_item_login(login).id == login.id
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.process_time()
+    res = fn()
+    elapsed = time.process_time() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return res, elapsed, retained
+
+
+def test_summaries_benchmark():
+    items = generate_items(2000, seed=4)
+    client = make_client(items)
+
+    full, full_time, full_mem = measure(client.get_items)
+    summaries, summary_time, summary_mem = measure(client.get_item_summaries)
+    assert len(full) == len(summaries)
+
+    print(
+        f"{len(items)} items: full {full_time * 1000:.1f}ms {full_mem / 1024:.0f}KiB,"
+        f" summaries {summary_time * 1000:.1f}ms {summary_mem / 1024:.0f}KiB"
+    )
+    assert summary_time < full_time
+    assert summary_mem < full_mem / 2
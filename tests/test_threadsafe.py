@@ -0,0 +1,142 @@
+import threading
+import time
+
+import pytest
+
+from bw_sdk import Client, SecretStr, SingleFlight
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+READERS = 8
+ROUNDS = 25
+
+
+@pytest.mark.parametrize("flight", [False, True])
+def test_state_transitions_are_exclusive(flight: bool):
+    fake = FakeBW(generate_vault(50, seed=17), service_time=0.0005)
+    client = fake.client(single_flight=SingleFlight() if flight else None)
+    ids = list(fake.items)[:10]
+    errors: list[Exception] = []
+    done = threading.Event()
+
+    def reader(idx: int):
+        try:
+            while not done.is_set():
+                assert len(client.get_items()) == 50
+                assert client.get_item(ids[idx % len(ids)]).id == ids[idx % len(ids)]
+                assert len(list(client.iter_folders())) == len(fake.folders)
+        except Exception as exc:
+            errors.append(exc)
+
+    def writer():
+        try:
+            for _ in range(ROUNDS):
+                with client.exclusive():
+                    client.lock()
+                    assert fake.locked
+                    client.unlock(SecretStr("hunter2"))
+                    assert client.get_item(ids[0]).id == ids[0]
+                client.sync()
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            done.set()
+
+    threads = [threading.Thread(target=reader, args=(x,)) for x in range(READERS)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(60)
+
+    assert not any(x.is_alive() for x in threads)
+    assert errors == []
+    assert fake.requests["POST /lock"] == ROUNDS and fake.requests["POST /sync"] == ROUNDS
+    assert fake.requests["GET /list/object"] > READERS
+    assert client.state_lock.readers == 0 and not client.state_lock.writing
+
+
+def _run(target, timeout: float = 10.0):
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive()
+
+
+def _wait_for(cond, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not cond():
+        if time.monotonic() > deadline:
+            raise TimeoutError
+        time.sleep(0.001)
+
+
+def test_iterator_closed_on_other_thread():
+    fake = FakeBW(generate_vault(5, seed=2))
+    client = fake.client()
+
+    items = client.iter_items()
+    next(items)
+    client.sync()
+    _run(items.close)
+    assert client.state_lock.readers == 0
+    _run(client.sync)
+    assert fake.requests["POST /sync"] == 2
+
+
+def test_nested_fetch_while_syncing():
+    fake = FakeBW(generate_vault(5, seed=2))
+    client = fake.client()
+    lock = client.state_lock
+    seen: list[int] = []
+
+    def consume():
+        for item in client.iter_items():
+            syncer = threading.Thread(target=client.sync, daemon=True)
+            syncer.start()
+            _wait_for(lambda: lock._waiting_writers or lock.writing or not syncer.is_alive())
+            seen.append(len(client.get_items_by_id(list(fake.items), max_concurrency=4)))
+            syncer.join(10)
+
+    _run(consume)
+    assert seen == [5] * 5 and fake.requests["POST /sync"] == 5
+    assert lock.readers == 0 and not lock.writing
+
+
+def test_single_flight_inside_exclusive():
+    fake = FakeBW(generate_vault(5, seed=2))
+    client = fake.client(single_flight=SingleFlight())
+    item_id = next(iter(fake.items))
+    fetched: list[str] = []
+
+    def writer():
+        with client.exclusive():
+            reader = threading.Thread(target=lambda: fetched.append(client.get_item(item_id).id), daemon=True)
+            reader.start()
+            time.sleep(0.05)
+            fetched.append(client.get_item(item_id).id)
+        reader.join(10)
+
+    _run(writer)
+    assert fetched == [item_id, item_id]
+    assert client.state_lock.readers == 0 and not client.state_lock.writing
+
+
+def test_rwlock_reentrancy():
+    client = Client()
+    lock = client.state_lock
+
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                assert lock.writing and lock.readers == 1
+        assert lock.writing
+    assert not lock.writing
+
+    with lock.read():
+        with lock.read():
+            assert lock.readers == 2
+        with pytest.raises(Exception, match="cannot change vault state"):
+            lock.acquire_write()
+    assert lock.readers == 0
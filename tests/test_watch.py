@@ -0,0 +1,124 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+import bw_sdk.model as _m
+from bw_sdk import AsyncWatcher, Watcher
+
+from .fake_bw import FakeBW
+from .vault import generate_vault
+
+
+def test_poll_diffs():
+    fake = FakeBW(generate_vault(20, seed=3))
+    client = fake.client()
+    watcher = Watcher(client, interval=1, max_interval=8)
+
+    assert watcher.poll() == []
+    assert watcher.validated == 0 and fake.requests["POST /sync"] == 1
+
+    assert watcher.poll() == [] and watcher.interval == 2
+    assert watcher.poll() == [] and watcher.interval == 4
+
+    ids = list(fake.items)
+    fake.items[ids[0]] = {**fake.items[ids[0]], "name": "renamed"}
+    client.del_item(ids[1])
+    folder = client.post_folder(_m.NewFolder(name="new folder"))
+    fake.items[ids[2]] = {**fake.items[ids[2]], "collectionIds": ["5d1a4b2e-0000-4000-8000-000000000002"]}
+
+    events = watcher.poll()
+    assert [(x.kind, x.obj_type, x.id) for x in events] == [
+        ("added", "folder", folder.id),
+        ("modified", "item", ids[0]),
+        ("modified", "item", ids[2]),
+        ("deleted", "item", ids[1]),
+    ]
+    assert events[1].obj is not None and events[1].obj.name == "renamed"
+    assert events[3].obj is not None and events[3].obj.id == ids[1]
+    assert watcher.validated == 4 and watcher.interval == 1
+
+    client.restore_item(ids[1])
+    events = watcher.poll()
+    assert [(x.kind, x.id) for x in events] == [("added", ids[1])]
+
+
+def test_initial_and_kinds():
+    fake = FakeBW(generate_vault(5, seed=3))
+    watcher = Watcher(fake.client(), kinds=["item"], sync=False, initial=True)
+
+    events = watcher.poll()
+    assert {x.kind for x in events} == {"added"} and len(events) == 5
+    assert {x.obj_type for x in events} == {"item"}
+    assert fake.requests["POST /sync"] == 0 and fake.requests["GET /list/object"] == 1
+
+
+def test_watch_generator():
+    fake = FakeBW(generate_vault(5, seed=3))
+    client = fake.client()
+    watcher = Watcher(client, interval=0.01, max_interval=0.02, kinds=["folder"], sync=False)
+    watcher.poll()
+    client.post_folder(_m.NewFolder(name="first"))
+
+    stop = threading.Event()
+    names = []
+    for event in watcher.watch(stop):
+        assert event.obj is not None
+        names.append(event.obj.name)
+        if len(names) == 1:
+            client.post_folder(_m.NewFolder(name="second"))
+        else:
+            stop.set()
+    assert names == ["first", "second"]
+    assert list(client.watch(stop)) == []
+
+
+def test_async_watch():
+    fake = FakeBW(generate_vault(10, seed=4))
+    client = fake.async_client()
+
+    async def run():
+        watcher = AsyncWatcher(client, interval=0.01, max_interval=0.02)
+        assert await watcher.poll() == []
+        victim = next(iter(fake.items))
+        await client.del_item(victim)
+
+        stop = asyncio.Event()
+        events = []
+        async for event in watcher.watch(stop):
+            events.append(event)
+            stop.set()
+        return victim, events
+
+    victim, events = asyncio.run(run())
+    assert [(x.kind, x.id) for x in events] == [("deleted", victim)]
+    assert events[0].obj is not None and events[0].obj.id == victim
+
+
+def test_watch_survives_errors(monkeypatch: pytest.MonkeyPatch):
+    fake = FakeBW(generate_vault(5, seed=3))
+    handle = fake.handle
+    failures = [0]
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/list/object/folders" and failures[0]:
+            failures[0] -= 1
+            raise httpx.ConnectError("connection refused", request=request)
+        return handle(request)
+
+    monkeypatch.setattr(fake, "handle", flaky)
+    client = fake.client()
+    watcher = Watcher(client, interval=0.01, max_interval=0.04, kinds=["folder"], sync=False)
+    watcher.poll()
+    failures[0] = 2
+    client.post_folder(_m.NewFolder(name="added"))
+
+    stop = threading.Event()
+    events = []
+    for event in watcher.watch(stop):
+        events.append(event)
+        stop.set()
+    assert [(x.kind, x.obj.name if x.obj else None) for x in events] == [("added", "added")]
+    assert watcher.errors == 2 and isinstance(watcher.last_error, httpx.ConnectError)
+    assert watcher.interval == 0.01
@@ -0,0 +1,157 @@
+import dataclasses
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+EPOCH = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+HOSTS = ["example.com", "github.com", "gitlab.com", "mail.example.org", "intranet.corp.local", "bank.co.uk"]
+
+
+def _uuid(rng: random.Random):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _date(rng: random.Random):
+    stamp = EPOCH + timedelta(seconds=rng.randrange(365 * 24 * 3600))
+    return stamp.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def _word(rng: random.Random, size: int = 8):
+    return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(size))
+
+
+def _fields(rng: random.Random):
+    fields: list[dict[str, Any]] = []
+    for _ in range(rng.randrange(4)):
+        match rng.randrange(3):
+            case 0:
+                fields.append({"name": _word(rng), "value": _word(rng, 16), "type": 0, "linkedId": None})
+            case 1:
+                fields.append({"name": _word(rng), "value": _word(rng, 24), "type": 1, "linkedId": None})
+            case _:
+                fields.append({"name": _word(rng), "value": rng.choice(["true", "false"]), "type": 2, "linkedId": None})
+    return fields
+
+
+def _history(rng: random.Random):
+    if rng.random() < 0.5:
+        return None
+    return [{"lastUsedDate": _date(rng), "password": _word(rng, 20)} for _ in range(rng.randrange(1, 5))]
+
+
+def make_item(
+    rng: random.Random,
+    typ: int,
+    org_id: str | None = None,
+    coll_ids: list[str] | None = None,
+    folder_id: str | None = None,
+):
+    created = _date(rng)
+    item: dict[str, Any] = {
+        "passwordHistory": _history(rng),
+        "revisionDate": created,
+        "creationDate": created,
+        "deletedDate": None,
+        "object": "item",
+        "id": _uuid(rng),
+        "organizationId": org_id,
+        "folderId": folder_id,
+        "type": typ,
+        "reprompt": 0,
+        "name": f"{_word(rng)} {_word(rng, 5)}",
+        "notes": _word(rng, 64) if rng.random() < 0.3 else None,
+        "favorite": rng.random() < 0.1,
+        "fields": _fields(rng),
+        "collectionIds": coll_ids or [],
+    }
+    match typ:
+        case 1:
+            host = rng.choice(HOSTS)
+            item["login"] = {
+                "uris": [{"match": None, "uri": f"https://{host}/{_word(rng, 4)}"}],
+                "username": f"{_word(rng, 6)}@{host}",
+                "password": _word(rng, 20),
+                "totp": None,
+                "passwordRevisionDate": None,
+            }
+        case 2:
+            item["secureNote"] = {"type": 0}
+        case 3:
+            item["card"] = {
+                "cardholderName": _word(rng),
+                "brand": "Visa",
+                "number": "".join(rng.choice("0123456789") for _ in range(16)),
+                "expMonth": str(rng.randrange(1, 13)),
+                "expYear": str(rng.randrange(2024, 2030)),
+                "code": "".join(rng.choice("0123456789") for _ in range(3)),
+            }
+        case _:
+            item["identity"] = {
+                key: _word(rng)
+                for key in [
+                    "title",
+                    "firstName",
+                    "middleName",
+                    "lastName",
+                    "address1",
+                    "address2",
+                    "address3",
+                    "city",
+                    "state",
+                    "postalCode",
+                    "country",
+                    "company",
+                    "email",
+                    "phone",
+                    "ssn",
+                    "username",
+                    "passportNumber",
+                    "licenseNumber",
+                ]
+            }
+    return item
+
+
+def generate_items(count: int, seed: int = 0, weights: tuple[int, int, int, int] = (6, 2, 1, 1)):
+    rng = random.Random(seed)
+    types = rng.choices([1, 2, 3, 4], weights=weights, k=count)
+    return [make_item(rng, typ) for typ in types]
+
+
+@dataclasses.dataclass
+class Vault:
+    items: list[dict[str, Any]]
+    folders: list[dict[str, Any]]
+    collections: list[dict[str, Any]]
+    organizations: list[dict[str, Any]]
+
+
+def generate_vault(count: int, seed: int = 0, weights: tuple[int, int, int, int] = (6, 2, 1, 1)):
+    rng = random.Random(seed)
+    folders = [{"object": "folder", "id": _uuid(rng), "name": f"folder {idx}"} for idx in range(max(1, count // 50))]
+    organizations = [
+        {"object": "organization", "id": _uuid(rng), "name": f"org {idx}", "status": 2, "type": 0, "enabled": True}
+        for idx in range(max(1, count // 5000))
+    ]
+    collections = [
+        {
+            "object": "collection",
+            "id": _uuid(rng),
+            "organizationId": rng.choice(organizations)["id"],
+            "name": f"collection {idx}",
+            "externalId": None,
+        }
+        for idx in range(max(1, count // 200))
+    ]
+
+    items = []
+    for typ in rng.choices([1, 2, 3, 4], weights=weights, k=count):
+        folder_id = rng.choice(folders)["id"] if rng.random() < 0.5 else None
+        if rng.random() < 0.3:
+            coll = rng.choice(collections)
+            items.append(make_item(rng, typ, coll["organizationId"], [coll["id"]], folder_id))
+        else:
+            items.append(make_item(rng, typ, None, None, folder_id))
+    return Vault(items, folders, collections, organizations)